@@ -5,7 +5,7 @@ import pandas as pd
 import plotly.graph_objects as go
 import plotly.express as px
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
 import json
 import os
 import yaml
@@ -33,11 +33,11 @@ st.markdown("""
 
 
 @st.cache_resource
-def get_db_session():
-    """Get database session"""
+def get_session_factory():
+    """Get database session factory"""
     config = get_config()
     engine, Session = init_database(config.database_url)
-    return Session()
+    return Session
 
 
 def load_runtime_config():
@@ -90,15 +90,15 @@ def save_trading_config(config_data):
         yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
 
 
-def load_data(session: Session, days: int = 7, trading_mode: str = 'paper'):
+def load_data(session_factory: sessionmaker, days: int = 7, trading_mode: str = 'paper'):
     """Load data from database filtered by trading mode"""
-    repo = ArbitrageRepository(session)
+    repo = ArbitrageRepository(session_factory)
 
     # Get recent opportunities for this mode
     opportunities = repo.get_recent_opportunities(limit=1000, trading_mode=trading_mode)
 
     # Get open positions for this mode
-    open_positions = repo.get_open_positions(trading_mode=trading_mode)
+    open_positions = list(repo.get_open_positions(trading_mode=trading_mode))
 
     # Get performance summary for this mode
     summary = repo.get_performance_summary(days=days, trading_mode=trading_mode)
@@ -357,8 +357,8 @@ def main():
     current_mode = 'paper' if runtime_config.get('paper_trading', True) else 'live'
 
     # Load data filtered by trading mode
-    session = get_db_session()
-    data = load_data(session, days=days_lookback, trading_mode=current_mode)
+    session_factory = get_session_factory()
+    data = load_data(session_factory, days=days_lookback, trading_mode=current_mode)
 
     # Top metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -14,6 +14,11 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger("main")
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # Optional - stock asyncio event loop is used instead
+
 
 def parse_args():
     """Parse command line arguments"""
@@ -258,6 +263,11 @@ def main():
         log_file="logs/arbitrage.log"
     )
 
+    if uvloop is not None:
+        # Faster task scheduling and socket I/O on the order path
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.debug("Using uvloop event loop")
+
     # Run async main
     try:
         exit_code = asyncio.run(main_async(args))
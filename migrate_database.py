@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """
-Database migration script to add trading_mode column
+Database migration script to add trading_mode column and bring existing
+tables in line with the current models (column types, indexes, new tables)
 Run this once to upgrade existing databases
 """
 
@@ -8,6 +9,28 @@ import sqlite3
 import sys
 from pathlib import Path
 
+from sqlalchemy import create_engine, inspect, make_url, text
+
+from src.database.models import OpportunityLog, PendingUnwind, TradeLog
+
+# Postgres column types the models expect: (table, column, type, USING expression).
+# Enum types are created from the models before the status columns are cast.
+_PG_COLUMN_TYPES = [
+    ('opportunities', 'status', 'opp_status', 'status::opp_status'),
+    ('trades', 'status', 'trade_status', 'status::trade_status'),
+    ('opportunities', 'metadata_json', 'bytea', "convert_to(metadata_json::text, 'UTF8')"),
+    ('trades', 'metadata_json', 'bytea', "convert_to(metadata_json::text, 'UTF8')"),
+    ('balance_snapshots', 'metadata_json', 'bytea', "convert_to(metadata_json::text, 'UTF8')"),
+    ('balance_snapshots', 'open_positions', 'smallint', None),
+    ('opportunities', 'trading_mode', 'character varying(10)', None),
+    ('trades', 'trading_mode', 'character varying(10)', None),
+    ('balance_snapshots', 'trading_mode', 'character varying(10)', None),
+    ('performance_metrics', 'period', 'character varying(10)', None),
+]
+
+# Tables whose metadata_json held JSON text before it became orjson bytes
+_METADATA_TABLES = ('opportunities', 'trades', 'balance_snapshots')
+
 
 def migrate_database(db_path: str = "data/arbitrage.db"):
     """
@@ -102,15 +125,115 @@ def migrate_database(db_path: str = "data/arbitrage.db"):
         return 1
 
 
+def _migrate_postgres_types(conn) -> None:
+    """
+    Create the status enum types and cast columns to the model types
+
+    Columns already of the expected type, or missing, are left alone, so the
+    step can be rerun safely.
+
+    Args:
+        conn: SQLAlchemy connection to a Postgres database
+    """
+    OpportunityLog.__table__.c.status.type.create(conn, checkfirst=True)
+    TradeLog.__table__.c.status.type.create(conn, checkfirst=True)
+
+    for table, column, column_type, using in _PG_COLUMN_TYPES:
+        current = conn.execute(text("""
+            SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+            WHERE attrelid = to_regclass(:table) AND attname = :column AND NOT attisdropped
+        """), {'table': table, 'column': column}).scalar()
+
+        if current is None or current == column_type:
+            continue
+
+        print(f"  - Changing {table}.{column} from {current} to {column_type}...")
+        conn.execute(text(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {column_type}"
+            + (f" USING {using}" if using else "")
+        ))
+
+
+def _migrate_sqlite_metadata(conn) -> None:
+    """
+    Store existing SQLite metadata_json text as bytes, like new rows
+
+    Args:
+        conn: SQLAlchemy connection to a SQLite database
+    """
+    for table in _METADATA_TABLES:
+        conn.execute(text(f"""
+            UPDATE {table} SET metadata_json = CAST(metadata_json AS BLOB)
+            WHERE typeof(metadata_json) = 'text'
+        """))
+
+
+def migrate_schema(database_url: str) -> int:
+    """
+    Bring an existing database in line with the current models
+
+    create_all() only creates missing tables, so column type changes, the
+    open-trades partial index and the pending_unwinds table are applied here.
+    On Postgres the status columns become enum types, metadata_json becomes
+    bytea and narrowed columns are resized. SQLite cannot alter column types
+    or add CHECK constraints in place; its declared types are not enforced, so
+    only the index, the new table and the metadata bytes are migrated there.
+
+    Args:
+        database_url: SQLAlchemy database URL
+
+    Returns:
+        Exit code (0 on success)
+    """
+    print(f"Migrating schema: {make_url(database_url).render_as_string(hide_password=True)}")
+
+    try:
+        engine = create_engine(database_url)
+        with engine.begin() as conn:
+            if not inspect(conn).has_table('trades'):
+                print("✅ Tables don't exist yet - they will be created from the models")
+                return 0
+
+            if conn.dialect.name == 'postgresql':
+                _migrate_postgres_types(conn)
+            elif conn.dialect.name == 'sqlite':
+                _migrate_sqlite_metadata(conn)
+
+            print("  - Creating open-trades index and pending_unwinds table...")
+            for index in TradeLog.__table__.indexes:
+                if index.name == 'ix_trade_open_status':
+                    index.create(conn, checkfirst=True)
+            PendingUnwind.__table__.create(conn, checkfirst=True)
+
+        print("✅ Schema migration completed successfully!")
+        return 0
+
+    except Exception as e:
+        print(f"❌ Schema migration failed: {e}")
+        return 1
+
+
 if __name__ == "__main__":
-    db_path = sys.argv[1] if len(sys.argv) > 1 else "data/arbitrage.db"
+    # Accepts a SQLite file path or a database URL
+    target = sys.argv[1] if len(sys.argv) > 1 else "data/arbitrage.db"
+    if "://" in target:
+        database_url = target
+        url = make_url(target)
+        db_path = url.database if url.get_backend_name() == 'sqlite' else None
+    else:
+        database_url = f"sqlite:///{target}"
+        db_path = target
 
     print("=" * 70)
-    print("  DATABASE MIGRATION - Add trading_mode column")
+    print("  DATABASE MIGRATION - trading_mode column and schema updates")
     print("=" * 70)
     print()
 
-    exit_code = migrate_database(db_path)
+    # The trading_mode step predates Postgres support and only applies to SQLite
+    exit_code = migrate_database(db_path) if db_path else 0
+    if exit_code == 0 and (db_path is None or Path(db_path).exists()):
+        print()
+        exit_code = migrate_schema(database_url)
 
     print()
     print("=" * 70)
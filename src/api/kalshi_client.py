@@ -4,7 +4,8 @@ import asyncio
 import aiohttp
 import base64
 import time
-from typing import Dict, List, Optional, Any
+import orjson
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
@@ -21,10 +22,74 @@ from src.utils.validation import (
 
 logger = setup_logger("kalshi")
 
+# Error codes Kalshi returns for an order whose client_order_id is already in use
+_DUPLICATE_ORDER_CODES = frozenset(('order_already_exists', 'duplicate_client_order_id'))
+
+
+class KalshiRequestError(Exception):
+    """A Kalshi request failed or was rejected"""
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        code: Optional[str] = None,
+        retryable: bool = False
+    ):
+        """
+        Initialize request error
+
+        Args:
+            message: Error description
+            status: HTTP status, None if no response arrived
+            code: Kalshi error code from the response body
+            retryable: True when the request may not have been processed
+                (timeout, connection error, 429 or 5xx), so retrying is safe
+                only with an idempotency key
+        """
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.retryable = retryable
+
+    @property
+    def duplicate_order(self) -> bool:
+        """Whether the order was rejected because its client_order_id exists"""
+        return self.status == 409 or self.code in _DUPLICATE_ORDER_CODES
+
+
+def _error_code(error: Any) -> Optional[str]:
+    """
+    Extract the error code from a Kalshi error payload
+
+    Args:
+        error: Response body text, or the 'error' entry of a batched result
+
+    Returns:
+        Error code or None
+    """
+    if isinstance(error, (str, bytes)):
+        try:
+            error = orjson.loads(error).get('error')
+        except (orjson.JSONDecodeError, AttributeError):
+            return None
+    return error.get('code') if isinstance(error, dict) else None
+
 
 class KalshiClient:
     """Client for interacting with Kalshi API using RSA-PSS signing"""
 
+    # Tickers per /markets request when batching price lookups
+    BATCH_TICKERS = 100
+
+    # Maximum orders per /portfolio/orders/batched request
+    BATCH_ORDERS = 20
+
+    # Connection pool: keep warm sockets and resolved DNS between requests
+    CONNECTION_LIMIT = 32
+    DNS_CACHE_TTL_SEC = 300
+    KEEPALIVE_TIMEOUT_SEC = 60
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -67,7 +132,13 @@ class KalshiClient:
     async def _ensure_session(self) -> aiohttp.ClientSession:
         """Ensure aiohttp session exists"""
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.CONNECTION_LIMIT,
+                    ttl_dns_cache=self.DNS_CACHE_TTL_SEC,
+                    keepalive_timeout=self.KEEPALIVE_TIMEOUT_SEC
+                )
+            )
         return self.session
 
     async def close(self):
@@ -123,15 +194,15 @@ class KalshiClient:
             logger.error(f"Error signing request: {e}")
             return {}
 
-    async def _request(
+    async def _send(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict] = None,
         json_data: Optional[Dict] = None
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
-        Make authenticated API request
+        Make authenticated API request, raising on failure
 
         Args:
             method: HTTP method
@@ -140,7 +211,10 @@ class KalshiClient:
             json_data: JSON body for POST/PUT requests
 
         Returns:
-            Response JSON or None
+            Response JSON
+
+        Raises:
+            KalshiRequestError: If the request fails or is rejected
         """
         # Get path without query params for signing
         path = endpoint if endpoint.startswith('/') else f'/{endpoint}'
@@ -148,8 +222,7 @@ class KalshiClient:
         # Sign the request
         headers = self._sign_request(method, path)
         if not headers:
-            logger.error("Failed to sign request - missing credentials")
-            return None
+            raise KalshiRequestError("Failed to sign request - missing credentials")
 
         try:
             session = await self._ensure_session()
@@ -165,25 +238,67 @@ class KalshiClient:
             ) as response:
                 if response.status in [200, 201]:
                     return await response.json()
-                else:
-                    error_text = await response.text()
-                    logger.error(f"API request failed: {response.status} - {error_text}")
-                    return None
+
+                error_text = await response.text()
+                raise KalshiRequestError(
+                    f"API request failed: {response.status} - {error_text}",
+                    status=response.status,
+                    code=_error_code(error_text),
+                    retryable=response.status == 429 or response.status >= 500
+                )
 
         except asyncio.TimeoutError:
-            logger.error(f"Timeout on {method} {endpoint}")
+            raise KalshiRequestError(f"Timeout on {method} {endpoint}", retryable=True)
+        except aiohttp.ClientError as e:
+            raise KalshiRequestError(
+                f"Error making request to {endpoint}: {e}", retryable=True
+            ) from e
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        json_data: Optional[Dict] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Make authenticated API request
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path (without base URL)
+            params: Query parameters
+            json_data: JSON body for POST/PUT requests
+
+        Returns:
+            Response JSON or None
+        """
+        try:
+            return await self._send(method, endpoint, params, json_data)
+        except KalshiRequestError as e:
+            logger.error(str(e))
             return None
         except Exception as e:
             logger.error(f"Error making request to {endpoint}: {e}")
             return None
 
-    async def get_markets(self, limit: int = 100, status: str = "open") -> List[Dict[str, Any]]:
+    async def get_markets(
+        self,
+        limit: int = 100,
+        status: str = "open",
+        max_days_to_close: Optional[int] = None,
+        series_ticker: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch markets from Kalshi
 
+        Filters are applied server-side, so excluded markets are never transferred.
+
         Args:
             limit: Maximum number of markets to fetch
             status: Market status filter (open, closed, settled)
+            max_days_to_close: Only markets closing within this many days
+            series_ticker: Only markets in this series
 
         Returns:
             List of market dictionaries
@@ -192,6 +307,10 @@ class KalshiClient:
             'limit': limit,
             'status': status
         }
+        if max_days_to_close is not None:
+            params['max_close_ts'] = int(time.time()) + max_days_to_close * 86400
+        if series_ticker:
+            params['series_ticker'] = series_ticker
 
         data = await self._request('GET', '/markets', params=params)
         if data:
@@ -258,6 +377,191 @@ class KalshiClient:
             logger.error(f"Error parsing orderbook: {e}")
             return None
 
+    async def get_best_prices(self, tickers: List[str], side: str) -> Optional[Dict[str, float]]:
+        """
+        Get best yes or no ask prices for many markets in one request per chunk
+
+        Uses the quotes included in the /markets listing instead of fetching
+        an orderbook per ticker.
+
+        Args:
+            tickers: Market tickers
+            side: 'yes' or 'no'
+
+        Returns:
+            Dictionary of ticker -> best price (tickers without a quote are
+            omitted), or None if a request failed
+        """
+        field = 'yes_ask' if side.lower() == 'yes' else 'no_ask'
+        prices: Dict[str, float] = {}
+
+        for start in range(0, len(tickers), self.BATCH_TICKERS):
+            chunk = tickers[start:start + self.BATCH_TICKERS]
+            data = await self._request(
+                'GET', '/markets', params={'tickers': ','.join(chunk), 'limit': len(chunk)}
+            )
+            if data is None:
+                return None
+
+            for market in data.get('markets', []):
+                ask = market.get(field)
+                if ask:  # 0 means no resting offers
+                    prices[market.get('ticker')] = float(ask) / 100  # Kalshi prices in cents
+
+        return prices
+
+    async def stream_best_prices(
+        self,
+        tickers: List[str],
+        side: str,
+        on_price: Callable[[str, float], None]
+    ) -> None:
+        """
+        Stream best yes or no ask prices over the websocket ticker channel
+
+        Returns when the connection closes; the caller decides whether to
+        reconnect.
+
+        Args:
+            tickers: Market tickers to subscribe to
+            side: 'yes' or 'no'
+            on_price: Called with (ticker, price) for every quote update
+        """
+        ws_path = '/trade-api/ws/v2'
+        url = self.base_url.replace('https://', 'wss://').replace('/trade-api/v2', ws_path)
+
+        headers = self._sign_request('GET', ws_path)
+        if not headers:
+            logger.error("Cannot open price stream - missing credentials")
+            return
+
+        session = await self._ensure_session()
+        async with session.ws_connect(url, headers=headers, heartbeat=30) as ws:
+            await ws.send_json({
+                'id': 1,
+                'cmd': 'subscribe',
+                'params': {'channels': ['ticker'], 'market_tickers': list(tickers)}
+            })
+            logger.info(f"Subscribed to Kalshi prices for {len(tickers)} markets")
+
+            async for message in ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    if message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                        break
+                    continue
+
+                data = message.json()
+                if data.get('type') != 'ticker':
+                    continue
+
+                update = data.get('msg', {})
+                ticker = update.get('market_ticker')
+                if side.lower() == 'yes':
+                    cents = update.get('yes_ask')
+                else:
+                    # Buying NO means selling YES at the best YES bid
+                    yes_bid = update.get('yes_bid')
+                    cents = 100 - yes_bid if yes_bid else None
+
+                if ticker and cents:
+                    on_price(ticker, float(cents) / 100)  # Kalshi prices in cents
+
+    @staticmethod
+    def _order_payload(
+        ticker: str,
+        side: str,
+        action: str,
+        count: int,
+        price: int,
+        order_type: str = "limit",
+        client_order_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate order fields and build the create-order request body
+
+        Args:
+            ticker: Market ticker
+            side: 'yes' or 'no'
+            action: 'buy' or 'sell'
+            count: Number of contracts
+            price: Price in cents (1-99)
+            order_type: Order type (limit, market)
+            client_order_id: Idempotency key (generated if omitted)
+
+        Returns:
+            Order payload
+
+        Raises:
+            ValidationError: If any field is invalid
+        """
+        ticker = validate_ticker(ticker)
+        side = validate_side(side, allowed_sides=['yes', 'no'])
+        action = validate_side(action, allowed_sides=['buy', 'sell'])
+        count = validate_quantity(count, min_qty=1, max_qty=10000)
+        price = validate_kalshi_price_cents(price)
+        order_type = validate_order_type(order_type)
+
+        payload = {
+            'ticker': ticker,
+            'client_order_id': (
+                client_order_id or f"{ticker}_{int(datetime.now().timestamp())}"
+            ),
+            'side': side,
+            'action': action,
+            'count': count,
+            'type': order_type,
+        }
+
+        # Add price based on side (only include the relevant field)
+        if order_type == 'limit':
+            if side == 'yes':
+                payload['yes_price'] = price
+            else:
+                payload['no_price'] = price
+
+        return payload
+
+    async def submit_order(
+        self,
+        ticker: str,
+        side: str,
+        action: str,
+        count: int,
+        price: int,
+        order_type: str = "limit",
+        client_order_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Place an order on Kalshi, raising on failure
+
+        Unlike place_order, failures are raised so callers can tell a
+        rejection from a request whose outcome is unknown.
+
+        Args:
+            ticker: Market ticker
+            side: 'yes' or 'no'
+            action: 'buy' or 'sell'
+            count: Number of contracts
+            price: Price in cents (1-99)
+            order_type: Order type (limit, market)
+            client_order_id: Idempotency key; Kalshi rejects a second order
+                with the same key, so a retried submission cannot fill twice
+
+        Returns:
+            Order response
+
+        Raises:
+            ValidationError: If any field is invalid
+            KalshiRequestError: If the request fails or is rejected
+        """
+        payload = self._order_payload(
+            ticker, side, action, count, price, order_type, client_order_id
+        )
+
+        result = await self._send('POST', '/portfolio/orders', json_data=payload)
+        logger.info(f"Order placed: {result.get('order', {}).get('order_id')}")
+        return result
+
     async def place_order(
         self,
         ticker: str,
@@ -265,7 +569,8 @@ class KalshiClient:
         action: str,
         count: int,
         price: int,
-        order_type: str = "limit"
+        order_type: str = "limit",
+        client_order_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Place an order on Kalshi
@@ -277,49 +582,82 @@ class KalshiClient:
             count: Number of contracts
             price: Price in cents (1-99)
             order_type: Order type (limit, market)
+            client_order_id: Idempotency key; Kalshi rejects a second order
+                with the same key, so a retried submission cannot fill twice
 
         Returns:
             Order response or None
         """
         try:
-            # Validate inputs
-            ticker = validate_ticker(ticker)
-            side = validate_side(side, allowed_sides=['yes', 'no'])
-            action = validate_side(action, allowed_sides=['buy', 'sell'])
-            count = validate_quantity(count, min_qty=1, max_qty=10000)
-            price = validate_kalshi_price_cents(price)
-            order_type = validate_order_type(order_type)
-
-            payload = {
-                'ticker': ticker,
-                'client_order_id': f"{ticker}_{int(datetime.now().timestamp())}",
-                'side': side,
-                'action': action,
-                'count': count,
-                'type': order_type,
-            }
-
-            # Add price based on side (only include the relevant field)
-            if order_type == 'limit':
-                if side == 'yes':
-                    payload['yes_price'] = price
-                else:
-                    payload['no_price'] = price
-
-            result = await self._request('POST', '/portfolio/orders', json_data=payload)
-
-            if result:
-                logger.info(f"Order placed: {result.get('order', {}).get('order_id')}")
-                return result
-            return None
+            return await self.submit_order(
+                ticker, side, action, count, price, order_type, client_order_id
+            )
 
         except ValidationError as e:
             logger.error(f"Order validation failed: {e}")
             return None
+        except KalshiRequestError as e:
+            logger.error(str(e))
+            return None
         except Exception as e:
             logger.error(f"Error placing order: {e}")
             return None
 
+    async def submit_orders(self, orders: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Place several orders in one signed batch request, reporting failures
+
+        Each order is validated on its own; invalid ones are left out of the
+        request. Lists longer than BATCH_ORDERS are split.
+
+        Args:
+            orders: submit_order keyword arguments, one dict per order
+
+        Returns:
+            Per input order, the order response (same shape as submit_order)
+            or the ValidationError/KalshiRequestError it failed with
+        """
+        results: List[Any] = [None] * len(orders)
+
+        valid = []
+        for i, order in enumerate(orders):
+            try:
+                valid.append((i, self._order_payload(**order)))
+            except ValidationError as e:
+                results[i] = e
+
+        for start in range(0, len(valid), self.BATCH_ORDERS):
+            chunk = valid[start:start + self.BATCH_ORDERS]
+            try:
+                response = await self._send(
+                    'POST', '/portfolio/orders/batched',
+                    json_data={'orders': [payload for _, payload in chunk]}
+                )
+            except KalshiRequestError as e:
+                for i, _ in chunk:
+                    results[i] = e
+                continue
+
+            entries = response.get('orders', [])
+            for n, (i, _) in enumerate(chunk):
+                if n >= len(entries):
+                    # No per-order result: the order may or may not have landed
+                    results[i] = KalshiRequestError(
+                        "No result for batched order", retryable=True
+                    )
+                    continue
+
+                entry = entries[n]
+                if entry.get('order') and not entry.get('error'):
+                    results[i] = {'order': entry['order']}
+                else:
+                    error = entry.get('error')
+                    results[i] = KalshiRequestError(
+                        f"Batched order rejected: {error}", code=_error_code(error)
+                    )
+
+        return results
+
     async def get_balance(self) -> Optional[Dict[str, float]]:
         """
         Get account balance
@@ -357,6 +695,30 @@ class KalshiClient:
         """
         return await self._request('GET', f'/portfolio/orders/{order_id}')
 
+    async def get_order_by_client_id(
+        self,
+        ticker: str,
+        client_order_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find an order by the client_order_id it was submitted with
+
+        Used to recover an order whose submission timed out or was rejected
+        as a duplicate, i.e. one that may have landed without an ack.
+
+        Args:
+            ticker: Market ticker the order was placed on
+            client_order_id: Idempotency key used at submission
+
+        Returns:
+            Order response (same shape as place_order) or None if not found
+        """
+        data = await self._request('GET', '/portfolio/orders', params={'ticker': ticker})
+        for order in (data or {}).get('orders', []):
+            if order.get('client_order_id') == client_order_id:
+                return {'order': order}
+        return None
+
     async def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an open order
@@ -373,6 +735,27 @@ class KalshiClient:
             return True
         return False
 
+    @staticmethod
+    def market_cache_key(market: Dict[str, Any]) -> tuple:
+        """
+        Key that changes whenever normalize_market() would produce a different result
+
+        Args:
+            market: Raw market data from Kalshi
+
+        Returns:
+            Hashable tuple of the fields normalization reads
+        """
+        return (
+            market.get('ticker'),
+            market.get('title'),
+            market.get('subtitle'),
+            market.get('close_time'),
+            market.get('status'),
+            market.get('volume'),
+            market.get('open_interest')
+        )
+
     def normalize_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize Kalshi market data to standard format
@@ -1,10 +1,11 @@
 """Polymarket API client using official py-clob-client SDK"""
 
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import aiohttp
+from typing import Any, Callable, Dict, List, Optional
+from datetime import datetime, timedelta
 from py_clob_client.client import ClobClient
-from py_clob_client.clob_types import ApiCreds, OrderArgs, OrderType
+from py_clob_client.clob_types import ApiCreds, BookParams, OrderArgs, OrderType
 from py_clob_client.exceptions import PolyApiException
 from src.utils.logger import setup_logger
 from src.utils.validation import (
@@ -25,6 +26,9 @@ class PolymarketClient:
     and normalizes the interface to match our application's needs.
     """
 
+    # Public CLOB market channel (order books and price changes)
+    WS_MARKET_URL = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -87,13 +91,22 @@ class PolymarketClient:
             logger.error(f"Failed to initialize Polymarket client: {e}")
             self.client = None
 
-    async def get_markets(self, limit: int = 100, active: bool = True) -> List[Dict[str, Any]]:
+    async def get_markets(
+        self,
+        limit: int = 100,
+        active: bool = True,
+        max_days_to_close: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Fetch active markets from Polymarket
 
+        The SDK has no server-side filters, so these are applied before the
+        limit and before anything is cached or returned for normalization.
+
         Args:
             limit: Maximum number of markets to fetch
             active: Only fetch active markets
+            max_days_to_close: Only markets ending within this many days
 
         Returns:
             List of market dictionaries
@@ -114,6 +127,15 @@ class PolymarketClient:
             if active:
                 markets = [m for m in markets if m.get('active', False)]
 
+            if max_days_to_close is not None:
+                # ISO dates compare correctly as strings
+                cutoff = datetime.utcnow() + timedelta(days=max_days_to_close)
+                cutoff = cutoff.strftime('%Y-%m-%d')
+                markets = [
+                    m for m in markets
+                    if m.get('end_date_iso') and m['end_date_iso'][:10] <= cutoff
+                ]
+
             markets = markets[:limit]
 
             # Cache markets for token ID lookups
@@ -202,21 +224,142 @@ class PolymarketClient:
         if not orderbook:
             return None
 
+        return self._best_from_book(orderbook, side)
+
+    async def get_best_prices(self, token_ids: List[str], side: str) -> Optional[Dict[str, float]]:
+        """
+        Get best bid or ask prices for many tokens with a single books request
+
+        Args:
+            token_ids: Token IDs
+            side: 'buy' or 'sell'
+
+        Returns:
+            Dictionary of token ID -> best price (tokens without a quote are
+            omitted), or None if the request failed
+        """
+        if not self.client:
+            logger.error("Client not initialized")
+            return None
+
+        if not token_ids:
+            return {}
+
+        try:
+            loop = asyncio.get_event_loop()
+            books = await loop.run_in_executor(
+                None,
+                lambda: self.client.get_order_books(
+                    [BookParams(token_id=token_id) for token_id in token_ids]
+                )
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching orderbooks for {len(token_ids)} tokens: {e}")
+            return None
+
+        prices: Dict[str, float] = {}
+        for position, book in enumerate(books or []):
+            if isinstance(book, dict):
+                asset_id = book.get('asset_id')
+            else:
+                asset_id = getattr(book, 'asset_id', None)
+            if asset_id is None and position < len(token_ids):
+                asset_id = token_ids[position]
+
+            price = self._best_from_book(book, side)
+            if asset_id is not None and price is not None:
+                prices[asset_id] = price
+
+        return prices
+
+    async def stream_best_prices(
+        self,
+        token_ids: List[str],
+        side: str,
+        on_price: Callable[[str, float], None]
+    ) -> None:
+        """
+        Stream best bid or ask prices over the CLOB market websocket
+
+        Full book snapshots are read with the same rule as get_best_price();
+        incremental price changes are used when they carry the new best
+        bid/ask. Returns when the connection closes.
+
+        Args:
+            token_ids: Token IDs to subscribe to
+            side: 'buy' or 'sell'
+            on_price: Called with (token_id, price) for every quote update
+        """
+        best_field = 'best_ask' if side.lower() == 'buy' else 'best_bid'
+
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.WS_MARKET_URL, heartbeat=30) as ws:
+                await ws.send_json({'assets_ids': list(token_ids), 'type': 'market'})
+                logger.info(f"Subscribed to Polymarket prices for {len(token_ids)} tokens")
+
+                async for message in ws:
+                    if message.type != aiohttp.WSMsgType.TEXT:
+                        if message.type in (aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            break
+                        continue
+
+                    data = message.json()
+                    events = data if isinstance(data, list) else [data]
+
+                    for event in events:
+                        event_type = event.get('event_type')
+
+                        if event_type == 'book':
+                            price = self._best_from_book(event, side)
+                            if price is not None:
+                                on_price(event.get('asset_id'), price)
+
+                        elif event_type == 'price_change':
+                            changes = event.get('price_changes') or [event]
+                            for change in changes:
+                                best = change.get(best_field)
+                                asset_id = change.get('asset_id') or event.get('asset_id')
+                                if best and asset_id:
+                                    on_price(asset_id, float(best))
+
+    @staticmethod
+    def _best_from_book(orderbook: Any, side: str) -> Optional[float]:
+        """
+        Read the best price from an orderbook
+
+        Accepts the dict form as well as the SDK's OrderBookSummary objects.
+
+        Args:
+            orderbook: Orderbook with bids and asks
+            side: 'buy' for the best ask, anything else for the best bid
+
+        Returns:
+            Best price or None
+        """
+        def levels(name):
+            if isinstance(orderbook, dict):
+                return orderbook.get(name, [])
+            return getattr(orderbook, name, None) or []
+
+        def price_of(level):
+            return level['price'] if isinstance(level, dict) else level.price
+
         try:
             if side.lower() == 'buy':
                 # Best ask (lowest sell price)
-                asks = orderbook.get('asks', [])
+                asks = levels('asks')
                 if asks:
-                    return float(asks[0]['price'])
+                    return float(price_of(asks[0]))
             else:
                 # Best bid (highest buy price)
-                bids = orderbook.get('bids', [])
+                bids = levels('bids')
                 if bids:
-                    return float(bids[0]['price'])
+                    return float(price_of(bids[0]))
 
             return None
 
-        except (IndexError, KeyError, ValueError) as e:
+        except (IndexError, KeyError, ValueError, AttributeError) as e:
             logger.error(f"Error parsing orderbook: {e}")
             return None
 
@@ -425,6 +568,29 @@ class PolymarketClient:
         self.client = None
         logger.debug("Polymarket client closed")
 
+    @staticmethod
+    def market_cache_key(market: Dict[str, Any]) -> tuple:
+        """
+        Key that changes whenever normalize_market() would produce a different result
+
+        Token lists are fixed per condition, so only scalar fields are included.
+
+        Args:
+            market: Raw market data from Polymarket
+
+        Returns:
+            Hashable tuple of the fields normalization reads
+        """
+        return (
+            market.get('condition_id') or market.get('id'),
+            market.get('question'),
+            market.get('description'),
+            market.get('end_date_iso'),
+            market.get('active'),
+            market.get('volume'),
+            market.get('liquidity')
+        )
+
     def normalize_market(self, market: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize Polymarket market data to standard format
@@ -3,13 +3,24 @@
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+import numpy as np
+import orjson
 from src.utils.logger import setup_logger
-from src.arbitrage.risk_analyzer import RiskAnalyzer, RiskAssessment, RiskLevel
+from src.arbitrage.risk_analyzer import (
+    HIGH_RISK_SCORE, RiskAnalyzer, RiskAssessment, RiskLevel, warm_up_risk_kernels
+)
 
 logger = setup_logger("detector")
 
+# Fraction of full Kelly used for position sizing (conservative)
+DEFAULT_KELLY_FRACTION = 0.25
 
-@dataclass
+# analyze_batch adds the same components in a different order than
+# analyze_opportunity, so leave room for rounding before rejecting a pair
+BATCH_RISK_TOLERANCE = 1e-9
+
+
+@dataclass(slots=True)
 class ArbitrageOpportunity:
     """Represents an arbitrage opportunity"""
 
@@ -50,6 +61,14 @@ class ArbitrageOpportunity:
     risk_score: Optional[float] = None
     risk_warnings: Optional[List[str]] = None
 
+    # Capital efficiency
+    days_to_resolution: Optional[int] = None
+    annualized_roi: Optional[float] = None
+
+    # Execution limit prices, slippage tolerance already applied
+    kalshi_limit_cents: Optional[int] = None
+    polymarket_limit_price: Optional[float] = None
+
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
         return {
@@ -69,6 +88,10 @@ class ArbitrageOpportunity:
             'similarity_score': self.similarity_score,
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize all fields to JSON bytes in a single pass"""
+        return orjson.dumps(self)
+
 
 class ArbitrageDetector:
     """Detects arbitrage opportunities between exchanges"""
@@ -84,6 +107,8 @@ class ArbitrageDetector:
         self.min_trade_size = config.get('trading', {}).get('min_trade_size_usd', 100)
         self.max_trade_size_pct = config.get('trading', {}).get('max_trade_size_pct', 0.05)
         self.target_liquidity = config.get('trading', {}).get('target_liquidity_depth', 5000)
+        self.slippage_tolerance = config.get('trading', {}).get('slippage_tolerance', 0.002)
+        self.slippage_mult = 1 + self.slippage_tolerance
 
         self.kalshi_fee_pct = config.get('fees', {}).get('kalshi_fee_pct', 0.007)
         self.polymarket_fee_pct = config.get('fees', {}).get('polymarket_fee_pct', 0.02)
@@ -92,6 +117,9 @@ class ArbitrageDetector:
         # Initialize risk analyzer
         self.risk_analyzer = RiskAnalyzer(config)
 
+        # Compile the batch risk kernel now rather than during the first scan
+        warm_up_risk_kernels()
+
     def calculate_spread(self, kalshi_yes: float, poly_no: float) -> float:
         """
         Calculate spread for arbitrage
@@ -127,7 +155,7 @@ class ArbitrageDetector:
         self,
         edge: float,
         bankroll: float,
-        kelly_fraction: float = 0.25
+        kelly_fraction: float = DEFAULT_KELLY_FRACTION
     ) -> float:
         """
         Calculate optimal position size using Kelly Criterion
@@ -282,7 +310,6 @@ class ArbitrageDetector:
         end_date = kalshi_market.get('end_date') or polymarket_market.get('end_date')
         if end_date:
             try:
-                from datetime import datetime
                 # Parse end date
                 for fmt in ['%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ']:
                     try:
@@ -323,10 +350,12 @@ class ArbitrageDetector:
             liquidity_kalshi=kalshi_liquidity,
             liquidity_polymarket=poly_liquidity,
             risk_level=risk_assessment.overall_risk.value,
-            risk_score=risk_assessment.risk_score,
+            risk_score=risk_assessment.score,
             risk_warnings=risk_assessment.warnings,
             days_to_resolution=days_to_resolution,
-            annualized_roi=annualized_roi
+            annualized_roi=annualized_roi,
+            kalshi_limit_cents=min(99, int(kalshi_yes_price * self.slippage_mult * 100)),
+            polymarket_limit_price=min(0.99, polymarket_no_price * self.slippage_mult)
         )
 
         # Build log message
@@ -352,42 +381,90 @@ class ArbitrageDetector:
     def scan_opportunities(
         self,
         matched_markets: List[Tuple[Dict, Dict, float]],
-        kalshi_prices: Dict[str, float],
-        polymarket_prices: Dict[str, float],
+        kalshi_prices: np.ndarray,
+        polymarket_prices: np.ndarray,
         bankroll: float
     ) -> List[ArbitrageOpportunity]:
         """
         Scan for arbitrage opportunities across all matched markets
 
+        Prices are aligned with matched_markets, with NaN where a price is
+        missing. The checks detect_opportunity() would reject on regardless
+        of risk (edge threshold, minimum size, liquidity) run as array ops
+        first. The survivors are risk-scored in one analyze_batch call, and
+        the full per-pair assessment only runs on pairs that can still pass it.
+
         Args:
             matched_markets: List of (kalshi_market, poly_market, similarity)
-            kalshi_prices: Dict of market_id -> yes_price for Kalshi
-            polymarket_prices: Dict of market_id -> no_price for Polymarket
+            kalshi_prices: (N,) Kalshi YES prices
+            polymarket_prices: (N,) Polymarket NO prices
             bankroll: Available bankroll
 
         Returns:
-            List of ArbitrageOpportunity objects
+            List of ArbitrageOpportunity objects, most profitable first
         """
-        opportunities = []
+        n = len(matched_markets)
+        kalshi_yes = np.asarray(kalshi_prices, dtype=np.float64)
+        poly_no = np.asarray(polymarket_prices, dtype=np.float64)
+        kalshi_liq = np.fromiter(
+            (km.get('liquidity', 0) for km, _, _ in matched_markets), dtype=np.float64, count=n
+        )
+        poly_liq = np.fromiter(
+            (pm.get('liquidity', 0) for _, pm, _ in matched_markets), dtype=np.float64, count=n
+        )
+
+        raw_edge = 1.0 - kalshi_yes - poly_no
+        priced = np.isfinite(raw_edge)
+
+        # Risk can only shrink the size, so pairs below the minimum before risk stay below it
+        size = np.minimum(
+            bankroll * raw_edge * DEFAULT_KELLY_FRACTION, bankroll * self.max_trade_size_pct
+        )
 
-        for kalshi_market, poly_market, similarity in matched_markets:
-            kalshi_id = kalshi_market.get('market_id')
-            poly_id = poly_market.get('market_id')
+        mask = (
+            priced
+            & (raw_edge >= self.threshold_spread)
+            & (size >= self.min_trade_size)
+            & (kalshi_liq >= self.target_liquidity)
+            & (poly_liq >= self.target_liquidity)
+        )
+
+        missing = n - int(priced.sum())
+        if missing:
+            logger.debug(f"Missing prices for {missing} of {n} matched pairs")
+
+        # Batch risk pass at the maximum size detect_opportunity assesses; pairs
+        # scoring HIGH or worse would be rejected by the full assessment anyway
+        candidates = np.flatnonzero(mask)
+        if candidates.size:
+            risk_scores = self.risk_analyzer.analyze_batch(
+                [matched_markets[i][:2] for i in candidates],
+                np.fromiter(
+                    (matched_markets[i][2] for i in candidates),
+                    dtype=np.float64, count=candidates.size
+                ),
+                raw_edge[candidates],
+                np.full(candidates.size, bankroll * self.max_trade_size_pct)
+            )
+            acceptable = risk_scores < HIGH_RISK_SCORE + BATCH_RISK_TOLERANCE
+            if not acceptable.all():
+                logger.debug(
+                    f"Batch risk check rejected {int((~acceptable).sum())} "
+                    f"of {candidates.size} pairs"
+                )
+            candidates = candidates[acceptable]
 
-            # Get prices
-            kalshi_yes = kalshi_prices.get(kalshi_id)
-            poly_no = polymarket_prices.get(poly_id)
+        opportunities = []
 
-            if kalshi_yes is None or poly_no is None:
-                logger.debug(f"Missing prices for {kalshi_id} or {poly_id}")
-                continue
+        # Best raw edges first
+        for i in candidates[np.argsort(-raw_edge[candidates], kind='stable')]:
+            kalshi_market, poly_market, similarity = matched_markets[i]
 
-            # Detect opportunity
             opp = self.detect_opportunity(
                 kalshi_market,
                 poly_market,
-                kalshi_yes,
-                poly_no,
+                float(kalshi_yes[i]),
+                float(poly_no[i]),
                 similarity,
                 bankroll
             )
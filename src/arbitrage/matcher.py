@@ -1,6 +1,7 @@
 """Event matching logic to find equivalent markets across exchanges"""
 
 import re
+from collections import defaultdict
 from typing import Dict, List, Tuple, Optional
 from difflib import SequenceMatcher
 from datetime import datetime, timedelta
@@ -8,6 +9,10 @@ from src.utils.logger import setup_logger
 
 logger = setup_logger("matcher")
 
+# Weights of the combined similarity used by is_match()
+TEXT_WEIGHT = 0.7
+KEYWORD_WEIGHT = 0.3
+
 
 class EventMatcher:
     """Matches events across different exchanges"""
@@ -209,7 +214,9 @@ class EventMatcher:
         if use_keywords:
             keyword_similarity = self.keyword_overlap(q1, q2)
             # Weighted average: 70% text, 30% keywords
-            combined_similarity = 0.7 * text_similarity + 0.3 * keyword_similarity
+            combined_similarity = (
+                TEXT_WEIGHT * text_similarity + KEYWORD_WEIGHT * keyword_similarity
+            )
         else:
             combined_similarity = text_similarity
 
@@ -237,6 +244,12 @@ class EventMatcher:
         """
         Find all matching market pairs
 
+        Gives the same result as calling is_match() on every pair, but each
+        question is normalized once and Polymarket markets are looked up
+        through a keyword index. Pairs whose keyword overlap or quick text
+        bound cannot reach the threshold are skipped before the full
+        SequenceMatcher ratio is computed.
+
         Args:
             kalshi_markets: List of Kalshi markets
             polymarket_markets: List of Polymarket markets
@@ -246,14 +259,67 @@ class EventMatcher:
         """
         matches = []
 
+        # Text similarity is at most 1.0, so a pair can only reach the threshold
+        # with at least this much keyword overlap
+        min_overlap = (self.similarity_threshold - TEXT_WEIGHT) / KEYWORD_WEIGHT
+
+        # Normalize each Polymarket question once and index it by keyword
+        poly = []
+        index = defaultdict(list)
+        for pm in polymarket_markets:
+            question = pm.get('question', '')
+            if not question:
+                continue
+            keywords = self.extract_keywords(question)
+            scorer = SequenceMatcher(None, '', self.normalize_text(question))
+            for keyword in keywords:
+                index[keyword].append(len(poly))
+            poly.append((pm, keywords, scorer, self.parse_date(pm.get('end_date'))))
+
         for km in kalshi_markets:
+            question = km.get('question', '')
+            if not question:
+                continue
+
+            keywords = self.extract_keywords(question)
+            norm = self.normalize_text(question)
+            end_date = self.parse_date(km.get('end_date'))
+
+            # Only markets sharing a keyword can pass, unless the threshold is low
+            # enough that text similarity alone suffices
+            shared = defaultdict(int)
+            for keyword in keywords:
+                for j in index.get(keyword, ()):
+                    shared[j] += 1
+            if min_overlap <= 0:
+                candidates = range(len(poly))
+            else:
+                candidates = sorted(shared)
+
             best_match = None
             best_score = 0.0
 
-            for pm in polymarket_markets:
-                is_match, score = self.is_match(km, pm)
+            for j in candidates:
+                pm, pm_keywords, scorer, pm_end_date = poly[j]
+
+                common = shared.get(j, 0)
+                union = len(keywords) + len(pm_keywords) - common
+                overlap = common / union if union else 0.0
+                if overlap < min_overlap:
+                    continue
+
+                if end_date is not None and pm_end_date is not None:
+                    if abs((end_date - pm_end_date).days) > self.date_tolerance_days:
+                        continue
+
+                # quick_ratio() bounds ratio() from above and is much cheaper
+                scorer.set_seq1(norm)
+                bound = TEXT_WEIGHT * scorer.quick_ratio() + KEYWORD_WEIGHT * overlap
+                if bound < self.similarity_threshold:
+                    continue
 
-                if is_match and score > best_score:
+                score = TEXT_WEIGHT * scorer.ratio() + KEYWORD_WEIGHT * overlap
+                if score >= self.similarity_threshold and score > best_score:
                     best_match = pm
                     best_score = score
 
@@ -1,13 +1,101 @@
 """Risk analysis for arbitrage opportunities"""
 
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from datetime import datetime, timedelta
+import numpy as np
+from src.utils._njit import njit, prange
 from src.utils.logger import setup_logger
 
 logger = setup_logger("risk_analyzer")
 
+# Numeric thresholds shared by the per-opportunity and batch scoring paths
+LOW_SIMILARITY_THRESHOLD = 0.90
+MAX_LIQUIDITY_RATIO = 0.1  # Position should be < 10% of liquidity
+VERY_THIN_EDGE = 0.005
+THIN_EDGE = 0.01
+HIGH_RISK_SCORE = 0.5  # Lowest score rated HIGH; HIGH and CRITICAL are not executed
+
+# Question wording that changes what a market resolves on: keyword -> risk type
+RISKY_KEYWORDS = {
+    'primary': 'general election vs primary',
+    'general': 'general election vs primary',
+    'runoff': 'runoff vs first round',
+    'plurality': 'win condition differences',
+    'majority': 'win condition differences',
+    'at least': 'threshold differences',
+    'more than': 'threshold differences',
+    'by end of': 'timing ambiguity',
+    'before': 'timing ambiguity'
+}
+
+# Description mismatch rules: (kalshi term, polymarket term, severity, description, warning)
+DESC_MISMATCHES = [
+    (
+        'primary', 'general', 'critical',
+        'Primary vs General election mismatch',
+        '🚨 CRITICAL: Markets appear to be for different elections (primary vs general)'
+    ),
+]
+
+# One pass over the text finds every term used by the rules above
+_TERM_PATTERN = re.compile('|'.join(
+    re.escape(term) for term in sorted(
+        set(RISKY_KEYWORDS) | {t for rule in DESC_MISMATCHES for t in rule[:2]},
+        key=len,
+        reverse=True
+    )
+))
+
+
+def _scan_terms(text: str) -> Set[str]:
+    """Return the set of rule terms that occur in already-lowercased text"""
+    return set(_TERM_PATTERN.findall(text)) if text else set()
+
+
+@njit(cache=True, parallel=True)
+def _score_batch(kalshi_liq, poly_liq, position, edge, sim, event_text):
+    """
+    Numeric part of the risk score for N opportunities
+
+    Mirrors the similarity, liquidity and edge rules of RiskAnalyzer.
+    ``event_text`` carries the text-derived event definition score so the
+    1.0 cap on that component can be applied after the similarity penalty.
+
+    Returns:
+        (N,) float64 array of partial risk scores
+    """
+    n = edge.shape[0]
+    out = np.zeros(n)
+
+    for i in prange(n):
+        event = event_text[i]
+        if sim[i] < LOW_SIMILARITY_THRESHOLD:
+            event += 0.3
+        score = min(event, 1.0)
+
+        if kalshi_liq[i] > 0 and position[i] / kalshi_liq[i] > MAX_LIQUIDITY_RATIO:
+            score += 0.2
+        if poly_liq[i] > 0 and position[i] / poly_liq[i] > MAX_LIQUIDITY_RATIO:
+            score += 0.2
+
+        if edge[i] < VERY_THIN_EDGE:
+            score += 0.3
+        elif edge[i] < THIN_EDGE:
+            score += 0.15
+
+        out[i] = score
+
+    return out
+
+
+def warm_up_risk_kernels() -> None:
+    """Trigger JIT compilation of the batch kernel before the first analyze_batch call"""
+    one = np.zeros(1)
+    _score_batch(one, one, one, one, one, one)
+
 
 class RiskLevel(Enum):
     """Risk level classification"""
@@ -17,7 +105,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """Risk assessment for an arbitrage opportunity"""
 
@@ -69,66 +157,26 @@ class RiskAnalyzer:
         Returns:
             RiskAssessment object
         """
-        risk_factors = []
-        warnings = []
-        risk_score = 0.0
-
-        # 1. Event Definition Risk
-        event_risk = self._analyze_event_definition_risk(
-            kalshi_market,
-            polymarket_market,
-            similarity_score
-        )
-        risk_factors.extend(event_risk['factors'])
-        warnings.extend(event_risk['warnings'])
-        risk_score += event_risk['score']
-
-        # 2. Resolution Timing Risk
-        timing_risk = self._analyze_timing_risk(
-            kalshi_market,
-            polymarket_market
-        )
-        risk_factors.extend(timing_risk['factors'])
-        warnings.extend(timing_risk['warnings'])
-        risk_score += timing_risk['score']
-
-        # 3. Liquidity Risk
-        liquidity_risk = self._analyze_liquidity_risk(
-            kalshi_market,
-            polymarket_market,
-            position_size
-        )
-        risk_factors.extend(liquidity_risk['factors'])
-        warnings.extend(liquidity_risk['warnings'])
-        risk_score += liquidity_risk['score']
-
-        # 4. Edge Adequacy Risk
-        edge_risk = self._analyze_edge_risk(edge)
-        risk_factors.extend(edge_risk['factors'])
-        warnings.extend(edge_risk['warnings'])
-        risk_score += edge_risk['score']
-
-        # 5. Regulatory Risk
-        regulatory_risk = self._analyze_regulatory_risk(polymarket_market)
-        risk_factors.extend(regulatory_risk['factors'])
-        warnings.extend(regulatory_risk['warnings'])
-        risk_score += regulatory_risk['score']
-
-        # 6. Time-to-Resolution Risk (Capital Efficiency)
-        time_risk = self._analyze_time_to_resolution(
-            kalshi_market,
-            polymarket_market,
-            edge
+        risk_factors: List[Dict[str, str]] = []
+        warnings: List[str] = []
+
+        # Every rule, applied in one pass in reporting order
+        event_score, category_scores = self._score_rules(
+            kalshi_market, polymarket_market, edge, risk_factors, warnings,
+            similarity_score, position_size
         )
-        risk_factors.extend(time_risk['factors'])
-        warnings.extend(time_risk['warnings'])
-        risk_score += time_risk['score']
+
+        # Summed category by category, in the same order, so scores on a
+        # level boundary round the same way every time
+        risk_score = min(event_score, 1.0)
+        for category_score in category_scores:
+            risk_score += category_score
 
         # Determine overall risk level
         if risk_score >= 0.7:
             overall_risk = RiskLevel.CRITICAL
             size_multiplier = 0.1
-        elif risk_score >= 0.5:
+        elif risk_score >= HIGH_RISK_SCORE:
             overall_risk = RiskLevel.HIGH
             size_multiplier = 0.3
         elif risk_score >= 0.3:
@@ -146,38 +194,105 @@ class RiskAnalyzer:
             recommended_size_multiplier=size_multiplier
         )
 
-    def _analyze_event_definition_risk(
+    def analyze_batch(
+        self,
+        pairs: List[Tuple[Dict, Dict]],
+        similarity_scores: np.ndarray,
+        edges: np.ndarray,
+        position_sizes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Compute risk scores for many opportunities at once
+
+        Produces the same score as analyze_opportunity() but skips building
+        factors and warnings for the numeric checks, which run in a single
+        (optionally JIT-compiled) kernel. Useful for pre-filtering large
+        market batches before a full assessment.
+
+        Args:
+            pairs: List of (kalshi_market, polymarket_market)
+            similarity_scores: (N,) event matching similarities
+            edges: (N,) net edges after fees
+            position_sizes: (N,) proposed position sizes
+
+        Returns:
+            (N,) float64 array of risk scores
+        """
+        n = len(pairs)
+        kalshi_liq = np.empty(n)
+        poly_liq = np.empty(n)
+        event_text = np.empty(n)
+        other_text = np.empty(n)
+
+        # String and date checks stay in Python
+        for i, (kalshi_market, polymarket_market) in enumerate(pairs):
+            kalshi_liq[i] = kalshi_market.get('liquidity', 0)
+            poly_liq[i] = polymarket_market.get('liquidity', 0)
+            event_text[i], category_scores = self._score_rules(
+                kalshi_market, polymarket_market, float(edges[i]), [], []
+            )
+            other_text[i] = sum(category_scores)
+
+        numeric = _score_batch(
+            kalshi_liq,
+            poly_liq,
+            np.asarray(position_sizes, dtype=np.float64),
+            np.asarray(edges, dtype=np.float64),
+            np.asarray(similarity_scores, dtype=np.float64),
+            event_text
+        )
+
+        return numeric + other_text
+
+    def _score_rules(
         self,
         kalshi_market: Dict,
         polymarket_market: Dict,
-        similarity_score: float
-    ) -> Dict:
-        """Analyze risk of event definition mismatch"""
-        factors = []
-        warnings = []
-        score = 0.0
+        edge: float,
+        factors: List[Dict[str, str]],
+        warnings: List[str],
+        similarity_score: Optional[float] = None,
+        position_size: Optional[float] = None
+    ) -> Tuple[float, Tuple[float, ...]]:
+        """
+        Apply the risk rules in one pass
+
+        Covers event definition (keywords, similarity and descriptions),
+        resolution timing, liquidity, edge, regulatory exposure and time to
+        resolution, appending factors and warnings in that order. Each market
+        field is read once. analyze_batch scores similarity, liquidity and
+        edge in its kernel, so those rules only run when their inputs are given.
+
+        Args:
+            kalshi_market: Kalshi market data
+            polymarket_market: Polymarket market data
+            edge: Net edge after fees
+            factors: Risk factor list to append to
+            warnings: Warning list to append to
+            similarity_score: Event matching similarity (similarity rule skipped if None)
+            position_size: Proposed position size (liquidity and edge rules skipped if None)
 
+        Returns:
+            Tuple of (uncapped event definition score, scores for timing,
+            liquidity, edge, regulatory and time to resolution)
+        """
         kalshi_q = kalshi_market.get('question', '').lower()
         poly_q = polymarket_market.get('question', '').lower()
+        kalshi_desc = kalshi_market.get('description', '').lower()
+        poly_desc = polymarket_market.get('description', '').lower()
+        kalshi_end = kalshi_market.get('end_date')
+        poly_end = polymarket_market.get('end_date')
+
+        kalshi_terms = _scan_terms(kalshi_q)
+        poly_terms = _scan_terms(poly_q)
+
+        event_score = 0.0
+        timing_score = 0.0
+        regulatory_score = 0.0
 
         # Check for key differences in wording
-        risky_keywords = {
-            'primary': 'general election vs primary',
-            'general': 'general election vs primary',
-            'runoff': 'runoff vs first round',
-            'plurality': 'win condition differences',
-            'majority': 'win condition differences',
-            'at least': 'threshold differences',
-            'more than': 'threshold differences',
-            'by end of': 'timing ambiguity',
-            'before': 'timing ambiguity'
-        }
-
-        for keyword, risk_type in risky_keywords.items():
-            kalshi_has = keyword in kalshi_q
-            poly_has = keyword in poly_q
-
-            if kalshi_has != poly_has:
+        for keyword, risk_type in RISKY_KEYWORDS.items():
+            if (keyword in kalshi_terms) != (keyword in poly_terms):
                 factors.append({
                     'type': 'event_definition',
                     'severity': 'high',
@@ -186,10 +301,10 @@ class RiskAnalyzer:
                 warnings.append(
                     f'⚠️ Event definition risk: One market mentions "{keyword}", other does not'
                 )
-                score += 0.25
+                event_score += 0.25
 
         # Low similarity score is a red flag
-        if similarity_score < 0.90:
+        if similarity_score is not None and similarity_score < LOW_SIMILARITY_THRESHOLD:
             factors.append({
                 'type': 'event_definition',
                 'severity': 'high',
@@ -198,93 +313,114 @@ class RiskAnalyzer:
             warnings.append(
                 f'⚠️ Markets may not be equivalent (similarity: {similarity_score:.2f})'
             )
-            score += 0.3
+            event_score += 0.3
 
         # Check description/subtitle for additional context
-        kalshi_desc = kalshi_market.get('description', '').lower()
-        poly_desc = polymarket_market.get('description', '').lower()
-
         if kalshi_desc and poly_desc:
-            if 'primary' in kalshi_desc and 'general' in poly_desc:
-                factors.append({
-                    'type': 'event_definition',
-                    'severity': 'critical',
-                    'description': 'Primary vs General election mismatch'
-                })
-                warnings.append(
-                    '🚨 CRITICAL: Markets appear to be for different elections (primary vs general)'
-                )
-                score += 0.5
-
-        return {
-            'factors': factors,
-            'warnings': warnings,
-            'score': min(score, 1.0)
-        }
-
-    def _analyze_timing_risk(
-        self,
-        kalshi_market: Dict,
-        polymarket_market: Dict
-    ) -> Dict:
-        """Analyze resolution timing mismatch risk"""
-        factors = []
-        warnings = []
-        score = 0.0
+            kalshi_desc_terms = _scan_terms(kalshi_desc)
+            poly_desc_terms = _scan_terms(poly_desc)
 
-        kalshi_end = kalshi_market.get('end_date', '')
-        poly_end = polymarket_market.get('end_date', '')
+            for kalshi_term, poly_term, severity, description, warning in DESC_MISMATCHES:
+                if kalshi_term in kalshi_desc_terms and poly_term in poly_desc_terms:
+                    factors.append({
+                        'type': 'event_definition',
+                        'severity': severity,
+                        'description': description
+                    })
+                    warnings.append(warning)
+                    event_score += 0.5
 
         # Check if end dates are significantly different
         # (In practice, you'd parse and compare actual dates)
-        if kalshi_end and poly_end:
-            if kalshi_end != poly_end:
-                factors.append({
-                    'type': 'timing',
-                    'severity': 'medium',
-                    'description': f'Different end dates: Kalshi {kalshi_end} vs Poly {poly_end}'
-                })
-                warnings.append(
-                    f'⚠️ Resolution timing may differ: Kalshi {kalshi_end}, Poly {poly_end}'
-                )
-                score += 0.15
+        if kalshi_end and poly_end and kalshi_end != poly_end:
+            factors.append({
+                'type': 'timing',
+                'severity': 'medium',
+                'description': f'Different end dates: Kalshi {kalshi_end} vs Poly {poly_end}'
+            })
+            warnings.append(
+                f'⚠️ Resolution timing may differ: Kalshi {kalshi_end}, Poly {poly_end}'
+            )
+            timing_score += 0.15
 
         # Check for early resolution risk
-        kalshi_q = kalshi_market.get('question', '').lower()
-        if 'by end of' in kalshi_q or 'before' in kalshi_q:
+        if 'by end of' in kalshi_terms or 'before' in kalshi_terms:
             factors.append({
                 'type': 'timing',
                 'severity': 'low',
                 'description': 'Time-bounded question may resolve early'
             })
-            score += 0.05
+            timing_score += 0.05
+
+        if position_size is not None:
+            liquidity_score, edge_score = self._score_liquidity_and_edge(
+                kalshi_market, polymarket_market, edge, position_size, factors, warnings
+            )
+        else:
+            liquidity_score = edge_score = 0.0
+
+        # Polymarket has geographic restrictions for US users
+        factors.append({
+            'type': 'regulatory',
+            'severity': 'medium',
+            'description': 'Polymarket has restrictions for US users'
+        })
+        warnings.append(
+            '⚠️ Ensure compliance with Polymarket geographic restrictions'
+        )
+        regulatory_score += 0.1
+
+        # Election markets may have additional restrictions
+        if any(word in poly_q for word in ['election', 'vote', 'campaign', 'political']):
+            factors.append({
+                'type': 'regulatory',
+                'severity': 'medium',
+                'description': 'Political prediction markets have regulatory scrutiny'
+            })
+            regulatory_score += 0.05
 
-        return {
-            'factors': factors,
-            'warnings': warnings,
-            'score': score
-        }
+        # Time to resolution: favour fast-resolving events to maximize compounding
+        time_score = self._score_time_to_resolution(
+            kalshi_end or poly_end, edge, factors, warnings
+        )
+
+        return event_score, (
+            timing_score, liquidity_score, edge_score, regulatory_score, time_score
+        )
 
-    def _analyze_liquidity_risk(
+    def _score_liquidity_and_edge(
         self,
         kalshi_market: Dict,
         polymarket_market: Dict,
-        position_size: float
-    ) -> Dict:
-        """Analyze liquidity and slippage risk"""
-        factors = []
-        warnings = []
-        score = 0.0
+        edge: float,
+        position_size: float,
+        factors: List[Dict[str, str]],
+        warnings: List[str]
+    ) -> Tuple[float, float]:
+        """
+        Apply the slippage and thin-edge rules
 
-        kalshi_liq = kalshi_market.get('liquidity', 0)
-        poly_liq = polymarket_market.get('liquidity', 0)
+        Args:
+            kalshi_market: Kalshi market data
+            polymarket_market: Polymarket market data
+            edge: Net edge after fees
+            position_size: Proposed position size
+            factors: Risk factor list to append to
+            warnings: Warning list to append to
+
+        Returns:
+            Tuple of (liquidity score, edge score)
+        """
+        liquidity_score = 0.0
+        edge_score = 0.0
 
         # Check if position size is too large relative to liquidity
-        min_liquidity_ratio = 0.1  # Position should be < 10% of liquidity
+        kalshi_liq = kalshi_market.get('liquidity', 0)
+        poly_liq = polymarket_market.get('liquidity', 0)
 
         if kalshi_liq > 0:
             kalshi_ratio = position_size / kalshi_liq
-            if kalshi_ratio > min_liquidity_ratio:
+            if kalshi_ratio > MAX_LIQUIDITY_RATIO:
                 factors.append({
                     'type': 'liquidity',
                     'severity': 'high',
@@ -293,11 +429,11 @@ class RiskAnalyzer:
                 warnings.append(
                     f'⚠️ High slippage risk on Kalshi: position is {kalshi_ratio*100:.1f}% of liquidity'
                 )
-                score += 0.2
+                liquidity_score += 0.2
 
         if poly_liq > 0:
             poly_ratio = position_size / poly_liq
-            if poly_ratio > min_liquidity_ratio:
+            if poly_ratio > MAX_LIQUIDITY_RATIO:
                 factors.append({
                     'type': 'liquidity',
                     'severity': 'high',
@@ -306,22 +442,10 @@ class RiskAnalyzer:
                 warnings.append(
                     f'⚠️ High slippage risk on Polymarket: position is {poly_ratio*100:.1f}% of liquidity'
                 )
-                score += 0.2
-
-        return {
-            'factors': factors,
-            'warnings': warnings,
-            'score': score
-        }
-
-    def _analyze_edge_risk(self, edge: float) -> Dict:
-        """Analyze if edge is adequate given risks"""
-        factors = []
-        warnings = []
-        score = 0.0
+                liquidity_score += 0.2
 
         # Very thin edges are risky
-        if edge < 0.005:  # < 0.5%
+        if edge < VERY_THIN_EDGE:  # < 0.5%
             factors.append({
                 'type': 'edge',
                 'severity': 'high',
@@ -330,8 +454,8 @@ class RiskAnalyzer:
             warnings.append(
                 f'⚠️ Edge is very thin ({edge*100:.2f}%) - vulnerable to price movement'
             )
-            score += 0.3
-        elif edge < 0.01:  # < 1%
+            edge_score += 0.3
+        elif edge < THIN_EDGE:  # < 1%
             factors.append({
                 'type': 'edge',
                 'severity': 'medium',
@@ -340,53 +464,17 @@ class RiskAnalyzer:
             warnings.append(
                 f'⚠️ Edge is thin ({edge*100:.2f}%) - limited margin for error'
             )
-            score += 0.15
-
-        return {
-            'factors': factors,
-            'warnings': warnings,
-            'score': score
-        }
-
-    def _analyze_regulatory_risk(self, polymarket_market: Dict) -> Dict:
-        """Analyze regulatory compliance risks"""
-        factors = []
-        warnings = []
-        score = 0.0
-
-        # Polymarket has geographic restrictions for US users
-        factors.append({
-            'type': 'regulatory',
-            'severity': 'medium',
-            'description': 'Polymarket has restrictions for US users'
-        })
-        warnings.append(
-            '⚠️ Ensure compliance with Polymarket geographic restrictions'
-        )
-        score += 0.1
-
-        # Election markets may have additional restrictions
-        poly_q = polymarket_market.get('question', '').lower()
-        if any(word in poly_q for word in ['election', 'vote', 'campaign', 'political']):
-            factors.append({
-                'type': 'regulatory',
-                'severity': 'medium',
-                'description': 'Political prediction markets have regulatory scrutiny'
-            })
-            score += 0.05
+            edge_score += 0.15
 
-        return {
-            'factors': factors,
-            'warnings': warnings,
-            'score': score
-        }
+        return liquidity_score, edge_score
 
-    def _analyze_time_to_resolution(
+    def _score_time_to_resolution(
         self,
-        kalshi_market: Dict,
-        polymarket_market: Dict,
-        edge: float
-    ) -> Dict:
+        end_date: Optional[str],
+        edge: float,
+        factors: List[Dict[str, str]],
+        warnings: List[str]
+    ) -> float:
         """
         Analyze time to resolution for capital efficiency
 
@@ -394,20 +482,14 @@ class RiskAnalyzer:
         Goal: Maximize compounding velocity
 
         Args:
-            kalshi_market: Kalshi market data
-            polymarket_market: Polymarket market data
+            end_date: Market end date (Kalshi first, then Polymarket)
             edge: Net edge after fees
+            factors: Risk factor list to append to
+            warnings: Warning list to append to
 
         Returns:
-            Risk assessment dict
+            Risk score contribution
         """
-        factors = []
-        warnings = []
-        score = 0.0
-
-        # Parse end dates
-        end_date = kalshi_market.get('end_date') or polymarket_market.get('end_date')
-
         if not end_date:
             # No end date - assume long-term
             factors.append({
@@ -418,12 +500,9 @@ class RiskAnalyzer:
             warnings.append(
                 '⚠️ No end date - capital may be locked long-term'
             )
-            score += 0.4
-            return {
-                'factors': factors,
-                'warnings': warnings,
-                'score': score
-            }
+            return 0.4
+
+        score = 0.0
 
         # Calculate days to resolution
         try:
@@ -520,8 +599,4 @@ class RiskAnalyzer:
             })
             score += 0.2
 
-        return {
-            'factors': factors,
-            'warnings': warnings,
-            'score': score
-        }
+        return score
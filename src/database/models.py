@@ -2,7 +2,8 @@
 
 from datetime import datetime
 from sqlalchemy import (
-    Column, Integer, String, Float, Boolean, DateTime, Text, JSON, create_engine
+    Column, Integer, SmallInteger, String, Float, Boolean, DateTime, Text, LargeBinary, Enum, Index,
+    create_engine, make_url, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -19,7 +20,7 @@ class OpportunityLog(Base):
     position_id = Column(String(100), unique=True, nullable=False, index=True)
 
     # Trading mode - CRITICAL for separating paper vs live
-    trading_mode = Column(String(20), default='paper', nullable=False, index=True)  # 'paper' or 'live'
+    trading_mode = Column(String(10), default='paper', nullable=False, index=True)  # 'paper' or 'live'
 
     # Market information
     kalshi_market_id = Column(String(100), nullable=False)
@@ -47,7 +48,13 @@ class OpportunityLog(Base):
     total_fees = Column(Float)
 
     # Status
-    status = Column(String(20), default='detected')  # detected, executing, executed, failed
+    status = Column(
+        Enum(
+            'detected', 'executing', 'executed', 'failed',
+            name='opp_status', create_constraint=True
+        ),
+        default='detected'
+    )
     executed = Column(Boolean, default=False)
 
     # Timestamps
@@ -55,7 +62,7 @@ class OpportunityLog(Base):
     executed_at = Column(DateTime)
 
     # Additional metadata
-    metadata_json = Column(JSON)
+    metadata_json = Column(LargeBinary)  # orjson-encoded
 
     def __repr__(self):
         return f"<Opportunity {self.position_id}: {self.question[:50]}>"
@@ -65,12 +72,21 @@ class TradeLog(Base):
     """Log of executed trades"""
 
     __tablename__ = 'trades'
+    __table_args__ = (
+        # Partial index covering get_open_positions() - only open rows are indexed
+        Index(
+            'ix_trade_open_status',
+            'status',
+            postgresql_where=text("status IN ('filled', 'partial')"),
+            sqlite_where=text("status IN ('filled', 'partial')")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     position_id = Column(String(100), nullable=False, index=True)
 
     # Trading mode - CRITICAL for separating paper vs live
-    trading_mode = Column(String(20), default='paper', nullable=False, index=True)  # 'paper' or 'live'
+    trading_mode = Column(String(10), default='paper', nullable=False, index=True)  # 'paper' or 'live'
 
     # Order IDs
     kalshi_order_id = Column(String(100))
@@ -82,7 +98,12 @@ class TradeLog(Base):
     actual_cost = Column(Float)
 
     # Status
-    status = Column(String(20))  # pending, filled, partial, failed, closed
+    status = Column(
+        Enum(
+            'pending', 'filled', 'partial', 'failed', 'closed',
+            name='trade_status', create_constraint=True
+        )
+    )
     success = Column(Boolean, default=False)
 
     # Error tracking
@@ -97,12 +118,26 @@ class TradeLog(Base):
     realized_pnl = Column(Float)
 
     # Additional data
-    metadata_json = Column(JSON)
+    metadata_json = Column(LargeBinary)  # orjson-encoded
 
     def __repr__(self):
         return f"<Trade {self.position_id}: {self.status}>"
 
 
+class PendingUnwind(Base):
+    """Unwind order for a partially filled trade, kept until it succeeds"""
+
+    __tablename__ = 'pending_unwinds'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    venue = Column(String(20), nullable=False)  # 'kalshi' or 'polymarket'
+    order_json = Column(LargeBinary, nullable=False)  # orjson-encoded filled order
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<PendingUnwind {self.id}: {self.venue}>"
+
+
 class BalanceSnapshot(Base):
     """Periodic snapshots of account balances"""
 
@@ -111,7 +146,7 @@ class BalanceSnapshot(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Trading mode - CRITICAL for separating paper vs live
-    trading_mode = Column(String(20), default='paper', nullable=False, index=True)  # 'paper' or 'live'
+    trading_mode = Column(String(10), default='paper', nullable=False, index=True)  # 'paper' or 'live'
 
     # Balances
     kalshi_balance = Column(Float, nullable=False)
@@ -120,7 +155,7 @@ class BalanceSnapshot(Base):
 
     # Allocations
     locked_capital = Column(Float, default=0.0)
-    open_positions = Column(Integer, default=0)
+    open_positions = Column(SmallInteger, default=0)  # bounded by risk.max_open_positions
 
     # P&L
     realized_pnl = Column(Float, default=0.0)
@@ -132,7 +167,7 @@ class BalanceSnapshot(Base):
     snapshot_at = Column(DateTime, default=datetime.utcnow, index=True)
 
     # Additional metadata
-    metadata_json = Column(JSON)
+    metadata_json = Column(LargeBinary)  # orjson-encoded
 
     def __repr__(self):
         return f"<BalanceSnapshot ${self.total_balance:.2f} @ {self.snapshot_at}>"
@@ -146,7 +181,7 @@ class PerformanceMetrics(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Period
-    period = Column(String(20), nullable=False)  # daily, weekly, monthly
+    period = Column(String(10), nullable=False)  # daily, weekly, monthly
     period_start = Column(DateTime, nullable=False, index=True)
     period_end = Column(DateTime, nullable=False)
 
@@ -180,18 +215,30 @@ class PerformanceMetrics(Base):
         return f"<PerformanceMetrics {self.period} {self.period_start.date()}>"
 
 
-def init_database(database_url: str = "sqlite:///data/arbitrage.db"):
+def init_database(
+    database_url: str = "sqlite:///data/arbitrage.db",
+    pool_size: int = 10,
+    max_overflow: int = 20
+):
     """
     Initialize database and create tables
 
     Args:
         database_url: SQLAlchemy database URL
+        pool_size: Connections kept open in the pool (ignored for SQLite)
+        max_overflow: Extra connections allowed under load (ignored for SQLite)
 
     Returns:
         Tuple of (engine, Session)
     """
+    engine_kwargs = {'echo': False, 'pool_pre_ping': True}
+
+    # SQLite picks its own pool class; sizing only applies to server databases
+    if make_url(database_url).get_backend_name() != 'sqlite':
+        engine_kwargs.update(pool_size=pool_size, max_overflow=max_overflow)
+
     # Create engine
-    engine = create_engine(database_url, echo=False)
+    engine = create_engine(database_url, **engine_kwargs)
 
     # Create all tables
     Base.metadata.create_all(engine)
@@ -1,11 +1,12 @@
 """Database repository for data access"""
 
-from typing import List, Optional, Dict
+from typing import Iterator, List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import case, delete, desc, func, select
+import orjson
 from src.database.models import (
-    OpportunityLog, TradeLog, BalanceSnapshot, PerformanceMetrics
+    OpportunityLog, TradeLog, PendingUnwind, BalanceSnapshot, PerformanceMetrics
 )
 from src.arbitrage.detector import ArbitrageOpportunity
 from src.execution.executor import ExecutionResult
@@ -18,21 +19,55 @@ logger = setup_logger("database")
 class ArbitrageRepository:
     """Repository for arbitrage data access"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session_factory: sessionmaker):
         """
         Initialize repository
 
+        Each call opens its own short-lived session from the factory, so
+        connections go back to the pool between writes instead of one
+        session being held for the life of the process.
+
         Args:
-            session: SQLAlchemy session
+            session_factory: SQLAlchemy session factory
+        """
+        self.session_factory = session_factory
+
+        # Core INSERT statements built once and reused for every save
+        self._opp_insert = OpportunityLog.__table__.insert()
+        self._trade_insert = TradeLog.__table__.insert()
+        self._snapshot_insert = BalanceSnapshot.__table__.insert()
+        self._unwind_insert = PendingUnwind.__table__.insert()
+
+        # Fetch new primary keys via INSERT ... RETURNING where supported
+        with session_factory() as session:
+            bind = session.get_bind()
+        self._use_returning = bool(bind is not None and bind.dialect.insert_returning)
+
+    def _insert(self, session: Session, statement, values: Dict, pk_column) -> int:
+        """
+        Execute a cached INSERT and return the new primary key
+
+        Args:
+            session: Session to execute in
+            statement: Cached Core insert statement
+            values: Column values
+            pk_column: Primary key column to return
+
+        Returns:
+            Primary key of the inserted row
         """
-        self.session = session
+        if self._use_returning:
+            return session.execute(statement.returning(pk_column), values).scalar_one()
+
+        result = session.execute(statement, values)
+        return result.inserted_primary_key[0]
 
     def save_opportunity(
         self,
         opportunity: ArbitrageOpportunity,
         position_id: str,
         trading_mode: str = 'paper'
-    ) -> OpportunityLog:
+    ) -> int:
         """
         Save arbitrage opportunity to database
 
@@ -42,43 +77,42 @@ class ArbitrageRepository:
             trading_mode: 'paper' or 'live' trading mode
 
         Returns:
-            OpportunityLog object
+            ID of the new OpportunityLog row
         """
         try:
-            opp_log = OpportunityLog(
-                position_id=position_id,
-                trading_mode=trading_mode,
-                kalshi_market_id=opportunity.kalshi_market_id,
-                polymarket_market_id=opportunity.polymarket_market_id,
-                question=opportunity.question,
-                end_date=opportunity.end_date,
-                similarity_score=opportunity.similarity_score,
-                kalshi_yes_price=opportunity.kalshi_yes_price,
-                polymarket_no_price=opportunity.polymarket_no_price,
-                spread=opportunity.spread,
-                edge=opportunity.edge,
-                position_size_usd=opportunity.position_size_usd,
-                kalshi_contracts=opportunity.kalshi_contracts,
-                polymarket_size=opportunity.polymarket_size,
-                expected_profit=opportunity.expected_profit,
-                expected_roi=opportunity.expected_roi,
-                total_fees=opportunity.total_fees,
-                detected_at=opportunity.detected_at,
-                metadata_json=opportunity.to_dict()
-            )
-
-            self.session.add(opp_log)
-            self.session.commit()
+            values = {
+                'position_id': position_id,
+                'trading_mode': trading_mode,
+                'kalshi_market_id': opportunity.kalshi_market_id,
+                'polymarket_market_id': opportunity.polymarket_market_id,
+                'question': opportunity.question,
+                'end_date': opportunity.end_date,
+                'similarity_score': opportunity.similarity_score,
+                'kalshi_yes_price': opportunity.kalshi_yes_price,
+                'polymarket_no_price': opportunity.polymarket_no_price,
+                'spread': opportunity.spread,
+                'edge': opportunity.edge,
+                'position_size_usd': opportunity.position_size_usd,
+                'kalshi_contracts': opportunity.kalshi_contracts,
+                'polymarket_size': opportunity.polymarket_size,
+                'expected_profit': opportunity.expected_profit,
+                'expected_roi': opportunity.expected_roi,
+                'total_fees': opportunity.total_fees,
+                'detected_at': opportunity.detected_at,
+                'metadata_json': opportunity.to_json_bytes()
+            }
+
+            with self.session_factory.begin() as session:
+                opp_id = self._insert(session, self._opp_insert, values, OpportunityLog.id)
 
             logger.debug(f"Saved opportunity {position_id} to database")
-            return opp_log
+            return opp_id
 
         except Exception as e:
             logger.error(f"Error saving opportunity: {e}")
-            self.session.rollback()
             raise
 
-    def save_trade(self, result: ExecutionResult, trading_mode: str = 'paper') -> TradeLog:
+    def save_trade(self, result: ExecutionResult, trading_mode: str = 'paper') -> int:
         """
         Save trade execution result
 
@@ -87,36 +121,43 @@ class ArbitrageRepository:
             trading_mode: 'paper' or 'live' trading mode
 
         Returns:
-            TradeLog object
+            ID of the new TradeLog row
         """
-        try:
-            trade_log = TradeLog(
-                position_id=result.position_id,
-                trading_mode=trading_mode,
-                kalshi_order_id=result.kalshi_order_id,
-                polymarket_order_id=result.polymarket_order_id,
-                kalshi_filled=result.kalshi_filled,
-                polymarket_filled=result.polymarket_filled,
-                actual_cost=result.actual_cost,
-                status='filled' if result.success else 'failed',
-                success=result.success,
-                error_message=result.error_message,
-                filled_at=result.executed_at,
-                metadata_json=result.to_dict()
-            )
+        # Submitted trades stay pending until update_trade_fills confirms them
+        if not result.success:
+            status = 'failed'
+        elif result.fully_filled:
+            status = 'filled'
+        else:
+            status = 'pending'
 
-            self.session.add(trade_log)
-            self.session.commit()
+        try:
+            values = {
+                'position_id': result.position_id,
+                'trading_mode': trading_mode,
+                'kalshi_order_id': result.kalshi_order_id,
+                'polymarket_order_id': result.polymarket_order_id,
+                'kalshi_filled': result.kalshi_filled,
+                'polymarket_filled': result.polymarket_filled,
+                'actual_cost': result.actual_cost,
+                'status': status,
+                'success': result.success,
+                'error_message': result.error_message,
+                'filled_at': result.executed_at,
+                'metadata_json': result.to_json_bytes()
+            }
+
+            with self.session_factory.begin() as session:
+                trade_id = self._insert(session, self._trade_insert, values, TradeLog.id)
 
             # Update opportunity status
             self._update_opportunity_status(result.position_id, result.success)
 
             logger.debug(f"Saved trade {result.position_id} to database")
-            return trade_log
+            return trade_id
 
         except Exception as e:
             logger.error(f"Error saving trade: {e}")
-            self.session.rollback()
             raise
 
     def _update_opportunity_status(self, position_id: str, success: bool) -> None:
@@ -128,19 +169,54 @@ class ArbitrageRepository:
             success: Whether execution was successful
         """
         try:
-            opp = self.session.query(OpportunityLog).filter_by(
-                position_id=position_id
-            ).first()
+            with self.session_factory.begin() as session:
+                opp = session.query(OpportunityLog).filter_by(
+                    position_id=position_id
+                ).first()
 
-            if opp:
-                opp.status = 'executed' if success else 'failed'
-                opp.executed = success
-                opp.executed_at = datetime.utcnow()
-                self.session.commit()
+                if opp:
+                    opp.status = 'executed' if success else 'failed'
+                    opp.executed = success
+                    opp.executed_at = datetime.utcnow()
 
         except Exception as e:
             logger.error(f"Error updating opportunity status: {e}")
-            self.session.rollback()
+
+    def update_trade_fills(
+        self,
+        position_id: str,
+        kalshi_filled: bool,
+        polymarket_filled: bool
+    ) -> None:
+        """
+        Record reconciled fill status for a submitted trade
+
+        A trade with one leg filled is marked partial (that leg is being
+        unwound); one with neither leg filled was cancelled and is marked failed.
+
+        Args:
+            position_id: Position identifier
+            kalshi_filled: Whether the Kalshi leg filled
+            polymarket_filled: Whether the Polymarket leg filled
+        """
+        try:
+            with self.session_factory.begin() as session:
+                trade = session.query(TradeLog).filter_by(
+                    position_id=position_id
+                ).first()
+
+                if trade:
+                    trade.kalshi_filled = kalshi_filled
+                    trade.polymarket_filled = polymarket_filled
+                    if kalshi_filled and polymarket_filled:
+                        trade.status = 'filled'
+                    elif kalshi_filled or polymarket_filled:
+                        trade.status = 'partial'
+                    else:
+                        trade.status = 'failed'
+
+        except Exception as e:
+            logger.error(f"Error updating trade fills: {e}")
 
     def close_position(self, position_id: str, pnl: float) -> None:
         """
@@ -151,23 +227,75 @@ class ArbitrageRepository:
             pnl: Realized profit/loss
         """
         try:
-            trade = self.session.query(TradeLog).filter_by(
-                position_id=position_id
-            ).first()
+            with self.session_factory.begin() as session:
+                trade = session.query(TradeLog).filter_by(
+                    position_id=position_id
+                ).first()
 
-            if trade:
-                trade.status = 'closed'
-                trade.closed_at = datetime.utcnow()
-                trade.realized_pnl = pnl
-                self.session.commit()
+                if trade:
+                    trade.status = 'closed'
+                    trade.closed_at = datetime.utcnow()
+                    trade.realized_pnl = pnl
 
+            if trade:
                 logger.info(f"Closed position {position_id} with P&L: ${pnl:.2f}")
 
         except Exception as e:
             logger.error(f"Error closing position: {e}")
-            self.session.rollback()
 
-    def save_balance_snapshot(self, portfolio: PortfolioState, trading_mode: str = 'paper') -> BalanceSnapshot:
+    def save_pending_unwind(self, venue: str, order: Dict) -> Optional[int]:
+        """
+        Record an unwind order so it survives a restart until it succeeds
+
+        Args:
+            venue: Exchange of the filled leg ('kalshi' or 'polymarket')
+            order: Filled order data needed to place the offsetting order
+
+        Returns:
+            ID of the new PendingUnwind row, or None if it could not be saved
+        """
+        try:
+            with self.session_factory.begin() as session:
+                return self._insert(
+                    session, self._unwind_insert,
+                    {'venue': venue, 'order_json': orjson.dumps(order)},
+                    PendingUnwind.id
+                )
+
+        except Exception as e:
+            logger.error(f"Error saving pending unwind: {e}")
+            return None
+
+    def delete_pending_unwind(self, unwind_id: int) -> None:
+        """
+        Remove a pending unwind once its offsetting order is placed
+
+        Args:
+            unwind_id: PendingUnwind row ID
+        """
+        try:
+            with self.session_factory.begin() as session:
+                session.execute(delete(PendingUnwind).where(PendingUnwind.id == unwind_id))
+
+        except Exception as e:
+            logger.error(f"Error deleting pending unwind: {e}")
+
+    def get_pending_unwinds(self) -> List[Tuple[int, str, Dict]]:
+        """
+        Get unwinds left over from earlier runs
+
+        Returns:
+            (id, venue, order data) tuples, oldest first
+        """
+        with self.session_factory() as session:
+            rows = session.execute(
+                select(PendingUnwind.id, PendingUnwind.venue, PendingUnwind.order_json)
+                .order_by(PendingUnwind.id)
+            ).all()
+
+        return [(row.id, row.venue, orjson.loads(row.order_json)) for row in rows]
+
+    def save_balance_snapshot(self, portfolio: PortfolioState, trading_mode: str = 'paper') -> int:
         """
         Save portfolio balance snapshot
 
@@ -176,32 +304,33 @@ class ArbitrageRepository:
             trading_mode: 'paper' or 'live' trading mode
 
         Returns:
-            BalanceSnapshot object
+            ID of the new BalanceSnapshot row
         """
         try:
-            snapshot = BalanceSnapshot(
-                trading_mode=trading_mode,
-                kalshi_balance=portfolio.kalshi_balance,
-                polymarket_balance=portfolio.polymarket_balance,
-                total_balance=portfolio.total_balance,
-                locked_capital=portfolio.locked_capital,
-                open_positions=portfolio.open_positions,
-                realized_pnl=portfolio.realized_pnl,
-                unrealized_pnl=portfolio.unrealized_pnl,
-                total_pnl=portfolio.total_pnl,
-                daily_pnl=portfolio.daily_pnl,
-                metadata_json=portfolio.to_dict()
-            )
-
-            self.session.add(snapshot)
-            self.session.commit()
+            values = {
+                'trading_mode': trading_mode,
+                'kalshi_balance': portfolio.kalshi_balance,
+                'polymarket_balance': portfolio.polymarket_balance,
+                'total_balance': portfolio.total_balance,
+                'locked_capital': portfolio.locked_capital,
+                'open_positions': portfolio.open_positions,
+                'realized_pnl': portfolio.realized_pnl,
+                'unrealized_pnl': portfolio.unrealized_pnl,
+                'total_pnl': portfolio.total_pnl,
+                'daily_pnl': portfolio.daily_pnl,
+                'metadata_json': portfolio.to_json_bytes()
+            }
+
+            with self.session_factory.begin() as session:
+                snapshot_id = self._insert(
+                    session, self._snapshot_insert, values, BalanceSnapshot.id
+                )
 
             logger.debug("Saved balance snapshot to database")
-            return snapshot
+            return snapshot_id
 
         except Exception as e:
             logger.error(f"Error saving balance snapshot: {e}")
-            self.session.rollback()
             raise
 
     def get_recent_opportunities(self, limit: int = 100, trading_mode: Optional[str] = None) -> List[OpportunityLog]:
@@ -215,33 +344,38 @@ class ArbitrageRepository:
         Returns:
             List of OpportunityLog objects
         """
-        query = self.session.query(OpportunityLog)
+        with self.session_factory() as session:
+            query = session.query(OpportunityLog)
 
-        if trading_mode:
-            query = query.filter(OpportunityLog.trading_mode == trading_mode)
+            if trading_mode:
+                query = query.filter(OpportunityLog.trading_mode == trading_mode)
 
-        return query.order_by(
-            desc(OpportunityLog.detected_at)
-        ).limit(limit).all()
+            return query.order_by(
+                desc(OpportunityLog.detected_at)
+            ).limit(limit).all()
 
-    def get_open_positions(self, trading_mode: Optional[str] = None) -> List[TradeLog]:
+    def get_open_positions(self, trading_mode: Optional[str] = None) -> Iterator[TradeLog]:
         """
         Get all open positions
 
+        Rows are streamed in batches of 500 rather than loaded all at once;
+        wrap the result in list() if you need len() or random access.
+
         Args:
             trading_mode: Filter by 'paper' or 'live' (None = all)
 
         Returns:
-            List of TradeLog objects
+            Iterator of TradeLog objects
         """
-        query = self.session.query(TradeLog).filter(
-            TradeLog.status.in_(['filled', 'partial'])
-        )
+        with self.session_factory() as session:
+            query = session.query(TradeLog).filter(
+                TradeLog.status.in_(['filled', 'partial'])
+            )
 
-        if trading_mode:
-            query = query.filter(TradeLog.trading_mode == trading_mode)
+            if trading_mode:
+                query = query.filter(TradeLog.trading_mode == trading_mode)
 
-        return query.all()
+            yield from query.yield_per(500)
 
     def get_performance_summary(self, days: int = 30, trading_mode: Optional[str] = None) -> Dict:
         """
@@ -256,37 +390,40 @@ class ArbitrageRepository:
         """
         cutoff = datetime.utcnow() - timedelta(days=days)
 
-        # Count opportunities and trades
-        opps_query = self.session.query(OpportunityLog).filter(
+        opps_query = select(func.count(OpportunityLog.id)).where(
             OpportunityLog.detected_at >= cutoff
         )
-        trades_query = self.session.query(TradeLog).filter(
-            TradeLog.created_at >= cutoff
-        )
-
-        if trading_mode:
-            opps_query = opps_query.filter(OpportunityLog.trading_mode == trading_mode)
-            trades_query = trades_query.filter(TradeLog.trading_mode == trading_mode)
 
-        opps = opps_query.all()
-        trades = trades_query.all()
+        # Aggregate in the database instead of loading every trade row
+        closed = (TradeLog.status == 'closed') & TradeLog.realized_pnl.is_not(None)
+        trades_query = select(
+            func.count(TradeLog.id),
+            func.count(case((TradeLog.success.is_(True), 1))),
+            func.count(case((closed, 1))),
+            func.coalesce(func.sum(case((closed, TradeLog.realized_pnl))), 0),
+            func.coalesce(func.sum(TradeLog.actual_cost), 0)
+        ).where(TradeLog.created_at >= cutoff)
 
-        successful_trades = [t for t in trades if t.success]
-        closed_trades = [t for t in trades if t.status == 'closed' and t.realized_pnl is not None]
+        if trading_mode:
+            opps_query = opps_query.where(OpportunityLog.trading_mode == trading_mode)
+            trades_query = trades_query.where(TradeLog.trading_mode == trading_mode)
 
-        total_pnl = sum(t.realized_pnl for t in closed_trades)
-        total_volume = sum(t.actual_cost for t in trades if t.actual_cost)
+        with self.session_factory() as session:
+            opps_count = session.execute(opps_query).scalar_one()
+            trades_count, successful_count, closed_count, total_pnl, total_volume = (
+                session.execute(trades_query).one()
+            )
 
         return {
             'period_days': days,
-            'opportunities_detected': len(opps),
-            'trades_executed': len(trades),
-            'trades_successful': len(successful_trades),
-            'trades_closed': len(closed_trades),
+            'opportunities_detected': opps_count,
+            'trades_executed': trades_count,
+            'trades_successful': successful_count,
+            'trades_closed': closed_count,
             'total_pnl': total_pnl,
             'total_volume': total_volume,
-            'win_rate': len(successful_trades) / len(trades) if trades else 0,
-            'avg_profit': total_pnl / len(closed_trades) if closed_trades else 0
+            'win_rate': successful_count / trades_count if trades_count else 0,
+            'avg_profit': total_pnl / closed_count if closed_count else 0
         }
 
     def get_latest_balance(self, trading_mode: Optional[str] = None) -> Optional[BalanceSnapshot]:
@@ -299,11 +436,12 @@ class ArbitrageRepository:
         Returns:
             BalanceSnapshot object or None
         """
-        query = self.session.query(BalanceSnapshot)
+        with self.session_factory() as session:
+            query = session.query(BalanceSnapshot)
 
-        if trading_mode:
-            query = query.filter(BalanceSnapshot.trading_mode == trading_mode)
+            if trading_mode:
+                query = query.filter(BalanceSnapshot.trading_mode == trading_mode)
 
-        return query.order_by(
-            desc(BalanceSnapshot.snapshot_at)
-        ).first()
+            return query.order_by(
+                desc(BalanceSnapshot.snapshot_at)
+            ).first()
@@ -1,16 +1,18 @@
 """Main arbitrage engine orchestration"""
 
 import asyncio
-from typing import Dict, List, Optional
-from datetime import datetime
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+import time
+import numpy as np
+from typing import Dict, List, Optional, Set
+from datetime import datetime, timedelta
 from src.api.kalshi_client import KalshiClient
 from src.api.polymarket_client import PolymarketClient
 from src.arbitrage.matcher import EventMatcher
 from src.arbitrage.detector import ArbitrageDetector
-from src.execution.executor import TradeExecutor
+from src.execution.executor import make_executor
 from src.execution.capital_manager import CapitalManager
 from src.execution.circuit_breaker import CircuitBreaker, TradingHaltException
+from src.execution.state_store import RedisStateStore
 from src.database.models import init_database
 from src.database.repository import ArbitrageRepository
 from src.monitoring.alerts import AlertManager
@@ -60,20 +62,37 @@ class ArbitrageEngine:
 
         self.detector = ArbitrageDetector(config._config)
 
-        self.executor = TradeExecutor(
+        # Initialize database
+        engine, SessionFactory = init_database(
+            config.database_url,
+            pool_size=config.get('database.pool_size', 10),
+            max_overflow=config.get('database.max_overflow', 20)
+        )
+        self.db_engine = engine
+        self.repository = ArbitrageRepository(SessionFactory)
+
+        self.executor = make_executor(
             kalshi_client=self.kalshi,
             polymarket_client=self.polymarket,
             config=config._config,
-            dry_run=dry_run
+            dry_run=dry_run,
+            on_reconciled=self._on_trade_reconciled,
+            unwind_journal=self.repository
         )
 
         self.capital_manager = CapitalManager(config._config)
 
+        # Share halts across processes when a state store is configured
+        shared_state_url = config.get('risk.shared_state_url')
+        self.breaker_state_store = RedisStateStore(shared_state_url) if shared_state_url else None
+        self.breaker_sync_interval = config.get('risk.shared_state_sync_sec', 1.0)
+
         # Initialize circuit breaker for loss protection
         self.circuit_breaker = CircuitBreaker(
             max_daily_loss_pct=config.get('risk.max_daily_loss_pct', 0.05),
             max_drawdown_pct=0.15,  # Additional 15% drawdown protection
-            reset_hour=0  # Reset at midnight
+            reset_hour=0,  # Reset at midnight
+            state_store=self.breaker_state_store
         )
 
         self.alert_manager = AlertManager({
@@ -82,21 +101,62 @@ class ArbitrageEngine:
             'telegram_chat_id': config.telegram_chat_id
         })
 
-        # Initialize database
-        engine, SessionFactory = init_database(config.database_url)
-        self.session = SessionFactory()
-        self.repository = ArbitrageRepository(self.session)
-
-        # Scheduler for periodic tasks
-        self.scheduler = AsyncIOScheduler()
+        # Periodic background tasks, created in start()
+        self._timer_tasks: List[asyncio.Task] = []
 
         # State
         self.running = False
+        self._wakeup = asyncio.Event()  # Set to start the next iteration early
         self.poll_interval = config.get('polling.interval_sec', 30)
 
-        logger.info(
-            f"Arbitrage Engine initialized (dry_run={dry_run})"
-        )
+        # Price streams: quotes pushed by each exchange wake the loop, and scans
+        # between market refreshes reuse the last matches and read these tables
+        self.price_streams = config.get('polling.price_streams', True)
+        self.min_scan_gap = config.get('polling.min_scan_gap_sec', 0.5)
+        self._live_prices: Dict[str, Dict[str, float]] = {'kalshi': {}, 'polymarket': {}}
+        self._stream_tasks: Dict[str, asyncio.Task] = {}
+        self._stream_ids: Dict[str, frozenset] = {}
+        self._matched_markets: Optional[List] = None
+        self._last_market_refresh = 0.0
+        self._last_executed: Dict[tuple, float] = {}  # (kalshi id, poly id) -> monotonic time
+
+        # Submitted trades awaiting fill confirmation: executor position id ->
+        # (capital position id, opportunity)
+        self._submitted: Dict[str, tuple] = {}
+
+        # Market fetch filters, pushed down to each client's get_markets()
+        market_filters = config.get('polling.market_filters') or {}
+        shared_filters = {
+            'limit': market_filters.get('limit', 100),
+            'max_days_to_close': market_filters.get('max_days_to_close')
+        }
+        self.kalshi_market_filters = {
+            **shared_filters, **(market_filters.get('kalshi') or {})
+        }
+        self.poly_market_filters = {
+            **shared_filters, **(market_filters.get('polymarket') or {})
+        }
+
+        # Fire-and-forget side effects (alerts); kept referenced until done
+        self._bg_tasks: Set[asyncio.Task] = set()
+
+        # Cap on in-flight exchange requests during a scan
+        self._request_semaphore = asyncio.Semaphore(config.get('polling.max_concurrent', 50))
+
+        # Recent price lookups: (exchange, market_id, side) -> (task, fetched at)
+        self._price_cache: Dict[tuple, tuple] = {}
+        self._price_cache_ttl = config.get('polling.price_cache_ttl_sec', 1.0)
+
+        # Normalized markets from earlier iterations, keyed on each client's market_cache_key()
+        self._kalshi_norm_cache: Dict[tuple, Dict] = {}
+        self._poly_norm_cache: Dict[tuple, Dict] = {}
+        self._norm_cache_size = config.get('polling.norm_cache_size', 4096)
+
+        # Last matcher result: (kalshi fingerprint, poly fingerprint, computed at, id pairs)
+        self._match_cache: Optional[tuple] = None
+        self._match_cache_ttl = config.get('polling.match_cache_ttl_sec', 300)
+
+        logger.info("Arbitrage Engine initialized (dry_run=%s)", dry_run)
 
     async def start(self):
         """Start the arbitrage engine"""
@@ -104,9 +164,11 @@ class ArbitrageEngine:
 
         self.running = True
 
-        # Authenticate with exchanges
+        # Authenticate with exchanges, then finish unwinds left by an earlier run
         if not self.dry_run:
             await self._authenticate()
+            await self.executor.warmup()
+            self.executor.recover_unwinds()
 
         # Test alert system
         if await self.alert_manager.test_connection():
@@ -115,9 +177,6 @@ class ArbitrageEngine:
         # Schedule periodic tasks
         self._schedule_tasks()
 
-        # Start scheduler
-        self.scheduler.start()
-
         # Run main loop
         await self._run_loop()
 
@@ -126,16 +185,29 @@ class ArbitrageEngine:
         logger.info("Stopping Arbitrage Engine...")
 
         self.running = False
+        self._wakeup.set()
 
-        # Shutdown scheduler
-        self.scheduler.shutdown()
+        # Cancel periodic tasks and price streams
+        background = self._timer_tasks + list(self._stream_tasks.values())
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+        self._timer_tasks = []
+        self._stream_tasks = {}
+        self._stream_ids = {}
 
-        # Close API clients
-        await self.kalshi.close()
-        await self.polymarket.close()
+        # Let in-flight alerts finish before their clients go away
+        if self._bg_tasks:
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
 
-        # Close database session
-        self.session.close()
+        # Flush queued alerts
+        await self.alert_manager.close()
+
+        # Stop fill reconciliation and close API clients
+        await self.executor.close()
+
+        # Release pooled database connections
+        self.db_engine.dispose()
 
         logger.info("Arbitrage Engine stopped")
 
@@ -157,68 +229,108 @@ class ArbitrageEngine:
 
     def _schedule_tasks(self):
         """Schedule periodic background tasks"""
+        self._timer_tasks = [
+            # Update balances every 5 minutes
+            asyncio.create_task(self._periodic(300, self._update_balances)),
+            # Save balance snapshot every 15 minutes
+            asyncio.create_task(self._periodic(900, self._save_balance_snapshot)),
+            # Send daily summary at midnight
+            asyncio.create_task(self._daily(0, 0, self._send_daily_summary)),
+            # Reset daily metrics at midnight
+            asyncio.create_task(self._daily(0, 1, self._reset_daily_metrics)),
+        ]
+
+        if self.breaker_state_store:
+            # Pick up halts raised by other processes
+            self._timer_tasks.append(asyncio.create_task(
+                self._periodic(self.breaker_sync_interval, self._sync_breaker_state)
+            ))
 
-        # Update balances every 5 minutes
-        self.scheduler.add_job(
-            self._update_balances,
-            'interval',
-            minutes=5,
-            id='update_balances'
-        )
+        logger.info("Scheduled background tasks")
 
-        # Save balance snapshot every 15 minutes
-        self.scheduler.add_job(
-            self._save_balance_snapshot,
-            'interval',
-            minutes=15,
-            id='save_snapshot'
-        )
+    async def _periodic(self, interval_sec: float, job):
+        """
+        Run a job every interval_sec seconds while the engine is running
 
-        # Send daily summary at midnight
-        self.scheduler.add_job(
-            self._send_daily_summary,
-            'cron',
-            hour=0,
-            minute=0,
-            id='daily_summary'
-        )
+        Args:
+            interval_sec: Seconds between runs
+            job: Coroutine function to run
+        """
+        while self.running:
+            await asyncio.sleep(interval_sec)
+            await self._run_job(job)
 
-        # Reset daily metrics at midnight
-        self.scheduler.add_job(
-            self._reset_daily_metrics,
-            'cron',
-            hour=0,
-            minute=1,
-            id='reset_daily'
-        )
+    async def _daily(self, hour: int, minute: int, job):
+        """
+        Run a job once a day at a fixed local time while the engine is running
 
-        logger.info("Scheduled background tasks")
+        Args:
+            hour: Hour of day (0-23)
+            minute: Minute of hour (0-59)
+            job: Coroutine function to run
+        """
+        while self.running:
+            now = datetime.now()
+            next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+            if next_run <= now:
+                next_run += timedelta(days=1)
+
+            await asyncio.sleep((next_run - now).total_seconds())
+            await self._run_job(job)
+
+    async def _run_job(self, job):
+        """Run a scheduled job, logging rather than propagating its errors"""
+        try:
+            await job()
+        except Exception as e:
+            logger.error("Scheduled job %s failed: %s", job.__name__, e, exc_info=True)
 
     async def _run_loop(self):
         """Main execution loop"""
-        logger.info(f"Starting main loop (interval: {self.poll_interval}s)")
+        logger.info("Starting main loop (interval: %ss)", self.poll_interval)
 
         iteration = 0
 
         while self.running:
             try:
                 iteration += 1
-                logger.info(f"=== Iteration {iteration} ===")
+                logger.info("=== Iteration %d ===", iteration)
 
                 # Run one scan cycle
                 await self._scan_and_execute()
 
                 # Wait for next iteration
-                await asyncio.sleep(self.poll_interval)
+                await self._wait_for_next_iteration()
 
             except KeyboardInterrupt:
                 logger.info("Received interrupt signal")
                 break
 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}", exc_info=True)
+                logger.error("Error in main loop: %s", e, exc_info=True)
                 await self.alert_manager.send_error_alert("Main Loop Error", str(e))
-                await asyncio.sleep(self.poll_interval)
+                await self._wait_for_next_iteration()
+
+    async def _wait_for_next_iteration(self):
+        """Sleep until the poll interval elapses or notify_price_update()/stop() wakes us"""
+        # Bounds how often a burst of streamed quotes can trigger a scan
+        await asyncio.sleep(self.min_scan_gap)
+        try:
+            await asyncio.wait_for(
+                self._wakeup.wait(), timeout=max(self.poll_interval - self.min_scan_gap, 0)
+            )
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._wakeup.clear()
+
+    def notify_price_update(self):
+        """
+        Trigger a scan immediately instead of waiting for the poll interval
+
+        Intended to be called from exchange price-stream callbacks.
+        """
+        self._wakeup.set()
 
     async def _scan_and_execute(self):
         """Scan for opportunities and execute trades"""
@@ -231,63 +343,49 @@ class ArbitrageEngine:
                 current_pnl=portfolio.total_pnl
             )
         except TradingHaltException as e:
-            logger.error(f"🛑 Trading halted by circuit breaker: {e}")
+            logger.error("🛑 Trading halted by circuit breaker: %s", e)
             await self.alert_manager.send_error_alert(
                 "Circuit Breaker Triggered",
                 str(e)
             )
             # Stop the engine
             self.running = False
+            self._wakeup.set()
             return
 
-        # 1. Fetch markets from both exchanges
-        logger.info("Fetching markets...")
-        kalshi_markets, poly_markets = await asyncio.gather(
-            self.kalshi.get_markets(limit=100),
-            self.polymarket.get_markets(limit=100)
-        )
-
-        logger.info(
-            f"Fetched {len(kalshi_markets)} Kalshi markets, "
-            f"{len(poly_markets)} Polymarket markets"
-        )
-
-        if not kalshi_markets or not poly_markets:
-            logger.warning("No markets fetched, skipping iteration")
-            return
-
-        # 2. Normalize markets
-        normalized_kalshi = [self.kalshi.normalize_market(m) for m in kalshi_markets]
-        normalized_poly = [self.polymarket.normalize_market(m) for m in poly_markets]
-
-        # 3. Find matching events
-        logger.info("Matching events across exchanges...")
-        matched_markets = self.matcher.find_matches(
-            normalized_kalshi,
-            normalized_poly
-        )
+        # 1-3. Refresh the market universe once per poll interval; scans woken
+        # by streamed quotes in between reuse the last matches
+        refresh_due = time.monotonic() - self._last_market_refresh >= self.poll_interval
+        if self._matched_markets is None or refresh_due:
+            self._matched_markets = await self._refresh_matches()
+            self._last_market_refresh = time.monotonic()
 
+        matched_markets = self._matched_markets
         if not matched_markets:
-            logger.info("No matching markets found")
             return
 
         # 4. Get current prices
         logger.info("Fetching current prices...")
-        kalshi_prices = {}
-        poly_prices = {}
-
-        for km, pm, _ in matched_markets:
-            # Fetch prices concurrently for each matched pair
-            k_price, p_price = await asyncio.gather(
-                self.kalshi.get_best_price(km['market_id'], 'yes'),
-                self.polymarket.get_best_price(pm['market_id'], 'sell')  # NO price
-            )
+        # Prices aligned with matched_markets; NaN marks a missing quote
+        kalshi_prices = np.full(len(matched_markets), np.nan)
+        poly_prices = np.full(len(matched_markets), np.nan)
+
+        # Live streamed quotes first, then one batched request per exchange for the rest
+        kalshi_ids = [km['market_id'] for km, _, _ in matched_markets]
+        poly_ids = [pm['market_id'] for _, pm, _ in matched_markets]
+        kalshi_quotes, poly_quotes = await asyncio.gather(
+            self._current_prices('kalshi', self.kalshi, kalshi_ids, 'yes'),
+            self._current_prices('polymarket', self.polymarket, poly_ids, 'sell')  # NO price
+        )
 
+        for i, (kalshi_id, poly_id) in enumerate(zip(kalshi_ids, poly_ids)):
+            k_price = kalshi_quotes.get(kalshi_id)
             if k_price is not None:
-                kalshi_prices[km['market_id']] = k_price
+                kalshi_prices[i] = k_price
 
+            p_price = poly_quotes.get(poly_id)
             if p_price is not None:
-                poly_prices[pm['market_id']] = p_price
+                poly_prices[i] = p_price
 
         # 5. Detect arbitrage opportunities
         logger.info("Scanning for arbitrage opportunities...")
@@ -307,23 +405,384 @@ class ArbitrageEngine:
         # 6. Execute top opportunities
         auto_execute = self.config.get('trading.auto_execute', False)
 
+        # Streamed quotes can trigger scans seconds apart; act on a pair at most
+        # once per poll interval, as the polling loop did
+        now = time.monotonic()
+        self._last_executed = {
+            pair: at for pair, at in self._last_executed.items()
+            if now - at < self.poll_interval
+        }
+        opportunities = [
+            opp for opp in opportunities
+            if (opp.kalshi_market_id, opp.polymarket_market_id) not in self._last_executed
+        ]
+
+        executions = []
         for opp in opportunities[:5]:  # Execute top 5 opportunities
-            # Generate position ID
-            position_id = f"arb_{int(datetime.now().timestamp())}_{opp.kalshi_market_id[:8]}"
+            self._last_executed[(opp.kalshi_market_id, opp.polymarket_market_id)] = now
+
+            # Generate position ID; nanosecond wall time keeps IDs unique across restarts
+            position_id = f"arb_{time.time_ns()}_{opp.kalshi_market_id[:8]}"
 
             # Save opportunity to database with trading mode
             self.repository.save_opportunity(opp, position_id, trading_mode=self.trading_mode)
 
-            # Send alert
-            await self.alert_manager.send_opportunity_alert(opp)
+            # Send alert in the background so it doesn't delay execution
+            if self.alert_manager.should_alert(opp.edge, opp.expected_profit):
+                self._spawn(self.alert_manager.send_opportunity_alert(opp))
 
             # Execute if auto-execute enabled
             if auto_execute or self.dry_run:
-                await self._execute_opportunity(opp, position_id)
+                executions.append((position_id, self._execute_opportunity(opp, position_id)))
             else:
-                logger.info(
-                    f"Auto-execute disabled, skipping execution of {position_id}"
-                )
+                logger.info("Auto-execute disabled, skipping execution of %s", position_id)
+
+        # Capital is checked and allocated before each execution's first await,
+        # so running them together cannot over-commit the bankroll
+        results = await asyncio.gather(
+            *(execution for _, execution in executions), return_exceptions=True
+        )
+        for (position_id, _), result in zip(executions, results):
+            if isinstance(result, Exception):
+                logger.error("Error executing %s: %s", position_id, result)
+
+    async def _refresh_matches(self) -> List:
+        """
+        Fetch, normalize and match markets from both exchanges
+
+        Returns:
+            List of tuples (kalshi_market, polymarket_market, similarity_score)
+        """
+        # 1. Fetch markets from both exchanges
+        logger.info("Fetching markets...")
+        kalshi_markets, poly_markets = await asyncio.gather(
+            self.kalshi.get_markets(**self.kalshi_market_filters),
+            self.polymarket.get_markets(**self.poly_market_filters)
+        )
+
+        logger.info(
+            "Fetched %d Kalshi markets, %d Polymarket markets",
+            len(kalshi_markets), len(poly_markets)
+        )
+
+        if not kalshi_markets or not poly_markets:
+            logger.warning("No markets fetched, skipping iteration")
+            return []
+
+        # 2. Normalize markets
+        normalized_kalshi = [
+            self._normalize(self.kalshi, m, self._kalshi_norm_cache) for m in kalshi_markets
+        ]
+        normalized_poly = [
+            self._normalize(self.polymarket, m, self._poly_norm_cache) for m in poly_markets
+        ]
+
+        # 3. Find matching events
+        logger.info("Matching events across exchanges...")
+        matched_markets = self._find_matches(normalized_kalshi, normalized_poly)
+
+        if not matched_markets:
+            logger.info("No matching markets found")
+            return []
+
+        kalshi_ids = [km['market_id'] for km, _, _ in matched_markets]
+        poly_ids = [pm['market_id'] for _, pm, _ in matched_markets]
+        if self.price_streams:
+            self._update_stream('kalshi', self.kalshi, {m: m for m in kalshi_ids}, 'yes')
+            self._spawn(self._update_poly_stream(poly_ids))
+        elif not self.dry_run:
+            self._spawn(self.executor.warm_tokens(poly_ids))
+
+        return matched_markets
+
+    async def _update_poly_stream(self, market_ids: List[str]) -> None:
+        """
+        Stream NO prices for the matched Polymarket markets
+
+        The CLOB channel is keyed by token id, so the markets' NO token ids
+        are resolved first (this also warms the executor's token cache).
+
+        Args:
+            market_ids: Matched Polymarket market ids
+        """
+        no_tokens = await self.executor.warm_tokens(market_ids)
+        if self.running:
+            self._update_stream(
+                'polymarket', self.polymarket,
+                {token_id: market_id for market_id, token_id in no_tokens.items()}, 'sell'
+            )
+
+    def _update_stream(self, name: str, client, stream_ids: Dict[str, str], side: str) -> None:
+        """
+        Point an exchange's price stream at the currently matched markets
+
+        The stream is only restarted when its subscription changes, so
+        steady-state refreshes don't churn connections.
+
+        Args:
+            name: Exchange name (key into _live_prices)
+            client: Exchange client providing stream_best_prices()
+            stream_ids: Subscription id -> market id the quotes are stored under
+            side: Side passed to stream_best_prices()
+        """
+        wanted = frozenset(stream_ids.items())
+        if wanted == self._stream_ids.get(name):
+            return
+
+        task = self._stream_tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+
+        # Keep quotes for markets we are still subscribed to
+        markets = set(stream_ids.values())
+        live = self._live_prices[name]
+        for market_id in [m for m in live if m not in markets]:
+            del live[market_id]
+
+        self._stream_ids[name] = wanted
+        if wanted:
+            self._stream_tasks[name] = asyncio.create_task(
+                self._run_stream(name, client, dict(stream_ids), side)
+            )
+
+    async def _run_stream(self, name: str, client, stream_ids: Dict[str, str], side: str):
+        """
+        Keep a price stream connected, reconnecting with backoff
+
+        Args:
+            name: Exchange name (key into _live_prices)
+            client: Exchange client providing stream_best_prices()
+            stream_ids: Subscription id -> market id the quotes are stored under
+            side: Side passed to stream_best_prices()
+        """
+        live = self._live_prices[name]
+        subscribe_ids = sorted(stream_ids)
+
+        def on_price(stream_id: str, price: float) -> None:
+            market_id = stream_ids.get(stream_id)
+            if market_id is not None and live.get(market_id) != price:
+                live[market_id] = price
+                self.notify_price_update()
+
+        backoff = 1
+        while self.running:
+            try:
+                await client.stream_best_prices(subscribe_ids, side, on_price)
+                backoff = 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("%s price stream error: %s", name, e)
+
+            # Quotes can't be trusted while disconnected
+            live.clear()
+
+            if self.running:
+                logger.info("Reconnecting %s price stream in %ds", name, backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+
+    async def _current_prices(
+        self,
+        name: str,
+        client,
+        market_ids: List[str],
+        side: str
+    ) -> Dict[str, float]:
+        """
+        Best prices from the live stream, fetching only what it doesn't cover
+
+        Args:
+            name: Exchange name (key into _live_prices)
+            client: Exchange client
+            market_ids: Market identifiers, possibly with repeats
+            side: Side passed to the client's price methods
+
+        Returns:
+            Dictionary of market_id -> price for markets with a quote
+        """
+        live = self._live_prices[name]
+        prices = {m: live[m] for m in market_ids if m in live}
+
+        missing = [m for m in market_ids if m not in prices]
+        if missing:
+            prices.update(await self._fetch_prices(client, missing, side))
+
+        return prices
+
+    def _normalize(self, client, market: Dict, cache: Dict[tuple, Dict]) -> Dict:
+        """
+        Normalize a raw market, reusing the result from an earlier iteration if unchanged
+
+        The cache is FIFO: once it exceeds its cap the oldest half is dropped.
+
+        Args:
+            client: Exchange client providing market_cache_key() and normalize_market()
+            market: Raw market data
+            cache: Per-exchange normalization cache
+
+        Returns:
+            Normalized market dictionary
+        """
+        key = client.market_cache_key(market)
+        normalized = cache.get(key)
+        if normalized is None:
+            normalized = client.normalize_market(market)
+            cache[key] = normalized
+            if len(cache) > self._norm_cache_size:
+                # Dicts keep insertion order, so the first keys are the oldest
+                for stale in list(cache)[:len(cache) // 2]:
+                    del cache[stale]
+        return normalized
+
+    def _find_matches(self, normalized_kalshi: List[Dict], normalized_poly: List[Dict]) -> List:
+        """
+        Match markets across exchanges, reusing the previous result when nothing relevant changed
+
+        The fingerprints cover only the fields the matcher reads, so price and
+        volume updates don't force a rematch. Reused pairs are rebuilt against
+        the current normalized dicts so downstream code sees fresh liquidity.
+        A TTL forces a periodic full rematch regardless.
+
+        Args:
+            normalized_kalshi: Normalized Kalshi markets
+            normalized_poly: Normalized Polymarket markets
+
+        Returns:
+            List of tuples (kalshi_market, polymarket_market, similarity_score)
+        """
+        k_fp = hash(frozenset(
+            (m['market_id'], m['question'], m['end_date']) for m in normalized_kalshi
+        ))
+        p_fp = hash(frozenset(
+            (m['market_id'], m['question'], m['end_date']) for m in normalized_poly
+        ))
+        now = time.monotonic()
+
+        if self._match_cache is not None:
+            cached_k_fp, cached_p_fp, computed_at, id_pairs = self._match_cache
+            fresh = now - computed_at < self._match_cache_ttl
+            if fresh and (cached_k_fp, cached_p_fp) == (k_fp, p_fp):
+                kalshi_by_id = {m['market_id']: m for m in normalized_kalshi}
+                poly_by_id = {m['market_id']: m for m in normalized_poly}
+                logger.debug("Market sets unchanged, reusing %d matches", len(id_pairs))
+                return [
+                    (kalshi_by_id[k_id], poly_by_id[p_id], score)
+                    for k_id, p_id, score in id_pairs
+                ]
+
+        matches = self.matcher.find_matches(normalized_kalshi, normalized_poly)
+        self._match_cache = (
+            k_fp,
+            p_fp,
+            now,
+            [(km['market_id'], pm['market_id'], score) for km, pm, score in matches]
+        )
+        return matches
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """
+        Run a non-critical coroutine in the background
+
+        The task is held in _bg_tasks so it isn't garbage collected early,
+        and stop() waits for whatever is still pending.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    async def _fetch_prices(self, client, market_ids: List[str], side: str) -> Dict[str, float]:
+        """
+        Fetch best prices for many markets on one exchange
+
+        Uses the client's batched get_best_prices() when available and falls
+        back to per-market lookups (sharing the short-lived price cache) if
+        the client has no batch call or the batch request fails.
+
+        Args:
+            client: Exchange client
+            market_ids: Market identifiers, possibly with repeats
+            side: Side passed to the client's price methods
+
+        Returns:
+            Dictionary of market_id -> price for markets with a quote
+        """
+        unique_ids = list(dict.fromkeys(market_ids))
+
+        if hasattr(client, 'get_best_prices'):
+            async with self._request_semaphore:
+                prices = await client.get_best_prices(unique_ids, side)
+            if prices is not None:
+                return prices
+            logger.warning("Batched price request failed, falling back to per-market lookups")
+
+        self._prune_price_cache()
+        results = await asyncio.gather(
+            *(self._cached_price(client, market_id, side) for market_id in unique_ids),
+            return_exceptions=True
+        )
+
+        prices = {}
+        for market_id, price in zip(unique_ids, results):
+            if isinstance(price, Exception):
+                logger.error("Error fetching price for %s: %s", market_id, price)
+            elif price is not None:
+                prices[market_id] = price
+        return prices
+
+    def _cached_price(self, client, market_id: str, side: str) -> asyncio.Task:
+        """
+        Get a best-price lookup, sharing it with any identical one from the last TTL
+
+        The cached value is the request task itself, so pairs that share a
+        market in the same scan await one in-flight request instead of each
+        issuing their own.
+
+        Args:
+            client: Exchange client
+            market_id: Market identifier
+            side: Side passed to get_best_price()
+
+        Returns:
+            Task resolving to the best price or None
+        """
+        key = (id(client), market_id, side)
+        now = time.monotonic()
+
+        cached = self._price_cache.get(key)
+        if cached is not None and now - cached[1] < self._price_cache_ttl:
+            return cached[0]
+
+        task = asyncio.ensure_future(self._limited(client.get_best_price(market_id, side)))
+        self._price_cache[key] = (task, now)
+        return task
+
+    def _prune_price_cache(self) -> None:
+        """Drop price lookups older than the TTL"""
+        cutoff = time.monotonic() - self._price_cache_ttl
+        stale = [key for key, (_, fetched_at) in self._price_cache.items() if fetched_at < cutoff]
+        for key in stale:
+            del self._price_cache[key]
+
+    async def _limited(self, coro):
+        """
+        Await a coroutine while holding the request semaphore
+
+        Args:
+            coro: Coroutine making an exchange request
+
+        Returns:
+            Result of the coroutine
+        """
+        async with self._request_semaphore:
+            return await coro
 
     async def _execute_opportunity(self, opportunity, position_id: str):
         """
@@ -333,33 +792,80 @@ class ArbitrageEngine:
             opportunity: ArbitrageOpportunity object
             position_id: Position identifier
         """
-        logger.info(f"Executing opportunity {position_id}...")
+        logger.info("Executing opportunity %s...", position_id)
 
         # Check if we can open position
         if not self.capital_manager.can_open_position(opportunity.position_size_usd):
-            logger.warning(f"Cannot open position {position_id} - capital constraints")
+            logger.warning("Cannot open position %s - capital constraints", position_id)
             return
 
         # Allocate capital
         if not self.capital_manager.allocate_capital(opportunity.position_size_usd, position_id):
-            logger.error(f"Failed to allocate capital for {position_id}")
+            logger.error("Failed to allocate capital for %s", position_id)
             return
 
         # Execute trade
         result = await self.executor.execute_arbitrage(opportunity)
 
+        # Submitted orders are confirmed (or cancelled) by _on_trade_reconciled
+        submitted = result.success and not result.fully_filled
+        if submitted:
+            self._submitted[result.position_id] = (position_id, opportunity)
+
         # Save trade result with trading mode
         self.repository.save_trade(result, trading_mode=self.trading_mode)
 
+        if submitted:
+            logger.info(
+                "Submitted %s as %s - awaiting fills", position_id, result.position_id
+            )
+            return
+
         # Send execution alert
-        await self.alert_manager.send_execution_alert(result, opportunity)
+        self._spawn(self.alert_manager.send_execution_alert(result, opportunity))
 
         # If execution failed, release capital
         if not result.success:
             self.capital_manager.release_capital(position_id, 0)
-            logger.error(f"Execution failed for {position_id}: {result.error_message}")
+            logger.error("Execution failed for %s: %s", position_id, result.error_message)
+        else:
+            logger.info("Successfully executed %s", position_id)
+
+    def _on_trade_reconciled(self, result):
+        """
+        Record confirmed fills once the executor finishes reconciling a trade
+
+        A trade whose legs did not both fill has been cancelled or is being
+        unwound, so its capital is released.
+
+        Args:
+            result: ExecutionResult with final fill flags
+        """
+        self.repository.update_trade_fills(
+            result.position_id, result.kalshi_filled, result.polymarket_filled
+        )
+
+        position_id, opportunity = self._submitted.pop(result.position_id, (None, None))
+
+        if result.fully_filled:
+            logger.info("Successfully executed %s", position_id or result.position_id)
         else:
-            logger.info(f"Successfully executed {position_id}")
+            if position_id:
+                self.capital_manager.release_capital(position_id, 0)
+            logger.error(
+                "Fills not confirmed for %s - Kalshi: %s, Poly: %s, unwinding: %s",
+                position_id or result.position_id, result.kalshi_filled,
+                result.polymarket_filled, result.partial_fill_pending
+            )
+
+        self._spawn(self.alert_manager.send_execution_alert(result, opportunity))
+
+    async def _sync_breaker_state(self):
+        """Exchange circuit breaker state with the shared store"""
+        state = await asyncio.to_thread(
+            self.breaker_state_store.sync, self.circuit_breaker.peak_balance
+        )
+        self.circuit_breaker.apply_shared_state(state)
 
     async def _update_balances(self):
         """Update account balances from exchanges"""
@@ -375,7 +881,7 @@ class ArbitrageEngine:
             self.capital_manager.update_balances(kalshi_balance, poly_balance)
 
         except Exception as e:
-            logger.error(f"Error updating balances: {e}")
+            logger.error("Error updating balances: %s", e)
 
     async def _save_balance_snapshot(self):
         """Save current portfolio state to database"""
@@ -386,7 +892,7 @@ class ArbitrageEngine:
             self.repository.save_balance_snapshot(portfolio, trading_mode=self.trading_mode)
 
         except Exception as e:
-            logger.error(f"Error saving balance snapshot: {e}")
+            logger.error("Error saving balance snapshot: %s", e)
 
     async def _send_daily_summary(self):
         """Send daily performance summary"""
@@ -401,7 +907,7 @@ class ArbitrageEngine:
             await self.alert_manager.send_daily_summary(summary)
 
         except Exception as e:
-            logger.error(f"Error sending daily summary: {e}")
+            logger.error("Error sending daily summary: %s", e)
 
     async def _reset_daily_metrics(self):
         """Reset daily metrics"""
@@ -1,14 +1,17 @@
 """Capital and risk management"""
 
-from typing import Dict, Optional
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+import orjson
 from src.utils.logger import setup_logger
 
 logger = setup_logger("capital")
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioState:
     """Current portfolio state"""
 
@@ -40,20 +43,46 @@ class PortfolioState:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return {
-            'kalshi_balance': self.kalshi_balance,
-            'polymarket_balance': self.polymarket_balance,
-            'total_balance': self.total_balance,
-            'kalshi_allocated': self.kalshi_allocated,
-            'polymarket_allocated': self.polymarket_allocated,
-            'open_positions': self.open_positions,
-            'locked_capital': self.locked_capital,
-            'realized_pnl': self.realized_pnl,
-            'unrealized_pnl': self.unrealized_pnl,
-            'total_pnl': self.total_pnl,
-            'daily_pnl': self.daily_pnl,
-            'last_updated': self.last_updated.isoformat()
-        }
+        d = {name: getattr(self, name) for name in _FIELDS}
+        d['last_updated'] = self.last_updated.isoformat()
+        return d
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize all fields to JSON bytes in a single pass"""
+        return orjson.dumps(self)
+
+
+# Fields exported by PortfolioState.to_dict(); risk metrics are not populated yet
+_FIELDS = tuple(
+    f.name for f in fields(PortfolioState)
+    if f.name not in ('last_updated', 'max_drawdown', 'sharpe_ratio')
+)
+
+
+def _dt(ns: Optional[int]) -> Optional[datetime]:
+    """Convert a time.time_ns() stamp to a datetime"""
+    return datetime.fromtimestamp(ns / 1e9) if ns is not None else None
+
+
+@dataclass(slots=True)
+class _Position:
+    """Capital locked by one open (or closed) position"""
+
+    size: float
+    opened_at_ns: int  # time.time_ns(); converted to datetime only when read
+    status: str = 'open'
+    closed_at_ns: Optional[int] = None
+    pnl: Optional[float] = None
+
+    @property
+    def opened_at(self) -> datetime:
+        """When the position was opened"""
+        return _dt(self.opened_at_ns)
+
+    @property
+    def closed_at(self) -> Optional[datetime]:
+        """When the position was closed, if it has been"""
+        return _dt(self.closed_at_ns)
 
 
 class CapitalManager:
@@ -86,9 +115,26 @@ class CapitalManager:
         )
 
         # Position tracking
-        self.positions: Dict[str, Dict] = {}
+        self.positions: Dict[str, _Position] = {}  # Open positions only
+
+        # Most recent closed positions as (position_id, position); trades are in the database
+        self.closed_positions: Deque[Tuple[str, _Position]] = deque(
+            maxlen=config.get('risk', {}).get('closed_history', 10000)
+        )
         self.daily_start_balance = self.initial_bankroll
 
+        # Derived limits, recomputed only when the state they depend on changes
+        self._avail = 0.0
+        self._avail_dirty = True
+        self._max_position = 0.0
+        self._daily_loss_limit_abs = self.max_daily_loss_pct * self.daily_start_balance
+        self._refresh_balance_limits()
+
+    def _refresh_balance_limits(self) -> None:
+        """Recompute limits derived from total balance and mark available capital stale"""
+        self._max_position = self.portfolio.total_balance * self.max_exposure_per_event
+        self._avail_dirty = True
+
     def get_available_capital(self) -> float:
         """
         Get available capital for new trades
@@ -96,53 +142,57 @@ class CapitalManager:
         Returns:
             Available capital in USD
         """
-        total = self.portfolio.total_balance
-        locked = self.portfolio.locked_capital
-        reserve = total * self.reserve_pct
+        if self._avail_dirty:
+            total = self.portfolio.total_balance
+            locked = self.portfolio.locked_capital
+            reserve = total * self.reserve_pct
 
-        available = total - locked - reserve
+            self._avail = max(0, total - locked - reserve)
+            self._avail_dirty = False
 
-        return max(0, available)
+        return self._avail
 
     def can_open_position(self, position_size: float) -> bool:
         """
         Check if we can open a new position
 
+        Checks run cheapest first so common rejections return early.
+
         Args:
             position_size: Proposed position size
 
         Returns:
             True if position can be opened
         """
+        portfolio = self.portfolio
+
         # Check position count limit
-        if self.portfolio.open_positions >= self.max_open_positions:
-            logger.warning(f"Max open positions reached: {self.max_open_positions}")
+        if portfolio.open_positions >= self.max_open_positions:
+            logger.warning("Max open positions reached: %d", self.max_open_positions)
             return False
 
-        # Check available capital
-        available = self.get_available_capital()
-        if position_size > available:
-            logger.warning(
-                f"Insufficient capital: need ${position_size:.2f}, "
-                f"have ${available:.2f}"
+        # Check daily loss limit against the precomputed dollar amount
+        if abs(portfolio.daily_pnl) >= self._daily_loss_limit_abs:
+            daily_loss_pct = abs(portfolio.daily_pnl) / self.daily_start_balance
+            logger.error(
+                "Daily loss limit reached: %.2f%% >= %.2f%%",
+                daily_loss_pct * 100, self.max_daily_loss_pct * 100
             )
             return False
 
         # Check per-event exposure limit
-        max_position = self.portfolio.total_balance * self.max_exposure_per_event
-        if position_size > max_position:
+        if position_size > self._max_position:
             logger.warning(
-                f"Position size ${position_size:.2f} exceeds "
-                f"max per-event exposure ${max_position:.2f}"
+                "Position size $%.2f exceeds max per-event exposure $%.2f",
+                position_size, self._max_position
             )
             return False
 
-        # Check daily loss limit
-        daily_loss_pct = abs(self.portfolio.daily_pnl) / self.daily_start_balance
-        if daily_loss_pct >= self.max_daily_loss_pct:
-            logger.error(
-                f"Daily loss limit reached: {daily_loss_pct*100:.2f}% >= "
-                f"{self.max_daily_loss_pct*100:.2f}%"
+        # Check available capital last; it may need recomputing
+        available = self.get_available_capital()
+        if position_size > available:
+            logger.warning(
+                "Insufficient capital: need $%.2f, have $%.2f", position_size, available
             )
             return False
 
@@ -165,18 +215,15 @@ class CapitalManager:
         # Lock capital
         self.portfolio.locked_capital += position_size
         self.portfolio.open_positions += 1
+        self._avail_dirty = True
 
         # Track position
-        self.positions[position_id] = {
-            'size': position_size,
-            'opened_at': datetime.now(),
-            'status': 'open'
-        }
+        self.positions[position_id] = _Position(size=position_size, opened_at_ns=time.time_ns())
 
         logger.info(
-            f"Allocated ${position_size:.2f} for position {position_id}. "
-            f"Locked: ${self.portfolio.locked_capital:.2f}, "
-            f"Open positions: {self.portfolio.open_positions}"
+            "Allocated $%.2f for position %s. Locked: $%.2f, Open positions: %d",
+            position_size, position_id, self.portfolio.locked_capital,
+            self.portfolio.open_positions
         )
 
         return True
@@ -195,12 +242,13 @@ class CapitalManager:
             pnl: Realized profit/loss
             position_size: Position size (if not tracked)
         """
-        if position_id in self.positions:
-            pos = self.positions[position_id]
-            size = pos['size']
-            pos['status'] = 'closed'
-            pos['closed_at'] = datetime.now()
-            pos['pnl'] = pnl
+        pos = self.positions.pop(position_id, None)
+        if pos is not None:
+            size = pos.size
+            pos.status = 'closed'
+            pos.closed_at_ns = time.time_ns()
+            pos.pnl = pnl
+            self.closed_positions.append((position_id, pos))
         else:
             size = position_size or 0
 
@@ -215,10 +263,11 @@ class CapitalManager:
 
         # Update total balance
         self.portfolio.total_balance += pnl
+        self._refresh_balance_limits()
 
         logger.info(
-            f"Released ${size:.2f} from position {position_id}. "
-            f"P&L: ${pnl:.2f}, Total P&L: ${self.portfolio.total_pnl:.2f}"
+            "Released $%.2f from position %s. P&L: $%.2f, Total P&L: $%.2f",
+            size, position_id, pnl, self.portfolio.total_pnl
         )
 
     def update_balances(self, kalshi_balance: float, polymarket_balance: float) -> None:
@@ -233,10 +282,11 @@ class CapitalManager:
         self.portfolio.polymarket_balance = polymarket_balance
         self.portfolio.total_balance = kalshi_balance + polymarket_balance
         self.portfolio.last_updated = datetime.now()
+        self._refresh_balance_limits()
 
         logger.debug(
-            f"Balances updated: Kalshi=${kalshi_balance:.2f}, "
-            f"Poly=${polymarket_balance:.2f}, Total=${self.portfolio.total_balance:.2f}"
+            "Balances updated: Kalshi=$%.2f, Poly=$%.2f, Total=$%.2f",
+            kalshi_balance, polymarket_balance, self.portfolio.total_balance
         )
 
     def needs_rebalancing(self) -> bool:
@@ -288,7 +338,9 @@ class CapitalManager:
         """Reset daily metrics at start of new day"""
         self.daily_start_balance = self.portfolio.total_balance
         self.portfolio.daily_pnl = 0.0
-        logger.info(f"Daily metrics reset. Starting balance: ${self.daily_start_balance:.2f}")
+        self._daily_loss_limit_abs = self.max_daily_loss_pct * self.daily_start_balance
+        self._avail_dirty = True
+        logger.info("Daily metrics reset. Starting balance: $%.2f", self.daily_start_balance)
 
     def get_portfolio_state(self) -> PortfolioState:
         """Get current portfolio state"""
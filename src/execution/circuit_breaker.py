@@ -1,7 +1,10 @@
 """Circuit breaker to halt trading on excessive losses"""
 
+import time
 from datetime import datetime, timedelta
+import numpy as np
 from typing import Optional
+from src.execution.state_store import StateStore
 from src.utils.logger import setup_logger
 
 logger = setup_logger("circuit_breaker")
@@ -20,11 +23,21 @@ class CircuitBreaker:
     automatic trading halts.
     """
 
+    __slots__ = (
+        'max_daily_loss_pct', 'max_drawdown_pct', 'reset_hour',
+        'daily_start_balance', 'daily_start_date', '_daily_bucket', '_next_reset_ts',
+        '_utc_offset', 'peak_balance', 'circuit_open', 'halt_reason',
+        '_daily_loss_floor', '_drawdown_floor',
+        '_last_balance', '_status', 'state_store',
+        'total_halts', 'last_halt_time',
+    )
+
     def __init__(
         self,
         max_daily_loss_pct: float = 0.05,
         max_drawdown_pct: float = 0.15,
-        reset_hour: int = 0
+        reset_hour: int = 0,
+        state_store: Optional[StateStore] = None
     ):
         """
         Initialize circuit breaker
@@ -33,22 +46,48 @@ class CircuitBreaker:
             max_daily_loss_pct: Maximum daily loss as percentage of starting balance (e.g., 0.05 = 5%)
             max_drawdown_pct: Maximum drawdown from peak (e.g., 0.15 = 15%)
             reset_hour: Hour to reset daily metrics (0-23, default: midnight)
+            state_store: Optional shared store so a halt in one process halts all
         """
         self.max_daily_loss_pct = max_daily_loss_pct
         self.max_drawdown_pct = max_drawdown_pct
         self.reset_hour = reset_hour
+        self.state_store = state_store
 
         # State variables
         self.daily_start_balance: Optional[float] = None
         self.daily_start_date: Optional[datetime] = None
+        self._daily_bucket: Optional[int] = None
+        self._next_reset_ts = 0.0
+        self._utc_offset = time.localtime().tm_gmtoff
         self.peak_balance: Optional[float] = None
         self.circuit_open = False
         self.halt_reason: Optional[str] = None
 
+        # Balances at which the loss limits trip, kept in step with
+        # daily_start_balance and peak_balance
+        self._daily_loss_floor = float('-inf')
+        self._drawdown_floor = float('-inf')
+
+        self._last_balance: Optional[float] = None
+
         # Statistics
         self.total_halts = 0
         self.last_halt_time: Optional[datetime] = None
 
+        # Status snapshot kept current by every state change; get_status copies it
+        self._status = {
+            'circuit_open': False,
+            'halt_reason': None,
+            'daily_start_balance': None,
+            'peak_balance': None,
+            'daily_loss_pct': 0.0,
+            'drawdown_pct': 0.0,
+            'max_daily_loss_pct': max_daily_loss_pct,
+            'max_drawdown_pct': max_drawdown_pct,
+            'total_halts': 0,
+            'last_halt_time': None
+        }
+
     def check_breaker(self, current_balance: float, current_pnl: float = 0.0) -> None:
         """
         Check if circuit breaker should trigger
@@ -63,38 +102,92 @@ class CircuitBreaker:
         if self.circuit_open:
             raise TradingHaltException(f"Trading halted: {self.halt_reason}")
 
+        now = time.time()
+
+        # Same balance within the same trading day: nothing can have changed
+        if current_balance == self._last_balance and now < self._next_reset_ts:
+            return
+        self._last_balance = current_balance
+
         # Initialize on first check
         if self.daily_start_balance is None:
-            self._reset_daily_metrics(current_balance)
+            self._reset_daily_metrics(current_balance, now)
 
         # Check if we need to reset daily metrics (new day)
-        if self._should_reset_daily():
+        if self._should_reset_daily(now):
             logger.info("Resetting daily circuit breaker metrics")
-            self._reset_daily_metrics(current_balance)
+            self._reset_daily_metrics(current_balance, now)
 
         # Update peak balance
         if self.peak_balance is None or current_balance > self.peak_balance:
             self.peak_balance = current_balance
+            self._drawdown_floor = (
+                current_balance * (1 - self.max_drawdown_pct)
+                if current_balance > 0 else float('-inf')
+            )
 
-        # Check daily loss limit
-        daily_loss = self.daily_start_balance - current_balance
-        daily_loss_pct = daily_loss / self.daily_start_balance if self.daily_start_balance > 0 else 0
+        start = self.daily_start_balance
+        peak = self.peak_balance
+        daily_loss_pct = (start - current_balance) / start if start > 0 else 0.0
+        drawdown = (peak - current_balance) / peak if peak > 0 else 0.0
+
+        status = self._status
+        status['peak_balance'] = peak
+        status['daily_loss_pct'] = daily_loss_pct
+        status['drawdown_pct'] = drawdown
 
-        if daily_loss_pct >= self.max_daily_loss_pct:
+        # Check daily loss limit
+        if current_balance <= self._daily_loss_floor:
             self._trigger_circuit_breaker(
                 f"Daily loss limit exceeded: {daily_loss_pct*100:.2f}% "
                 f"(max: {self.max_daily_loss_pct*100:.2f}%)"
             )
 
         # Check drawdown from peak
-        if self.peak_balance and self.peak_balance > 0:
-            drawdown = (self.peak_balance - current_balance) / self.peak_balance
+        if current_balance <= self._drawdown_floor:
+            self._trigger_circuit_breaker(
+                f"Maximum drawdown exceeded: {drawdown*100:.2f}% "
+                f"(max: {self.max_drawdown_pct*100:.2f}%)"
+            )
 
-            if drawdown >= self.max_drawdown_pct:
-                self._trigger_circuit_breaker(
-                    f"Maximum drawdown exceeded: {drawdown*100:.2f}% "
-                    f"(max: {self.max_drawdown_pct*100:.2f}%)"
-                )
+    def check_series(self, balances: np.ndarray, timestamps: np.ndarray) -> int:
+        """
+        Replay an equity curve against the breaker limits (for backtests)
+
+        Applies the same daily-reset, daily-loss and drawdown rules as
+        check_breaker to a whole series at once. The breaker's own state is
+        not touched.
+
+        Args:
+            balances: Account balance at each bar
+            timestamps: Unix timestamp of each bar, in ascending order
+
+        Returns:
+            Index of the first bar that would trip the breaker, or -1
+        """
+        balances = np.asarray(balances, dtype=np.float64)
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        n = balances.size
+        if n == 0:
+            return -1
+
+        # Daily baseline: balance at the first bar of each trading day
+        buckets = np.floor(
+            (timestamps + self._utc_offset - self.reset_hour * 3600) / 86400
+        )
+        day_starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+        day_idx = np.searchsorted(day_starts, np.arange(n), side='right') - 1
+        start_balance = balances[day_starts][day_idx]
+        peak = np.maximum.accumulate(balances)
+
+        daily_floor = np.where(
+            start_balance > 0, start_balance * (1 - self.max_daily_loss_pct), -np.inf
+        )
+        drawdown_floor = np.where(peak > 0, peak * (1 - self.max_drawdown_pct), -np.inf)
+
+        tripped = (balances <= daily_floor) | (balances <= drawdown_floor)
+        first = int(np.argmax(tripped))
+        return first if tripped[first] else -1
 
     def _trigger_circuit_breaker(self, reason: str) -> None:
         """
@@ -111,48 +204,101 @@ class CircuitBreaker:
         self.total_halts += 1
         self.last_halt_time = datetime.now()
 
+        self._status.update(
+            circuit_open=True,
+            halt_reason=reason,
+            total_halts=self.total_halts,
+            last_halt_time=self.last_halt_time.isoformat()
+        )
+
         logger.error(f"🚨 CIRCUIT BREAKER TRIGGERED: {reason}")
         logger.error("🛑 ALL TRADING HALTED - Manual intervention required")
 
+        if self.state_store:
+            try:
+                self.state_store.set_halt(reason)
+            except Exception as e:
+                logger.error("Failed to publish halt to shared state: %s", e)
+
         raise TradingHaltException(reason)
 
-    def _should_reset_daily(self) -> bool:
+    def apply_shared_state(self, state: dict) -> None:
         """
-        Check if daily metrics should be reset
+        Adopt a halt or higher peak recorded by another process
 
-        Returns:
-            True if new trading day
+        Args:
+            state: Result of StateStore.sync()
         """
-        if self.daily_start_date is None:
-            return True
+        peak = state.get('peak_balance')
+        if peak is not None and (self.peak_balance is None or peak > self.peak_balance):
+            self.peak_balance = peak
+            self._drawdown_floor = peak * (1 - self.max_drawdown_pct) if peak > 0 else float('-inf')
+            self._status['peak_balance'] = peak
+            # The floor moved, so the next check must re-evaluate an unchanged balance
+            self._last_balance = None
+
+        if state.get('circuit_open') and not self.circuit_open:
+            reason = f"Halted by another process: {state.get('halt_reason')}"
+            self.circuit_open = True
+            self.halt_reason = reason
+            self.last_halt_time = datetime.now()
+            self._status.update(
+                circuit_open=True,
+                halt_reason=reason,
+                last_halt_time=self.last_halt_time.isoformat()
+            )
+            logger.error("🛑 %s - ALL TRADING HALTED", reason)
 
-        now = datetime.now()
+    def _day_bucket(self, now: float) -> int:
+        """
+        Index of the local trading day containing a timestamp
+
+        Days start at reset_hour local time, so the index changes exactly
+        when the reset hour is crossed.
+
+        Args:
+            now: Unix timestamp
+
+        Returns:
+            Integer day index
+        """
+        return int((now + self._utc_offset - self.reset_hour * 3600) // 86400)
 
-        # Check if we've passed the reset hour
-        if now.date() > self.daily_start_date.date():
-            # New day
-            return True
+    def _should_reset_daily(self, now: float) -> bool:
+        """
+        Check if daily metrics should be reset
 
-        if now.date() == self.daily_start_date.date():
-            # Same day - check if we've passed reset hour
-            if self.daily_start_date.hour < self.reset_hour <= now.hour:
-                return True
+        Args:
+            now: Unix timestamp of the current check
 
-        return False
+        Returns:
+            True if new trading day
+        """
+        return now >= self._next_reset_ts
 
-    def _reset_daily_metrics(self, current_balance: float) -> None:
+    def _reset_daily_metrics(self, current_balance: float, now: float) -> None:
         """
         Reset daily tracking metrics
 
         Args:
             current_balance: Current balance to use as new baseline
+            now: Unix timestamp of the current check
         """
+        # Refresh the UTC offset so DST changes are picked up once per day
+        self._utc_offset = time.localtime(now).tm_gmtoff
         self.daily_start_balance = current_balance
-        self.daily_start_date = datetime.now()
-
-        logger.info(
-            f"Daily metrics reset - Starting balance: ${current_balance:,.2f}"
+        self._status['daily_start_balance'] = current_balance
+        self._daily_loss_floor = (
+            current_balance * (1 - self.max_daily_loss_pct)
+            if current_balance > 0 else float('-inf')
         )
+        self.daily_start_date = datetime.fromtimestamp(now)
+        self._daily_bucket = self._day_bucket(now)
+        self._next_reset_ts = (
+            (self._daily_bucket + 1) * 86400 - self._utc_offset + self.reset_hour * 3600
+        )
+
+        logger.info("Daily metrics reset - Starting balance: $%.2f", current_balance)
 
     def manual_reset(self) -> None:
         """
@@ -164,12 +310,21 @@ class CircuitBreaker:
         logger.warning("⚠️  Manual circuit breaker reset requested")
 
         if self.circuit_open:
-            logger.warning(
-                f"Resetting circuit breaker (was halted: {self.halt_reason})"
-            )
+            logger.warning("Resetting circuit breaker (was halted: %s)", self.halt_reason)
 
         self.circuit_open = False
         self.halt_reason = None
+        self._status['circuit_open'] = False
+        self._status['halt_reason'] = None
+
+        # Re-evaluate the limits on the next check, even at the same balance
+        self._last_balance = None
+
+        if self.state_store:
+            try:
+                self.state_store.clear_halt()
+            except Exception as e:
+                logger.error("Failed to clear shared halt state: %s", e)
 
         logger.info("✅ Circuit breaker reset - Trading resumed")
 
@@ -180,30 +335,7 @@ class CircuitBreaker:
         Returns:
             Dictionary with circuit breaker status
         """
-        daily_loss_pct = 0.0
-        drawdown_pct = 0.0
-
-        if self.daily_start_balance and self.daily_start_balance > 0:
-            if hasattr(self, '_current_balance'):
-                daily_loss = self.daily_start_balance - self._current_balance
-                daily_loss_pct = daily_loss / self.daily_start_balance
-
-        if self.peak_balance and self.peak_balance > 0:
-            if hasattr(self, '_current_balance'):
-                drawdown_pct = (self.peak_balance - self._current_balance) / self.peak_balance
-
-        return {
-            'circuit_open': self.circuit_open,
-            'halt_reason': self.halt_reason,
-            'daily_start_balance': self.daily_start_balance,
-            'peak_balance': self.peak_balance,
-            'daily_loss_pct': daily_loss_pct,
-            'drawdown_pct': drawdown_pct,
-            'max_daily_loss_pct': self.max_daily_loss_pct,
-            'max_drawdown_pct': self.max_drawdown_pct,
-            'total_halts': self.total_halts,
-            'last_halt_time': self.last_halt_time.isoformat() if self.last_halt_time else None
-        }
+        return self._status.copy()
 
     def is_trading_allowed(self) -> bool:
         """
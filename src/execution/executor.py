@@ -1,18 +1,70 @@
 """Trade execution engine"""
 
 import asyncio
-from typing import Dict, Optional, Tuple
-from datetime import datetime
-from dataclasses import dataclass
-from src.api.kalshi_client import KalshiClient
+import itertools
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from datetime import datetime, timezone
+from dataclasses import dataclass, fields
+import orjson
+from src.api.kalshi_client import KalshiClient, KalshiRequestError
 from src.api.polymarket_client import PolymarketClient
 from src.arbitrage.detector import ArbitrageOpportunity
 from src.utils.logger import setup_logger
+from src.utils.validation import ValidationError
 
-logger = setup_logger("executor")
+# Queued: records are formatted and written off the order path
+logger = setup_logger("executor", queued=True)
 
+# Position id sequence, seeded from the wall clock so ids stay unique across
+# restarts without reading the clock per trade
+_position_seq = itertools.count(time.time_ns())
 
-@dataclass
+# Order statuses that mean the order has filled
+_KALSHI_FILLED_STATES = frozenset(('filled', 'complete', 'executed'))
+_POLY_FILLED_STATES = frozenset(('filled', 'complete', 'matched'))
+
+# Python 3.12+ can start a task eagerly, running it up to its first await
+# (the order request going out) before control returns to the caller
+_eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+
+
+def _start_leg(coro) -> asyncio.Task:
+    """
+    Start an order leg as a task, eagerly where supported
+
+    Args:
+        coro: Leg coroutine
+
+    Returns:
+        Running task
+    """
+    loop = asyncio.get_running_loop()
+    if _eager_task_factory is not None:
+        return _eager_task_factory(loop, coro)
+    return loop.create_task(coro)
+
+
+async def _settle(coro) -> Tuple[bool, Any]:
+    """
+    Await an order leg, capturing a failure instead of raising it
+
+    Both legs always run to completion, so a filled leg is never abandoned
+    because the other one raised.
+
+    Args:
+        coro: Leg coroutine
+
+    Returns:
+        (True, result) on success, (False, exception) on failure
+    """
+    try:
+        return True, await coro
+    except Exception as e:
+        return False, e
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of trade execution"""
 
@@ -24,32 +76,59 @@ class ExecutionResult:
     polymarket_filled: bool = False
     actual_cost: float = 0.0
     error_message: Optional[str] = None
-    executed_at: Optional[datetime] = None
+    executed_at: Optional[datetime] = None  # UTC
+    kalshi_latency_ns: int = 0  # Order send to acknowledgement, monotonic clock
+    poly_latency_ns: int = 0
+    partial_fill_pending: bool = False  # A filled leg is queued for unwinding
+
+    @property
+    def fully_filled(self) -> bool:
+        """Whether both legs are confirmed filled"""
+        return self.kalshi_filled and self.polymarket_filled
 
     def to_dict(self) -> Dict:
         """Convert to dictionary"""
-        return {
-            'success': self.success,
-            'position_id': self.position_id,
-            'kalshi_order_id': self.kalshi_order_id,
-            'polymarket_order_id': self.polymarket_order_id,
-            'kalshi_filled': self.kalshi_filled,
-            'polymarket_filled': self.polymarket_filled,
-            'actual_cost': self.actual_cost,
-            'error_message': self.error_message,
-            'executed_at': self.executed_at.isoformat() if self.executed_at else None
-        }
+        data = {name: getattr(self, name) for name in _RESULT_FIELDS}
+        if self.executed_at:
+            data['executed_at'] = self.executed_at.isoformat()
+        return data
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize all fields to JSON bytes in a single pass"""
+        return orjson.dumps(self)
+
+
+# Field names in declaration order, resolved once for to_dict
+_RESULT_FIELDS = tuple(f.name for f in fields(ExecutionResult))
+
+
+@dataclass(slots=True)
+class OrderAck:
+    """Exchange acknowledgement of a placed order leg"""
+
+    order_id: Optional[str]
+    raw: Dict  # Order data, as needed to unwind the leg
+    latency_ns: int = 0  # Time spent in the accepted send, monotonic clock
 
 
 class TradeExecutor:
-    """Executes arbitrage trades across exchanges"""
+    """
+    Executes arbitrage trades across exchanges
+
+    This class always places real orders; dry runs use DryRunTradeExecutor.
+    make_executor picks the right one.
+    """
+
+    # Whether execute_arbitrage simulates trades instead of placing orders
+    simulated = False
 
     def __init__(
         self,
         kalshi_client: KalshiClient,
         polymarket_client: PolymarketClient,
         config: Dict,
-        dry_run: bool = True
+        on_reconciled: Optional[Callable[[ExecutionResult], None]] = None,
+        unwind_journal=None
     ):
         """
         Initialize trade executor
@@ -58,14 +137,48 @@ class TradeExecutor:
             kalshi_client: Kalshi API client
             polymarket_client: Polymarket API client
             config: Configuration dictionary
-            dry_run: If True, simulate trades without execution
+            on_reconciled: Called with the result once fill reconciliation ends
+            unwind_journal: Persists queued unwinds across restarts; any object
+                with save_pending_unwind, delete_pending_unwind and
+                get_pending_unwinds (e.g. ArbitrageRepository)
         """
         self.kalshi = kalshi_client
         self.polymarket = polymarket_client
         self.config = config
-        self.dry_run = dry_run
-
-        self.slippage_tolerance = config.get('trading', {}).get('slippage_tolerance', 0.002)
+        self.dry_run = self.simulated
+        self.on_reconciled = on_reconciled
+
+        trading_config = config.get('trading', {})
+        self.slippage_tolerance = trading_config.get('slippage_tolerance', 0.002)
+        self.slippage_mult = 1 + self.slippage_tolerance
+        self.fill_poll_interval = trading_config.get('fill_poll_interval_sec', 2.0)
+        self.fill_timeout = trading_config.get('fill_timeout_sec', 60.0)
+        self.order_retries = trading_config.get('order_retries', 2)
+        self.order_retry_backoff = trading_config.get('order_retry_backoff_sec', 0.25)
+
+        # Kalshi orders submitted close together share one batched request
+        self.order_batching = trading_config.get('order_batching', True)
+        self.order_batch_window = trading_config.get('order_batch_window_ms', 0) / 1000
+        self._kalshi_orders: Optional[asyncio.Queue] = None
+        self._kalshi_dispatcher: Optional[asyncio.Task] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+        # NO token id per Polymarket market, filled ahead of execution by warm_tokens
+        self._no_token_ids: Dict[str, str] = {}
+        self._token_cache_size = trading_config.get('token_cache_size', 4096)
+
+        # Submitted trades whose fills are still being confirmed
+        self._pending: Dict[str, ExecutionResult] = {}
+        self._reconciler_tasks: Set[asyncio.Task] = set()
+
+        # Partial-fill unwinds run off the execution path, retried with backoff
+        self.unwind_journal = unwind_journal
+        self.unwind_timeout = trading_config.get('unwind_timeout_sec', 5.0)
+        self.unwind_attempts = trading_config.get('unwind_attempts', 3)
+        self._unwind_queue: Optional[asyncio.Queue] = None
+        self._unwind_worker_task: Optional[asyncio.Task] = None
+        self._unwind_tasks: Set[asyncio.Task] = set()
+        self._unwind_slots = asyncio.Semaphore(trading_config.get('max_concurrent_unwinds', 4))
 
     async def execute_arbitrage(
         self,
@@ -74,47 +187,60 @@ class TradeExecutor:
         """
         Execute arbitrage trade
 
+        Trades return as soon as both orders are accepted. Fill flags start
+        False and are updated on the same result object by a background
+        reconciler, which cancels and unwinds a trade whose legs have not both
+        filled within fill_timeout_sec; see get_pending.
+
         Args:
             opportunity: ArbitrageOpportunity to execute
 
         Returns:
             ExecutionResult
         """
-        position_id = f"arb_{int(datetime.now().timestamp())}"
-
-        logger.info(
-            f"{'[DRY RUN] ' if self.dry_run else ''}Executing arbitrage trade {position_id}"
-        )
+        position_id = f"arb_{next(_position_seq):x}"
 
-        if self.dry_run:
-            # Simulate execution
-            return ExecutionResult(
-                success=True,
-                position_id=position_id,
-                kalshi_order_id=f"kalshi_sim_{position_id}",
-                polymarket_order_id=f"poly_sim_{position_id}",
-                kalshi_filled=True,
-                polymarket_filled=True,
-                actual_cost=opportunity.position_size_usd,
-                executed_at=datetime.now()
-            )
+        logger.info("Executing arbitrage trade %s", position_id)
 
-        # Execute both legs concurrently
         try:
-            kalshi_task = self._execute_kalshi_leg(opportunity)
-            poly_task = self._execute_polymarket_leg(opportunity)
+            # Prepare both orders up front so the two sends go out back to back
+            kalshi_price_cents = opportunity.kalshi_limit_cents
+            if kalshi_price_cents is None:
+                kalshi_price = opportunity.kalshi_yes_price * self.slippage_mult
+                kalshi_price_cents = min(99, int(kalshi_price * 100))
+
+            poly_price = opportunity.polymarket_limit_price
+            if poly_price is None:
+                poly_price = opportunity.polymarket_no_price * self.slippage_mult
+                poly_price = min(0.99, poly_price)
+
+            # Resolve the NO token before committing either leg
+            token_id = await self._get_no_token_id(opportunity.polymarket_market_id)
+            if not token_id:
+                return ExecutionResult(
+                    success=False,
+                    position_id=position_id,
+                    error_message=(
+                        f"Could not resolve NO token ID for market "
+                        f"{opportunity.polymarket_market_id}"
+                    )
+                )
 
-            kalshi_result, poly_result = await asyncio.gather(
-                kalshi_task,
-                poly_task,
-                return_exceptions=True
+            # Execute both legs concurrently
+            (kalshi_ok, kalshi_result), (poly_ok, poly_result) = await asyncio.gather(
+                _start_leg(_settle(
+                    self._execute_kalshi_leg(opportunity, position_id, kalshi_price_cents)
+                )),
+                _start_leg(_settle(
+                    self._execute_polymarket_leg(opportunity, token_id, poly_price)
+                ))
             )
 
-            # Check for errors
-            kalshi_success = not isinstance(kalshi_result, Exception) and kalshi_result is not None
-            poly_success = not isinstance(poly_result, Exception) and poly_result is not None
+            # A leg that returned None was rejected without raising
+            kalshi_success = kalshi_ok and kalshi_result is not None
+            poly_success = poly_ok and poly_result is not None
 
-            if not kalshi_success or not poly_success:
+            if not (kalshi_success and poly_success):
                 error_msg = []
                 if not kalshi_success:
                     error_msg.append(f"Kalshi: {kalshi_result}")
@@ -122,7 +248,7 @@ class TradeExecutor:
                     error_msg.append(f"Polymarket: {poly_result}")
 
                 # Need to cancel/rollback if one side failed
-                await self._handle_partial_fill(
+                unwinding = self._handle_partial_fill(
                     kalshi_success, poly_success,
                     kalshi_result if kalshi_success else None,
                     poly_result if poly_success else None
@@ -131,23 +257,29 @@ class TradeExecutor:
                 return ExecutionResult(
                     success=False,
                     position_id=position_id,
-                    error_message="; ".join(error_msg)
+                    error_message="; ".join(error_msg),
+                    partial_fill_pending=unwinding
                 )
 
-            # Both filled successfully
-            return ExecutionResult(
+            # Both orders accepted - confirm fills in the background
+            result = ExecutionResult(
                 success=True,
                 position_id=position_id,
-                kalshi_order_id=kalshi_result.get('order_id') if kalshi_result else None,
-                polymarket_order_id=poly_result.get('order_id') if poly_result else None,
-                kalshi_filled=True,
-                polymarket_filled=True,
+                kalshi_order_id=kalshi_result.order_id,
+                polymarket_order_id=poly_result.order_id,
                 actual_cost=opportunity.position_size_usd,
-                executed_at=datetime.now()
+                executed_at=datetime.now(timezone.utc),
+                kalshi_latency_ns=kalshi_result.latency_ns,
+                poly_latency_ns=poly_result.latency_ns
             )
+            self._pending[position_id] = result
+            task = asyncio.create_task(self._reconcile(result, kalshi_result, poly_result))
+            self._reconciler_tasks.add(task)
+            task.add_done_callback(self._reconciler_tasks.discard)
+            return result
 
         except Exception as e:
-            logger.error(f"Error executing arbitrage: {e}")
+            logger.error("Error executing arbitrage: %s", e)
             return ExecutionResult(
                 success=False,
                 position_id=position_id,
@@ -156,77 +288,193 @@ class TradeExecutor:
 
     async def _execute_kalshi_leg(
         self,
-        opportunity: ArbitrageOpportunity
-    ) -> Optional[Dict]:
+        opportunity: ArbitrageOpportunity,
+        position_id: str,
+        limit_price_cents: int
+    ) -> Optional[OrderAck]:
         """
         Execute Kalshi leg of arbitrage
 
+        The order carries a client_order_id derived from the position, so
+        requests whose outcome is unknown (timeouts, connection errors, 5xx)
+        are retried with backoff without risk of a duplicate fill. Rejections
+        are not retried. If a retry is rejected as a duplicate, or retries run
+        out after an ambiguous failure, the order is looked up by its
+        client_order_id so one that landed is still tracked.
+
         Args:
             opportunity: ArbitrageOpportunity
+            position_id: Position identifier used to derive the idempotency key
+            limit_price_cents: Limit price in cents, slippage included
 
         Returns:
-            Order result or None
+            OrderAck or None
         """
         try:
-            # Calculate limit price with slippage tolerance
-            limit_price = opportunity.kalshi_yes_price * (1 + self.slippage_tolerance)
-            limit_price_cents = min(99, int(limit_price * 100))
-
-            logger.info(
-                f"Placing Kalshi order: {opportunity.kalshi_contracts} contracts @ "
-                f"{limit_price_cents} cents"
-            )
-
-            result = await self.kalshi.place_order(
-                ticker=opportunity.kalshi_market_id,
-                side='yes',
-                action='buy',
-                count=opportunity.kalshi_contracts,
-                price=limit_price_cents,
-                order_type='limit'
-            )
-
-            if result:
-                logger.info(f"Kalshi order placed: {result.get('order', {}).get('order_id')}")
-                return result.get('order')
+            client_order_id = f"{position_id}_k"
+            result = None
+            lookup = False
+            for attempt in range(self.order_retries + 1):
+                if attempt:
+                    delay = self.order_retry_backoff * 2 ** (attempt - 1)
+                    logger.warning(
+                        "Retrying Kalshi order %s in %.2fs (attempt %d)",
+                        client_order_id, delay, attempt + 1
+                    )
+                    await asyncio.sleep(delay)
+
+                t0 = time.monotonic_ns()
+                try:
+                    result = await self._place_kalshi_order(
+                        ticker=opportunity.kalshi_market_id,
+                        side='yes',
+                        action='buy',
+                        count=opportunity.kalshi_contracts,
+                        price=limit_price_cents,
+                        order_type='limit',
+                        client_order_id=client_order_id
+                    )
+                    break
+                except ValidationError as e:
+                    logger.error("Kalshi order validation failed: %s", e)
+                    return None
+                except KalshiRequestError as e:
+                    if e.duplicate_order:
+                        logger.warning(
+                            "Kalshi order %s already exists; looking it up", client_order_id
+                        )
+                        lookup = True
+                        break
+                    if not e.retryable:
+                        logger.error("Kalshi order rejected: %s", e)
+                        return None
+                    logger.warning("Kalshi order %s outcome unknown: %s", client_order_id, e)
+                    lookup = True
+
+            if result is None and lookup:
+                result = await self.kalshi.get_order_by_client_id(
+                    opportunity.kalshi_market_id, client_order_id
+                )
+                if result:
+                    logger.warning("Recovered Kalshi order %s by client_order_id", client_order_id)
+
+            order = result.get('order') if result else None
+            if order:
+                ack = OrderAck(order.get('order_id'), order, time.monotonic_ns() - t0)
+                logger.info(
+                    "Kalshi order placed: %s (%d contracts @ %d cents)",
+                    ack.order_id, opportunity.kalshi_contracts, limit_price_cents
+                )
+                return ack
             else:
                 logger.error("Kalshi order failed")
                 return None
 
         except Exception as e:
-            logger.error(f"Error placing Kalshi order: {e}")
+            logger.error("Error placing Kalshi order: %s", e)
             raise
 
-    async def _execute_polymarket_leg(
-        self,
-        opportunity: ArbitrageOpportunity
-    ) -> Optional[Dict]:
+    async def _place_kalshi_order(self, **order) -> Optional[Dict]:
         """
-        Execute Polymarket leg of arbitrage
+        Submit a Kalshi order, coalescing with others sent at the same time
 
         Args:
-            opportunity: ArbitrageOpportunity
+            **order: KalshiClient.submit_order keyword arguments
 
         Returns:
-            Order result or None
+            Order response
+
+        Raises:
+            ValidationError: If the order is invalid
+            KalshiRequestError: If the request fails or is rejected
+        """
+        if not self.order_batching:
+            return await self.kalshi.submit_order(**order)
+
+        if self._kalshi_dispatcher is None or self._kalshi_dispatcher.done():
+            self._kalshi_orders = asyncio.Queue()
+            self._kalshi_dispatcher = asyncio.create_task(self._dispatch_kalshi_orders())
+
+        future = asyncio.get_running_loop().create_future()
+        self._kalshi_orders.put_nowait((order, future))
+        return await future
+
+    async def _dispatch_kalshi_orders(self) -> None:
+        """
+        Drain queued Kalshi orders into batched requests
+
+        Everything queued within order_batch_window of the first order (or in
+        the same event-loop pass when the window is 0) goes out together.
+        Orders not yet sent when the dispatcher is cancelled fail with
+        KalshiRequestError.
         """
+        queue = self._kalshi_orders
+        batch = []
         try:
-            # Calculate limit price with slippage tolerance
-            limit_price = opportunity.polymarket_no_price * (1 + self.slippage_tolerance)
-            limit_price = min(0.99, limit_price)
+            while True:
+                batch = [await queue.get()]
+                await asyncio.sleep(self.order_batch_window)
+                while not queue.empty() and len(batch) < self.kalshi.BATCH_ORDERS:
+                    batch.append(queue.get_nowait())
+
+                task = asyncio.create_task(self._send_kalshi_batch(batch))
+                self._batch_tasks.add(task)
+                task.add_done_callback(self._batch_tasks.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Fail orders that will never be sent rather than leave callers waiting
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(KalshiRequestError(
+                        "Order dispatcher stopped before the order was sent"
+                    ))
+            raise
 
-            logger.info(
-                f"Placing Polymarket order: {opportunity.polymarket_size:.2f} size @ "
-                f"{limit_price:.4f}"
-            )
+    async def _send_kalshi_batch(self, batch: List[Tuple[Dict, asyncio.Future]]) -> None:
+        """
+        Send one batch of Kalshi orders and resolve each caller's future
 
-            # Resolve NO token ID for the market
-            token_id = await self._get_no_token_id(opportunity.polymarket_market_id)
+        Args:
+            batch: (order kwargs, future) pairs
+        """
+        try:
+            if len(batch) == 1:
+                results = [await self.kalshi.submit_order(**batch[0][0])]
+            else:
+                logger.debug("Sending %d Kalshi orders in one batch", len(batch))
+                results = await self.kalshi.submit_orders([order for order, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
 
-            if not token_id:
-                logger.error(f"Failed to resolve token ID for market {opportunity.polymarket_market_id}")
-                return None
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
+    async def _execute_polymarket_leg(
+        self,
+        opportunity: ArbitrageOpportunity,
+        token_id: str,
+        limit_price: float
+    ) -> Optional[OrderAck]:
+        """
+        Execute Polymarket leg of arbitrage
+
+        Args:
+            opportunity: ArbitrageOpportunity
+            token_id: NO token ID of the Polymarket market
+            limit_price: Limit price, slippage included
+
+        Returns:
+            OrderAck or None
+        """
+        try:
+            t0 = time.monotonic_ns()
             result = await self.polymarket.place_order(
                 token_id=token_id,
                 side='BUY',
@@ -234,86 +482,223 @@ class TradeExecutor:
                 price=limit_price,
                 order_type='GTC'  # Good til cancelled
             )
+            latency_ns = time.monotonic_ns() - t0
 
             if result:
-                logger.info(f"Polymarket order placed: {result.get('order_id')}")
-                return result
+                # The CLOB returns 'orderID'; keep what the unwind needs alongside it
+                ack = OrderAck(
+                    result.get('orderID') or result.get('order_id'),
+                    {'token_id': token_id, 'size': opportunity.polymarket_size, **result},
+                    latency_ns
+                )
+                logger.info(
+                    "Polymarket order placed: %s (%.2f size @ %.4f)",
+                    ack.order_id, opportunity.polymarket_size, limit_price
+                )
+                return ack
             else:
                 logger.error("Polymarket order failed")
                 return None
 
         except Exception as e:
-            logger.error(f"Error placing Polymarket order: {e}")
+            logger.error("Error placing Polymarket order: %s", e)
             raise
 
     async def _get_no_token_id(self, market_id: str) -> Optional[str]:
         """
         Get NO token ID for a Polymarket market
 
+        Token ids never change for a market, so resolved ids are cached. The
+        cache is FIFO: once it exceeds its cap the oldest half is dropped.
+
         Args:
             market_id: Polymarket market ID
 
         Returns:
             NO token ID or None if not found
         """
+        token_id = self._no_token_ids.get(market_id)
+        if token_id:
+            return token_id
+
         # Get token IDs from market data using the Polymarket client
         token_ids = await self.polymarket.get_token_ids_for_market(market_id)
-        if token_ids:
-            return token_ids.get('no')
-
-        logger.error(f"Could not resolve NO token ID for market {market_id}")
+        token_id = token_ids.get('no') if token_ids else None
+        if token_id:
+            self._no_token_ids[market_id] = token_id
+            if len(self._no_token_ids) > self._token_cache_size:
+                for stale in list(self._no_token_ids)[:len(self._no_token_ids) // 2]:
+                    del self._no_token_ids[stale]
+            return token_id
+
+        logger.error("Could not resolve NO token ID for market %s", market_id)
         return None
 
-    async def _handle_partial_fill(
+    async def warm_tokens(self, market_ids: List[str]) -> Dict[str, str]:
+        """
+        Resolve NO token ids for markets that may be traded soon
+
+        Keeps the token lookup off the order path when an opportunity on
+        one of these markets is executed.
+
+        Args:
+            market_ids: Polymarket market IDs
+
+        Returns:
+            Dictionary of market ID -> NO token ID for the markets that resolved
+        """
+        resolved = {m: self._no_token_ids.get(m) for m in market_ids if m}
+        missing = [m for m, token_id in resolved.items() if not token_id]
+        if missing:
+            token_ids = await asyncio.gather(
+                *(self._get_no_token_id(m) for m in missing), return_exceptions=True
+            )
+            resolved.update(zip(missing, token_ids))
+        return {m: token_id for m, token_id in resolved.items() if isinstance(token_id, str)}
+
+    async def warmup(self) -> None:
+        """
+        Prime both exchange connections with a cheap authenticated call
+
+        Pays the DNS lookup and TLS handshake before the first opportunity
+        rather than on its order path.
+        """
+        await asyncio.gather(
+            self.kalshi.get_balance(), self.polymarket.get_balance(), return_exceptions=True
+        )
+        logger.debug("Exchange connections warmed up")
+
+    def _handle_partial_fill(
         self,
         kalshi_filled: bool,
         poly_filled: bool,
-        kalshi_order: Optional[Dict],
-        poly_order: Optional[Dict]
-    ) -> None:
+        kalshi_order: Optional[OrderAck],
+        poly_order: Optional[OrderAck]
+    ) -> bool:
         """
         Handle case where only one leg filled - CRITICAL FOR RISK MANAGEMENT
 
-        This method immediately unwinds any filled position if the other leg fails,
-        preventing naked directional exposure.
+        Any filled leg is queued for unwinding right away, preventing naked
+        directional exposure without holding up the caller; see _run_unwind.
 
         Args:
             kalshi_filled: Whether Kalshi order filled
             poly_filled: Whether Polymarket order filled
-            kalshi_order: Kalshi order data
-            poly_order: Polymarket order data
+            kalshi_order: Kalshi order acknowledgement
+            poly_order: Polymarket order acknowledgement
+
+        Returns:
+            True if an unwind was queued
         """
         logger.error(
-            f"🚨 PARTIAL FILL DETECTED - Kalshi: {kalshi_filled}, Poly: {poly_filled}"
+            "🚨 PARTIAL FILL DETECTED - Kalshi: %s, Poly: %s", kalshi_filled, poly_filled
         )
 
-        # Critical: Unwind any filled positions immediately
-        unwind_tasks = []
+        queued = False
 
         if kalshi_filled and kalshi_order:
-            logger.warning(
-                f"⚠️  Unwinding Kalshi position: {kalshi_order.get('order_id')}"
-            )
-            unwind_tasks.append(self._unwind_kalshi_position(kalshi_order))
+            logger.warning("⚠️  Unwinding Kalshi position: %s", kalshi_order.order_id)
+            self._queue_unwind('kalshi', kalshi_order.raw)
+            queued = True
 
         if poly_filled and poly_order:
-            logger.warning(
-                f"⚠️  Unwinding Polymarket position: {poly_order.get('order_id')}"
-            )
-            unwind_tasks.append(self._unwind_polymarket_position(poly_order))
+            logger.warning("⚠️  Unwinding Polymarket position: %s", poly_order.order_id)
+            self._queue_unwind('polymarket', poly_order.raw)
+            queued = True
+
+        return queued
+
+    def _queue_unwind(self, venue: str, order: Dict, journal_id: Optional[int] = None) -> None:
+        """
+        Journal an unwind and hand it to the unwind worker
+
+        Args:
+            venue: Exchange of the filled leg ('kalshi' or 'polymarket')
+            order: Filled order data
+            journal_id: Existing journal entry, when recovering after a restart
+        """
+        if journal_id is None and self.unwind_journal is not None:
+            journal_id = self.unwind_journal.save_pending_unwind(venue, order)
+
+        if self._unwind_worker_task is None or self._unwind_worker_task.done():
+            self._unwind_queue = asyncio.Queue()
+            self._unwind_worker_task = asyncio.create_task(self._unwind_worker())
+
+        self._unwind_queue.put_nowait((venue, order, journal_id))
+
+    async def _unwind_worker(self) -> None:
+        """Start queued unwinds, at most max_concurrent_unwinds at a time"""
+        queue = self._unwind_queue
+        while True:
+            venue, order, journal_id = await queue.get()
+            await self._unwind_slots.acquire()
+
+            task = asyncio.create_task(self._run_unwind(venue, order, journal_id))
+            self._unwind_tasks.add(task)
+            task.add_done_callback(self._unwind_tasks.discard)
+            task.add_done_callback(lambda _: self._unwind_slots.release())
+
+    async def _run_unwind(self, venue: str, order: Dict, journal_id: Optional[int]) -> bool:
+        """
+        Place the offsetting order for a filled leg, retrying with backoff
+
+        Each attempt is capped at unwind_timeout. An unwind that still fails
+        after unwind_attempts stays in the journal and is retried by
+        recover_unwinds on the next start.
 
-        if unwind_tasks:
-            # Execute all unwinds concurrently
-            results = await asyncio.gather(*unwind_tasks, return_exceptions=True)
+        Args:
+            venue: Exchange of the filled leg ('kalshi' or 'polymarket')
+            order: Filled order data
+            journal_id: Journal entry to clear on success
+
+        Returns:
+            True if the position was unwound
+        """
+        if venue == 'kalshi':
+            unwind = self._unwind_kalshi_position
+        else:
+            unwind = self._unwind_polymarket_position
+
+        for attempt in range(self.unwind_attempts):
+            if attempt:
+                delay = self.order_retry_backoff * 2 ** (attempt - 1)
+                logger.warning(
+                    "Retrying %s unwind in %.2fs (attempt %d)", venue, delay, attempt + 1
+                )
+                await asyncio.sleep(delay)
+
+            try:
+                unwound = await asyncio.wait_for(unwind(order), self.unwind_timeout)
+            except asyncio.TimeoutError:
+                logger.error("❌ %s unwind timed out after %.1fs", venue, self.unwind_timeout)
+                unwound = False
+
+            if unwound:
+                if journal_id is not None:
+                    self.unwind_journal.delete_pending_unwind(journal_id)
+                return True
+
+        logger.critical(
+            "❌ %s unwind failed after %d attempts - position left open",
+            venue, self.unwind_attempts
+        )
+        return False
+
+    def recover_unwinds(self) -> int:
+        """
+        Requeue unwinds journaled by an earlier run that never completed
 
-            # Log results
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"❌ Unwind task {i} failed: {result}")
-                elif result:
-                    logger.info(f"✅ Unwind task {i} succeeded")
-                else:
-                    logger.error(f"❌ Unwind task {i} returned False")
+        Returns:
+            Number of unwinds requeued
+        """
+        if self.unwind_journal is None:
+            return 0
+
+        pending = self.unwind_journal.get_pending_unwinds()
+        for journal_id, venue, order in pending:
+            logger.warning("Recovering pending %s unwind %d", venue, journal_id)
+            self._queue_unwind(venue, order, journal_id)
+        return len(pending)
 
     async def _unwind_kalshi_position(self, kalshi_order: Dict) -> bool:
         """
@@ -330,31 +715,40 @@ class TradeExecutor:
             side = kalshi_order.get('side')  # 'yes' or 'no'
             count = kalshi_order.get('count')
 
-            if not all([ticker, side, count]):
+            if ticker is None or side is None or count is None:
                 logger.error("Insufficient order data to unwind Kalshi position")
                 return False
 
+            if count <= 0:
+                logger.error("Kalshi order to unwind has no contracts (count=%s)", count)
+                return False
+
             # Place offsetting market order (sell what we bought)
-            logger.info(f"Placing offsetting Kalshi order: SELL {count} {side} @ market")
+            logger.info("Placing offsetting Kalshi order: SELL %s %s @ market", count, side)
 
+            # Keyed on the filled order so a retried unwind can't sell twice
+            order_id = kalshi_order.get('order_id')
             result = await self.kalshi.place_order(
                 ticker=ticker,
                 side=side,
                 action='sell',  # Offset the buy
                 count=count,
                 price=50,  # Mid-price for market-like execution
-                order_type='limit'  # Use aggressive limit instead of true market
+                order_type='limit',  # Use aggressive limit instead of true market
+                client_order_id=f"{order_id}_unwind" if order_id else None
             )
 
             if result:
-                logger.info(f"✅ Kalshi position unwound: {result.get('order', {}).get('order_id')}")
+                logger.info(
+                    "✅ Kalshi position unwound: %s", result.get('order', {}).get('order_id')
+                )
                 return True
             else:
                 logger.error("❌ Failed to unwind Kalshi position")
                 return False
 
         except Exception as e:
-            logger.error(f"Error unwinding Kalshi position: {e}")
+            logger.error("Error unwinding Kalshi position: %s", e)
             return False
 
     async def _unwind_polymarket_position(self, poly_order: Dict) -> bool:
@@ -371,12 +765,16 @@ class TradeExecutor:
             token_id = poly_order.get('token_id')
             size = poly_order.get('size')
 
-            if not all([token_id, size]):
+            if token_id is None or size is None:
                 logger.error("Insufficient order data to unwind Polymarket position")
                 return False
 
+            if float(size) <= 0:
+                logger.error("Polymarket order to unwind has no size (size=%s)", size)
+                return False
+
             # Place offsetting order (sell what we bought)
-            logger.info(f"Placing offsetting Polymarket order: SELL {size} @ market")
+            logger.info("Placing offsetting Polymarket order: SELL %s @ market", size)
 
             # Use mid-price for quick execution
             result = await self.polymarket.place_order(
@@ -388,14 +786,14 @@ class TradeExecutor:
             )
 
             if result:
-                logger.info(f"✅ Polymarket position unwound: {result.get('order_id')}")
+                logger.info("✅ Polymarket position unwound: %s", result.get('order_id'))
                 return True
             else:
                 logger.error("❌ Failed to unwind Polymarket position")
                 return False
 
         except Exception as e:
-            logger.error(f"Error unwinding Polymarket position: {e}")
+            logger.error("Error unwinding Polymarket position: %s", e)
             return False
 
     async def check_order_status(
@@ -422,9 +820,9 @@ class TradeExecutor:
                 kalshi_status = await self.kalshi.get_order_status(kalshi_order_id)
                 if kalshi_status:
                     status = kalshi_status.get('status', '').lower()
-                    kalshi_filled = status in ['filled', 'complete', 'executed']
+                    kalshi_filled = status in _KALSHI_FILLED_STATES
             except Exception as e:
-                logger.error(f"Error checking Kalshi order status: {e}")
+                logger.error("Error checking Kalshi order status: %s", e)
 
         # Check Polymarket order status
         if poly_order_id:
@@ -432,13 +830,197 @@ class TradeExecutor:
                 poly_status = await self.polymarket.get_order_status(poly_order_id)
                 if poly_status:
                     status = poly_status.get('status', '').lower()
-                    poly_filled = status in ['filled', 'complete', 'matched']
+                    poly_filled = status in _POLY_FILLED_STATES
             except Exception as e:
-                logger.error(f"Error checking Polymarket order status: {e}")
+                logger.error("Error checking Polymarket order status: %s", e)
 
         return kalshi_filled, poly_filled
 
+    async def _refresh_fills(self, result: ExecutionResult) -> None:
+        """
+        Update the fill flags of a submitted trade from the exchanges
+
+        Args:
+            result: Result to update in place; legs already filled are not checked
+        """
+        kalshi_filled, poly_filled = await self.check_order_status(
+            None if result.kalshi_filled else result.kalshi_order_id,
+            None if result.polymarket_filled else result.polymarket_order_id
+        )
+        result.kalshi_filled = result.kalshi_filled or kalshi_filled
+        result.polymarket_filled = result.polymarket_filled or poly_filled
+
+    async def _reconcile(
+        self,
+        result: ExecutionResult,
+        kalshi_order: OrderAck,
+        poly_order: OrderAck
+    ) -> None:
+        """
+        Poll order status until both legs fill or the fill timeout passes
+
+        On timeout the unfilled orders are cancelled and a leg that did fill
+        is queued for unwinding, so no one-sided position is left open.
+
+        Args:
+            result: Provisional result to update in place
+            kalshi_order: Kalshi order acknowledgement
+            poly_order: Polymarket order acknowledgement
+        """
+        deadline = time.monotonic() + self.fill_timeout
+
+        try:
+            while True:
+                await self._refresh_fills(result)
+
+                if result.fully_filled:
+                    logger.info("Both legs filled for %s", result.position_id)
+                    break
+
+                if time.monotonic() >= deadline:
+                    logger.warning(
+                        "Fill reconciliation timed out for %s - Kalshi: %s, Poly: %s",
+                        result.position_id, result.kalshi_filled, result.polymarket_filled
+                    )
+                    await self._abandon_unfilled(result, kalshi_order, poly_order)
+                    break
+
+                await asyncio.sleep(self.fill_poll_interval)
+        finally:
+            self._pending.pop(result.position_id, None)
+
+        if self.on_reconciled:
+            try:
+                self.on_reconciled(result)
+            except Exception as e:
+                logger.error("Error in reconciliation callback: %s", e)
+
+    async def _abandon_unfilled(
+        self,
+        result: ExecutionResult,
+        kalshi_order: OrderAck,
+        poly_order: OrderAck
+    ) -> None:
+        """
+        Cancel the unfilled legs of a timed-out trade and unwind any filled leg
+
+        Args:
+            result: Result to update in place
+            kalshi_order: Kalshi order acknowledgement
+            poly_order: Polymarket order acknowledgement
+        """
+        cancels = []
+        if not result.kalshi_filled and result.kalshi_order_id:
+            cancels.append(self.kalshi.cancel_order(result.kalshi_order_id))
+        if not result.polymarket_filled and result.polymarket_order_id:
+            cancels.append(self.polymarket.cancel_order(result.polymarket_order_id))
+        for outcome in await asyncio.gather(*cancels, return_exceptions=True):
+            if isinstance(outcome, Exception):
+                logger.error("Error cancelling unfilled order: %s", outcome)
+
+        # A leg can fill before its cancel reaches the exchange
+        await self._refresh_fills(result)
+
+        if result.fully_filled:
+            logger.info("Both legs filled for %s", result.position_id)
+        elif result.kalshi_filled or result.polymarket_filled:
+            result.partial_fill_pending = self._handle_partial_fill(
+                result.kalshi_filled, result.polymarket_filled, kalshi_order, poly_order
+            )
+        else:
+            logger.warning("Cancelled both unfilled orders for %s", result.position_id)
+
+    def get_pending(self, position_id: str) -> Optional[ExecutionResult]:
+        """
+        Get a submitted trade whose fills are still being confirmed
+
+        Args:
+            position_id: Position identifier from the ExecutionResult
+
+        Returns:
+            ExecutionResult or None if not pending
+        """
+        return self._pending.get(position_id)
+
     async def close(self):
-        """Close API clients"""
+        """Stop order dispatch, unwinds and fill reconciliation, then close API clients"""
+        # In-flight unwinds are bounded by their timeouts; queued ones stay journaled
+        if self._unwind_worker_task:
+            self._unwind_worker_task.cancel()
+        in_flight = list(self._batch_tasks) + list(self._unwind_tasks)
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+        background = list(self._reconciler_tasks)
+        for task in (self._kalshi_dispatcher, self._unwind_worker_task):
+            if task:
+                background.append(task)
+        for task in background:
+            task.cancel()
+        await asyncio.gather(*background, return_exceptions=True)
+
         await self.kalshi.close()
         await self.polymarket.close()
+
+
+class DryRunTradeExecutor(TradeExecutor):
+    """Executor that simulates fills without sending any orders"""
+
+    simulated = True
+
+    async def execute_arbitrage(
+        self,
+        opportunity: ArbitrageOpportunity
+    ) -> ExecutionResult:
+        """
+        Simulate an arbitrage trade as fully filled
+
+        Args:
+            opportunity: ArbitrageOpportunity to execute
+
+        Returns:
+            ExecutionResult
+        """
+        position_id = f"arb_{next(_position_seq):x}"
+
+        logger.info("[DRY RUN] Executing arbitrage trade %s", position_id)
+
+        return ExecutionResult(
+            success=True,
+            position_id=position_id,
+            kalshi_order_id=f"kalshi_sim_{position_id}",
+            polymarket_order_id=f"poly_sim_{position_id}",
+            kalshi_filled=True,
+            polymarket_filled=True,
+            actual_cost=opportunity.position_size_usd,
+            executed_at=datetime.now(timezone.utc)
+        )
+
+    async def warmup(self) -> None:
+        """Nothing to warm up; no orders are sent"""
+
+
+def make_executor(
+    kalshi_client: KalshiClient,
+    polymarket_client: PolymarketClient,
+    config: Dict,
+    dry_run: bool = True,
+    on_reconciled: Optional[Callable[[ExecutionResult], None]] = None,
+    unwind_journal=None
+) -> TradeExecutor:
+    """
+    Create the live or dry-run executor
+
+    Args:
+        kalshi_client: Kalshi API client
+        polymarket_client: Polymarket API client
+        config: Configuration dictionary
+        dry_run: If True, simulate trades without execution
+        on_reconciled: Called with the result once fill reconciliation ends
+        unwind_journal: Persists queued unwinds across restarts
+
+    Returns:
+        DryRunTradeExecutor if dry_run, else TradeExecutor
+    """
+    executor_cls = DryRunTradeExecutor if dry_run else TradeExecutor
+    return executor_cls(kalshi_client, polymarket_client, config, on_reconciled, unwind_journal)
@@ -0,0 +1,120 @@
+"""Shared circuit breaker state for multi-process deployments"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+from src.utils.logger import setup_logger
+
+logger = setup_logger("state_store")
+
+
+class StateStore(ABC):
+    """
+    Backend that shares circuit breaker state between processes
+
+    The breaker only talks to the store when it trips or is reset, and a
+    periodic sync() pulls in halts raised elsewhere, so the per-tick check
+    never waits on the network.
+    """
+
+    @abstractmethod
+    def set_halt(self, reason: str) -> None:
+        """
+        Record a halt for all processes
+
+        Args:
+            reason: Halt reason (the first recorded reason is kept)
+        """
+
+    @abstractmethod
+    def clear_halt(self) -> None:
+        """Clear a recorded halt after a manual reset"""
+
+    @abstractmethod
+    def sync(self, peak_balance: Optional[float]) -> Dict:
+        """
+        Publish the local peak balance and read the shared state
+
+        Args:
+            peak_balance: Local peak balance, merged as a running maximum
+
+        Returns:
+            Dictionary with circuit_open, halt_reason and peak_balance
+        """
+
+
+# Raise the stored peak only if the new value is higher, atomically
+_MAX_PEAK_SCRIPT = """
+local current = tonumber(redis.call('HGET', KEYS[1], 'peak_balance'))
+if not current or tonumber(ARGV[1]) > current then
+    redis.call('HSET', KEYS[1], 'peak_balance', ARGV[1])
+end
+return redis.call('HMGET', KEYS[1], 'circuit_open', 'halt_reason', 'peak_balance')
+"""
+
+
+class RedisStateStore(StateStore):
+    """StateStore kept in a single Redis hash"""
+
+    def __init__(self, url: str, key: str = "orion:circuit_breaker"):
+        """
+        Initialize Redis state store
+
+        Args:
+            url: Redis connection URL
+            key: Hash key holding the shared state
+        """
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "redis is required for shared circuit breaker state "
+                "(pip install 'orion-arbitrage[distributed]')"
+            ) from e
+
+        self.redis = redis.Redis.from_url(url, decode_responses=True)
+        self.key = key
+        self._max_peak = self.redis.register_script(_MAX_PEAK_SCRIPT)
+
+    def set_halt(self, reason: str) -> None:
+        """
+        Record a halt for all processes
+
+        Args:
+            reason: Halt reason (the first recorded reason is kept)
+        """
+        pipe = self.redis.pipeline()
+        pipe.hsetnx(self.key, 'halt_reason', reason)
+        pipe.hset(self.key, 'circuit_open', 1)
+        pipe.execute()
+
+    def clear_halt(self) -> None:
+        """Clear a recorded halt after a manual reset"""
+        pipe = self.redis.pipeline()
+        pipe.hdel(self.key, 'halt_reason')
+        pipe.hset(self.key, 'circuit_open', 0)
+        pipe.execute()
+
+    def sync(self, peak_balance: Optional[float]) -> Dict:
+        """
+        Publish the local peak balance and read the shared state
+
+        Args:
+            peak_balance: Local peak balance, merged as a running maximum
+
+        Returns:
+            Dictionary with circuit_open, halt_reason and peak_balance
+        """
+        if peak_balance is None:
+            circuit_open, halt_reason, peak = self.redis.hmget(
+                self.key, 'circuit_open', 'halt_reason', 'peak_balance'
+            )
+        else:
+            circuit_open, halt_reason, peak = self._max_peak(
+                keys=[self.key], args=[peak_balance]
+            )
+
+        return {
+            'circuit_open': circuit_open == '1',
+            'halt_reason': halt_reason,
+            'peak_balance': float(peak) if peak is not None else None
+        }
@@ -1,16 +1,90 @@
 """Alert system with Telegram integration"""
 
 import asyncio
-from typing import Optional, Dict, List
+from typing import Callable, Optional, Dict, List, Tuple
 from datetime import datetime
 from telegram import Bot
 from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 from src.arbitrage.detector import ArbitrageOpportunity
 from src.execution.executor import ExecutionResult
 from src.utils.logger import setup_logger
 
 logger = setup_logger("alerts")
 
+# Message templates, filled with str.format_map so the layout is built once
+_OPPORTUNITY_TMPL = (
+    "💰 ARBITRAGE OPPORTUNITY\n\n"
+    "Question: {question}...\n\n"
+    "📊 Pricing:\n"
+    "  Kalshi YES: {kalshi_yes_price:.4f}\n"
+    "  Polymarket NO: {polymarket_no_price:.4f}\n"
+    "  Spread: {spread:.4f}\n\n"
+    "💵 Trade Details:\n"
+    "  Edge: {edge_pct:.2f}%\n"
+    "  Position Size: ${position_size_usd:.2f}\n"
+    "  Expected Profit: ${expected_profit:.2f}\n"
+    "  Expected ROI: {roi_pct:.2f}%\n\n"
+    "🏦 Markets:\n"
+    "  Kalshi: {kalshi_market_id}\n"
+    "  Polymarket: {polymarket_market_id}\n\n"
+    "⏰ Detected: {detected_hms}"
+)
+
+_EXECUTION_HEADER_TMPL = (
+    "{status_emoji} TRADE EXECUTION\n\n"
+    "Position: {position_id}\n"
+    "Status: {status}\n\n"
+)
+
+_EXECUTION_FILLED_TMPL = (
+    "📝 Orders:\n"
+    "  Kalshi: {kalshi_order_id}\n"
+    "  Polymarket: {polymarket_order_id}\n\n"
+    "  Kalshi Filled: {kalshi_filled}\n"
+    "  Poly Filled: {polymarket_filled}\n\n"
+    "  Cost: ${actual_cost:.2f}\n"
+)
+
+_DAILY_SUMMARY_TMPL = (
+    "📈 DAILY SUMMARY\n\n"
+    "🔍 Opportunities:\n"
+    "  Detected: {opportunities_detected}\n"
+    "  Executed: {trades_executed}\n"
+    "  Successful: {trades_successful}\n\n"
+    "💰 Performance:\n"
+    "  Total P&L: ${total_pnl:.2f}\n"
+    "  Volume: ${total_volume:.2f}\n"
+    "  Win Rate: {win_rate_pct:.1f}%\n\n"
+    "📊 Balance:\n"
+    "  Total: ${total_balance:.2f}\n"
+    "  Kalshi: ${kalshi_balance:.2f}\n"
+    "  Polymarket: ${polymarket_balance:.2f}\n\n"
+    "⏰ {now}"
+)
+
+# Telegram HTTP pool; short timeouts so a Telegram outage fails sends fast
+TELEGRAM_POOL_SIZE = 8
+TELEGRAM_CONNECT_TIMEOUT = 2.0
+TELEGRAM_READ_TIMEOUT = 4.0
+
+# Telegram rejects messages longer than this
+TELEGRAM_MAX_CHARS = 4096
+
+ALERT_PRIORITIES = ("low", "normal", "high", "critical")
+
+# Priorities delivered as soon as they are queued; the rest are coalesced
+_IMMEDIATE_PRIORITIES = frozenset(("high", "critical"))
+
+_DIGEST_SEPARATOR = "\n\n---\n\n"
+
+# Summary fields shown in the daily summary
+_SUMMARY_KEYS = (
+    'opportunities_detected', 'trades_executed', 'trades_successful',
+    'total_pnl', 'total_volume', 'win_rate',
+    'total_balance', 'kalshi_balance', 'polymarket_balance',
+)
+
 
 class AlertManager:
     """Manages alerts via multiple channels"""
@@ -26,6 +100,13 @@ class AlertManager:
         self.alert_channels = config.get('monitoring', {}).get('alert_channels', [])
         self.alert_threshold = config.get('monitoring', {}).get('alert_threshold_spread', 0.015)
         self.min_opportunity_usd = config.get('monitoring', {}).get('alert_min_opportunity_usd', 500)
+        self.alert_batch_window = (
+            config.get('monitoring', {}).get('alert_batch_window_ms', 100) / 1000
+        )
+
+        # Alerts are queued and delivered by a background worker (started lazily)
+        self._alert_queue: Optional[asyncio.Queue] = None
+        self._alert_worker_task: Optional[asyncio.Task] = None
 
         # Telegram configuration
         self.telegram_enabled = 'telegram' in self.alert_channels
@@ -37,13 +118,65 @@ class AlertManager:
             chat_id = config.get('telegram_chat_id')
 
             if token and chat_id:
-                self.telegram_bot = Bot(token=token)
+                self.telegram_bot = Bot(
+                    token=token,
+                    request=HTTPXRequest(
+                        connection_pool_size=TELEGRAM_POOL_SIZE,
+                        connect_timeout=TELEGRAM_CONNECT_TIMEOUT,
+                        read_timeout=TELEGRAM_READ_TIMEOUT
+                    )
+                )
                 self.telegram_chat_id = chat_id
                 logger.info("Telegram alerts enabled")
             else:
                 logger.warning("Telegram enabled but credentials missing")
                 self.telegram_enabled = False
 
+        # Channel senders per priority, resolved once (add new channels here)
+        senders = (self._send_telegram,) if self.telegram_enabled else ()
+        self._routes: Dict[str, Tuple[Callable, ...]] = {
+            priority: senders for priority in ALERT_PRIORITIES
+        }
+
+    @staticmethod
+    def should_alert_fast(
+        edge: float,
+        profit: float,
+        edge_thresh: float,
+        profit_thresh: float
+    ) -> bool:
+        """
+        Check alert thresholds with plain float comparisons
+
+        Args:
+            edge: Opportunity edge
+            profit: Expected profit in USD
+            edge_thresh: Minimum edge to alert on
+            profit_thresh: Minimum expected profit to alert on
+
+        Returns:
+            True if both thresholds are met
+        """
+        return edge >= edge_thresh and profit >= profit_thresh
+
+    def should_alert(self, edge: float, profit: float) -> bool:
+        """
+        Check whether an opportunity would be alerted on
+
+        Lets callers skip scheduling send_opportunity_alert for the (usual)
+        sub-threshold opportunities or when no channel is enabled.
+
+        Args:
+            edge: Opportunity edge
+            profit: Expected profit in USD
+
+        Returns:
+            True if an opportunity alert would be sent
+        """
+        return self.telegram_enabled and self.should_alert_fast(
+            edge, profit, self.alert_threshold, self.min_opportunity_usd
+        )
+
     async def send_opportunity_alert(self, opportunity: ArbitrageOpportunity) -> None:
         """
         Send alert for new arbitrage opportunity
@@ -51,11 +184,8 @@ class AlertManager:
         Args:
             opportunity: ArbitrageOpportunity object
         """
-        # Check if opportunity meets alert threshold
-        if opportunity.edge < self.alert_threshold:
-            return
-
-        if opportunity.expected_profit < self.min_opportunity_usd:
+        # Check alert thresholds (and skip building the message with no channels)
+        if not self.should_alert(opportunity.edge, opportunity.expected_profit):
             return
 
         message = self._format_opportunity_message(opportunity)
@@ -70,13 +200,19 @@ class AlertManager:
         """
         Send alert for trade execution
 
+        Accepted orders whose legs did not both fill are reported as
+        unfilled, with high priority like failures.
+
         Args:
             result: ExecutionResult object
             opportunity: Original opportunity (optional)
         """
+        if not self.telegram_enabled:
+            return
+
         message = self._format_execution_message(result, opportunity)
 
-        priority = "high" if not result.success else "normal"
+        priority = "normal" if result.fully_filled else "high"
         await self._send_alert(message, priority=priority)
 
     async def send_error_alert(self, error_type: str, error_message: str) -> None:
@@ -87,6 +223,9 @@ class AlertManager:
             error_type: Type of error
             error_message: Error message
         """
+        if not self.telegram_enabled:
+            return
+
         message = (
             f"🚨 ERROR ALERT\n\n"
             f"Type: {error_type}\n"
@@ -103,6 +242,9 @@ class AlertManager:
         Args:
             summary: Performance summary dictionary
         """
+        if not self.telegram_enabled:
+            return
+
         message = self._format_daily_summary(summary)
         await self._send_alert(message, priority="low")
 
@@ -116,23 +258,19 @@ class AlertManager:
         Returns:
             Formatted message string
         """
-        return (
-            f"💰 ARBITRAGE OPPORTUNITY\n\n"
-            f"Question: {opp.question[:100]}...\n\n"
-            f"📊 Pricing:\n"
-            f"  Kalshi YES: {opp.kalshi_yes_price:.4f}\n"
-            f"  Polymarket NO: {opp.polymarket_no_price:.4f}\n"
-            f"  Spread: {opp.spread:.4f}\n\n"
-            f"💵 Trade Details:\n"
-            f"  Edge: {opp.edge*100:.2f}%\n"
-            f"  Position Size: ${opp.position_size_usd:.2f}\n"
-            f"  Expected Profit: ${opp.expected_profit:.2f}\n"
-            f"  Expected ROI: {opp.expected_roi*100:.2f}%\n\n"
-            f"🏦 Markets:\n"
-            f"  Kalshi: {opp.kalshi_market_id}\n"
-            f"  Polymarket: {opp.polymarket_market_id}\n\n"
-            f"⏰ Detected: {opp.detected_at.strftime('%H:%M:%S')}"
-        )
+        return _OPPORTUNITY_TMPL.format_map({
+            'question': opp.question[:100],
+            'kalshi_yes_price': opp.kalshi_yes_price,
+            'polymarket_no_price': opp.polymarket_no_price,
+            'spread': opp.spread,
+            'edge_pct': opp.edge * 100,
+            'position_size_usd': opp.position_size_usd,
+            'expected_profit': opp.expected_profit,
+            'roi_pct': opp.expected_roi * 100,
+            'kalshi_market_id': opp.kalshi_market_id,
+            'polymarket_market_id': opp.polymarket_market_id,
+            'detected_hms': opp.detected_at.strftime('%H:%M:%S'),
+        })
 
     def _format_execution_message(
         self,
@@ -149,23 +287,33 @@ class AlertManager:
         Returns:
             Formatted message string
         """
-        status_emoji = "✅" if result.success else "❌"
+        if not result.success:
+            status_emoji, status = "❌", 'FAILED'
+        elif result.fully_filled:
+            status_emoji, status = "✅", 'SUCCESS'
+        else:
+            status_emoji, status = "⚠️", 'UNFILLED'
 
-        message = f"{status_emoji} TRADE EXECUTION\n\n"
-        message += f"Position: {result.position_id}\n"
-        message += f"Status: {'SUCCESS' if result.success else 'FAILED'}\n\n"
+        message = _EXECUTION_HEADER_TMPL.format_map({
+            'status_emoji': status_emoji,
+            'position_id': result.position_id,
+            'status': status,
+        })
 
         if result.success:
-            message += (
-                f"📝 Orders:\n"
-                f"  Kalshi: {result.kalshi_order_id}\n"
-                f"  Polymarket: {result.polymarket_order_id}\n\n"
-                f"  Kalshi Filled: {'✅' if result.kalshi_filled else '❌'}\n"
-                f"  Poly Filled: {'✅' if result.polymarket_filled else '❌'}\n\n"
-                f"  Cost: ${result.actual_cost:.2f}\n"
-            )
-
-            if opportunity:
+            message += _EXECUTION_FILLED_TMPL.format_map({
+                'kalshi_order_id': result.kalshi_order_id,
+                'polymarket_order_id': result.polymarket_order_id,
+                'kalshi_filled': '✅' if result.kalshi_filled else '❌',
+                'polymarket_filled': '✅' if result.polymarket_filled else '❌',
+                'actual_cost': result.actual_cost,
+            })
+
+            if not result.fully_filled:
+                message += "  Unfilled orders cancelled\n"
+                if result.partial_fill_pending:
+                    message += "  ⚠️ Filled leg queued for unwind\n"
+            elif opportunity:
                 message += f"  Expected Profit: ${opportunity.expected_profit:.2f}\n"
 
         else:
@@ -186,43 +334,108 @@ class AlertManager:
         Returns:
             Formatted message string
         """
-        return (
-            f"📈 DAILY SUMMARY\n\n"
-            f"🔍 Opportunities:\n"
-            f"  Detected: {summary.get('opportunities_detected', 0)}\n"
-            f"  Executed: {summary.get('trades_executed', 0)}\n"
-            f"  Successful: {summary.get('trades_successful', 0)}\n\n"
-            f"💰 Performance:\n"
-            f"  Total P&L: ${summary.get('total_pnl', 0):.2f}\n"
-            f"  Volume: ${summary.get('total_volume', 0):.2f}\n"
-            f"  Win Rate: {summary.get('win_rate', 0)*100:.1f}%\n\n"
-            f"📊 Balance:\n"
-            f"  Total: ${summary.get('total_balance', 0):.2f}\n"
-            f"  Kalshi: ${summary.get('kalshi_balance', 0):.2f}\n"
-            f"  Polymarket: ${summary.get('polymarket_balance', 0):.2f}\n\n"
-            f"⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        )
+        fields = {key: summary.get(key, 0) for key in _SUMMARY_KEYS}
+        fields['win_rate_pct'] = fields['win_rate'] * 100
+        fields['now'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        return _DAILY_SUMMARY_TMPL.format_map(fields)
 
     async def _send_alert(self, message: str, priority: str = "normal") -> None:
         """
-        Send alert through configured channels
+        Queue alert for delivery without waiting on the channels
 
         Args:
             message: Alert message
             priority: Priority level (low, normal, high, critical)
         """
-        logger.info(f"Sending {priority} priority alert")
+        if not self._routes.get(priority):
+            return
 
-        # Send to all configured channels
-        tasks = []
+        logger.info("Sending %s priority alert", priority)
 
-        if self.telegram_enabled:
-            tasks.append(self._send_telegram(message))
+        if self._alert_worker_task is None or self._alert_worker_task.done():
+            self._alert_queue = asyncio.Queue()
+            self._alert_worker_task = asyncio.create_task(self._alert_worker())
 
-        # Could add more channels here (email, Discord, etc.)
+        self._alert_queue.put_nowait((priority, message))
 
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+    async def _alert_worker(self) -> None:
+        """
+        Deliver queued alerts until the shutdown sentinel arrives
+
+        High and critical alerts go out as soon as they are dequeued. Low and
+        normal alerts queued within alert_batch_window of each other are
+        joined into as few messages as fit the Telegram length limit.
+        """
+        queue = self._alert_queue
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+
+            priority, message = item
+            if priority in _IMMEDIATE_PRIORITIES:
+                await self._deliver(message, priority)
+                continue
+
+            digest: Dict[str, List[str]] = {priority: [message]}
+            await asyncio.sleep(self.alert_batch_window)
+
+            stopping = False
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    stopping = True
+                    break
+                priority, message = item
+                if priority in _IMMEDIATE_PRIORITIES:
+                    await self._deliver(message, priority)
+                else:
+                    digest.setdefault(priority, []).append(message)
+
+            for priority, messages in digest.items():
+                for message in self._coalesce(messages):
+                    await self._deliver(message, priority)
+
+            if stopping:
+                return
+
+    @staticmethod
+    def _coalesce(messages: List[str]) -> List[str]:
+        """
+        Join messages into as few as fit within TELEGRAM_MAX_CHARS
+
+        Args:
+            messages: Messages in queue order
+
+        Returns:
+            Combined messages (an oversized message is kept on its own)
+        """
+        combined: List[str] = []
+        current = ""
+        for message in messages:
+            joined_len = len(current) + len(_DIGEST_SEPARATOR) + len(message)
+            if current and joined_len > TELEGRAM_MAX_CHARS:
+                combined.append(current)
+                current = message
+            else:
+                current = f"{current}{_DIGEST_SEPARATOR}{message}" if current else message
+
+        if current:
+            combined.append(current)
+        return combined
+
+    async def _deliver(self, message: str, priority: str) -> None:
+        """
+        Send message through the channels routed for its priority
+
+        Args:
+            message: Message to send
+            priority: Priority level the message was queued with
+        """
+        senders = self._routes.get(priority, ())
+        if senders:
+            await asyncio.gather(*(send(message) for send in senders), return_exceptions=True)
 
     async def _send_telegram(self, message: str) -> None:
         """
@@ -243,10 +456,22 @@ class AlertManager:
             logger.debug("Telegram alert sent successfully")
 
         except TelegramError as e:
-            logger.error(f"Failed to send Telegram alert: {e}")
+            logger.error("Failed to send Telegram alert: %s", e)
 
         except Exception as e:
-            logger.error(f"Unexpected error sending Telegram alert: {e}")
+            logger.error("Unexpected error sending Telegram alert: %s", e)
+
+    async def close(self) -> None:
+        """Deliver any queued alerts, stop the alert worker and release the Telegram pool"""
+        if self._alert_worker_task is not None and not self._alert_worker_task.done():
+            self._alert_queue.put_nowait(None)
+            await self._alert_worker_task
+
+        if self.telegram_bot:
+            try:
+                await self.telegram_bot.shutdown()
+            except Exception as e:
+                logger.debug("Error shutting down Telegram bot: %s", e)
 
     async def test_connection(self) -> bool:
         """
@@ -261,13 +486,15 @@ class AlertManager:
 
         if self.telegram_enabled:
             try:
+                # Opens the pooled connection so the first real alert skips the handshake
+                await self.telegram_bot.initialize()
                 await self.telegram_bot.send_message(
                     chat_id=self.telegram_chat_id,
                     text="✅ Orion Arbitrage Bot - Alert system test"
                 )
                 logger.info("Telegram test successful")
             except Exception as e:
-                logger.error(f"Telegram test failed: {e}")
+                logger.error("Telegram test failed: %s", e)
                 all_ok = False
 
         return all_ok
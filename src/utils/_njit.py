@@ -0,0 +1,25 @@
+"""Optional Numba JIT support
+
+Numeric kernels import ``njit``/``prange`` from here instead of from numba
+directly. When numba is not installed they fall back to plain Python so the
+same code path still runs, just without compilation.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def _no_njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+    njit = _no_njit
@@ -1,15 +1,73 @@
 """Configuration management for the arbitrage engine"""
 
+import copy
 import os
+import threading
+from functools import cached_property
 import yaml
 from pathlib import Path
-from typing import Any, Dict, Optional
-from dotenv import load_dotenv
+from typing import Any, Dict, Optional, Tuple, Union
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Bound once; load_dotenv() updates this same mapping in place
+_ENV = os.environ
+
+# Parsed config per resolved path: (st_mtime_ns, st_size, config). Instances get
+# their own deep copy, since callers may override values in place.
+_yaml_cache: Dict[str, tuple] = {}
+
+# Credential properties resolved once per instance (cleared by reload)
+_CREDENTIAL_PROPERTIES = (
+    'kalshi_api_key', 'kalshi_private_key_pem', 'kalshi_api_secret',
+    'polymarket_private_key', 'polymarket_api_key',
+    'telegram_bot_token', 'telegram_chat_id',
+)
+
+# load_dotenv() only needs to run once per process
+_dotenv_loaded = False
+
+# Top-level sections exposed as Config attributes
+_SECTIONS = (
+    'trading', 'capital', 'risk', 'polling', 'fees', 'monitoring', 'exchanges', 'database'
+)
+
+# Dotted keys split into path tuples, shared by all instances and reloads
+_split_cache: Dict[str, Tuple[str, ...]] = {}
+
+
+def _split_key(key: str) -> Tuple[str, ...]:
+    """
+    Split a dotted config key, caching the result
+
+    Args:
+        key: Configuration key (e.g., 'trading.threshold_spread')
+
+    Returns:
+        Path tuple (e.g., ('trading', 'threshold_spread'))
+    """
+    path = _split_cache.get(key)
+    if path is None:
+        path = _split_cache[key] = tuple(key.split('.'))
+    return path
 
 
 class Config:
     """Configuration manager that loads from YAML and environment variables"""
 
+    # Top-level sections, bound as attributes on every (re)load
+    trading: Dict[str, Any]
+    capital: Dict[str, Any]
+    risk: Dict[str, Any]
+    polling: Dict[str, Any]
+    fees: Dict[str, Any]
+    monitoring: Dict[str, Any]
+    exchanges: Dict[str, Any]
+    database: Dict[str, Any]
+
     def __init__(self, config_path: Optional[str] = None, use_encryption: bool = True):
         """
         Initialize configuration manager
@@ -18,20 +76,28 @@ class Config:
             config_path: Path to YAML config file (default: config/config.yaml)
             use_encryption: Whether to use encrypted credentials (default: True)
         """
-        # Load environment variables
-        load_dotenv()
+        # Load environment variables (once per process)
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _dotenv_loaded = True
 
         # Determine config path
         if config_path is None:
-            config_path = os.getenv('CONFIG_PATH', 'config/config.yaml')
+            config_path = _ENV.get('CONFIG_PATH', 'config/config.yaml')
 
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        self._file_stamp: Optional[Tuple[int, int]] = None  # (st_mtime_ns, st_size)
+
+        # Resolved dot-notation lookups; cleared whenever the file is reloaded
+        self._lookup_cache: Dict[str, Any] = {}
         self.use_encryption = use_encryption
 
         # Initialize secrets manager if encryption is enabled
         self.secrets_manager = None
-        if use_encryption and os.getenv('MASTER_PASSWORD'):
+        if use_encryption and _ENV.get('MASTER_PASSWORD'):
             try:
                 from src.utils.secrets_manager import SecretsManager
                 self.secrets_manager = SecretsManager()
@@ -47,28 +113,48 @@ class Config:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Config file not found: {self.config_path}")
 
-        with open(self.config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+        stat = self.config_path.stat()
+        self._file_stamp = (stat.st_mtime_ns, stat.st_size)
+        path = str(self.config_path.resolve())
+
+        cached = _yaml_cache.get(path)
+        if cached and cached[:2] == self._file_stamp:
+            parsed = cached[2]
+        else:
+            parsed = yaml.load(self.config_path.read_bytes(), Loader=SafeLoader)
+            _yaml_cache[path] = (stat.st_mtime_ns, stat.st_size, parsed)
 
-    def get(self, key: str, default: Any = None) -> Any:
+        self._config = copy.deepcopy(parsed)
+
+        # Missing sections get their own empty dict, as the old properties did
+        for section in _SECTIONS:
+            setattr(self, section, self._config.get(section, {}))
+
+        self._lookup_cache = {}
+
+    def get(self, key: Union[str, Tuple[str, ...]], default: Any = None) -> Any:
         """
         Get configuration value using dot notation
 
         Args:
-            key: Configuration key (e.g., 'trading.threshold_spread')
+            key: Configuration key (e.g., 'trading.threshold_spread'), or the
+                already-split path (e.g., ('trading', 'threshold_spread'))
             default: Default value if key not found
 
         Returns:
             Configuration value
         """
-        keys = key.split('.')
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+        try:
+            value = self._lookup_cache[key]
+        except KeyError:
+            value = self._config
+            for k in (_split_key(key) if isinstance(key, str) else key):
+                if isinstance(value, dict):
+                    value = value.get(k)
+                else:
+                    value = None
+                    break
+            self._lookup_cache[key] = value
 
         return value if value is not None else default
 
@@ -83,50 +169,10 @@ class Config:
         Returns:
             Environment variable value
         """
-        return os.getenv(key, default)
-
-    @property
-    def trading(self) -> Dict[str, Any]:
-        """Get trading configuration"""
-        return self._config.get('trading', {})
-
-    @property
-    def capital(self) -> Dict[str, Any]:
-        """Get capital management configuration"""
-        return self._config.get('capital', {})
-
-    @property
-    def risk(self) -> Dict[str, Any]:
-        """Get risk management configuration"""
-        return self._config.get('risk', {})
-
-    @property
-    def polling(self) -> Dict[str, Any]:
-        """Get polling configuration"""
-        return self._config.get('polling', {})
-
-    @property
-    def fees(self) -> Dict[str, Any]:
-        """Get fees configuration"""
-        return self._config.get('fees', {})
-
-    @property
-    def monitoring(self) -> Dict[str, Any]:
-        """Get monitoring configuration"""
-        return self._config.get('monitoring', {})
-
-    @property
-    def exchanges(self) -> Dict[str, Any]:
-        """Get exchanges configuration"""
-        return self._config.get('exchanges', {})
-
-    @property
-    def database(self) -> Dict[str, Any]:
-        """Get database configuration"""
-        return self._config.get('database', {})
+        return _ENV.get(key, default)
 
     # API Credentials
-    @property
+    @cached_property
     def kalshi_api_key(self) -> Optional[str]:
         """Get Kalshi API key ID from environment or encrypted storage"""
         if self.secrets_manager:
@@ -139,7 +185,7 @@ class Config:
         """Get Kalshi RSA private key file path"""
         return self.get_env('KALSHI_PRIVATE_KEY_PATH')
 
-    @property
+    @cached_property
     def kalshi_private_key_pem(self) -> Optional[str]:
         """Get Kalshi RSA private key as PEM string"""
         if self.secrets_manager:
@@ -147,7 +193,7 @@ class Config:
             return private_key
         return self.get_env('KALSHI_PRIVATE_KEY_PEM')
 
-    @property
+    @cached_property
     def kalshi_api_secret(self) -> Optional[str]:
         """DEPRECATED: Kalshi now uses RSA-PSS signing, not API secret"""
         # Keeping for backward compatibility with secrets_manager
@@ -161,7 +207,7 @@ class Config:
         """Get Kalshi base URL"""
         return self.get_env('KALSHI_BASE_URL', 'https://api.elections.kalshi.com/trade-api/v2')
 
-    @property
+    @cached_property
     def polymarket_private_key(self) -> Optional[str]:
         """Get Polymarket Ethereum wallet private key from environment or encrypted storage"""
         if self.secrets_manager:
@@ -169,7 +215,7 @@ class Config:
             return private_key
         return self.get_env('POLYMARKET_PRIVATE_KEY')
 
-    @property
+    @cached_property
     def polymarket_api_key(self) -> Optional[str]:
         """Get Polymarket CLOB API key from environment or encrypted storage"""
         if self.secrets_manager:
@@ -197,7 +243,7 @@ class Config:
         """Get Polymarket CLOB proxy URL"""
         return self.get_env('POLYMARKET_PROXY_URL', 'https://clob.polymarket.com')
 
-    @property
+    @cached_property
     def telegram_bot_token(self) -> Optional[str]:
         """Get Telegram bot token from environment or encrypted storage"""
         if self.secrets_manager:
@@ -205,7 +251,7 @@ class Config:
             return bot_token
         return self.get_env('TELEGRAM_BOT_TOKEN')
 
-    @property
+    @cached_property
     def telegram_chat_id(self) -> Optional[str]:
         """Get Telegram chat ID from environment or encrypted storage"""
         if self.secrets_manager:
@@ -219,12 +265,24 @@ class Config:
         return self.get_env('DATABASE_URL', 'sqlite:///data/arbitrage.db')
 
     def reload(self) -> None:
-        """Reload configuration from file"""
+        """Reload configuration from file (no-op if the file is unchanged)"""
+        # Credentials come from the environment, so refresh them regardless
+        for name in _CREDENTIAL_PROPERTIES:
+            self.__dict__.pop(name, None)
+        if self.secrets_manager:
+            self.secrets_manager.reload_credentials()
+
+        if self.config_path.exists():
+            stat = self.config_path.stat()
+            if (stat.st_mtime_ns, stat.st_size) == self._file_stamp:
+                return
+
         self._load_config()
 
 
-# Global config instance
+# Global config instance, created once under _config_lock
 _config: Optional[Config] = None
+_config_lock = threading.Lock()
 
 
 def get_config(config_path: Optional[str] = None) -> Config:
@@ -239,7 +297,11 @@ def get_config(config_path: Optional[str] = None) -> Config:
     """
     global _config
 
-    if _config is None:
-        _config = Config(config_path)
+    config = _config
+    if config is not None:
+        return config
 
-    return _config
+    with _config_lock:
+        if _config is None:
+            _config = Config(config_path)
+        return _config
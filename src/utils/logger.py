@@ -1,19 +1,100 @@
 """Logging configuration for the arbitrage engine"""
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
-from logging.handlers import RotatingFileHandler
+from typing import Dict, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import colorlog
 
+# Background listeners for queued loggers, stopped (and flushed) at exit
+_listeners: Dict[str, QueueListener] = {}
+
+# Settings each logger was last set up with
+_settings: Dict[str, tuple] = {}
+
+# Handlers shared across loggers: one console handler, one per log file
+_shared_console: Optional[logging.Handler] = None
+_shared_files: Dict[tuple, RotatingFileHandler] = {}
+
+_CONSOLE_FORMATTER = colorlog.ColoredFormatter(
+    '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S',
+    log_colors={
+        'DEBUG': 'cyan',
+        'INFO': 'green',
+        'WARNING': 'yellow',
+        'ERROR': 'red',
+        'CRITICAL': 'red,bg_white',
+    }
+)
+
+_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves message formatting to the listener thread"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The listener runs in this process, so the record can be passed as is
+        return record
+
+
+@atexit.register
+def _stop_listeners() -> None:
+    """Drain and stop all queue listeners"""
+    for listener in _listeners.values():
+        listener.stop()
+    _listeners.clear()
+
+
+def _console_handler() -> logging.Handler:
+    """Get the shared colored stdout handler"""
+    global _shared_console
+
+    if _shared_console is None:
+        _shared_console = colorlog.StreamHandler(sys.stdout)
+        _shared_console.setFormatter(_CONSOLE_FORMATTER)
+    return _shared_console
+
+
+def _file_handler(log_file: str, max_bytes: int, backup_count: int) -> RotatingFileHandler:
+    """
+    Get the shared rotating handler for a log file
+
+    A single handler per file keeps rotation consistent; separate handlers
+    on one file would each rotate it independently.
+
+    Args:
+        log_file: Path to log file
+        max_bytes: Maximum log file size before rotation
+        backup_count: Number of backup files to keep
+
+    Returns:
+        Rotating file handler
+    """
+    key = (str(Path(log_file).resolve()), max_bytes, backup_count)
+    handler = _shared_files.get(key)
+    if handler is None:
+        Path(log_file).parent.mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+        handler.setFormatter(_FILE_FORMATTER)
+        _shared_files[key] = handler
+    return handler
+
 
 def setup_logger(
     name: str = "arbitrage",
     level: str = "INFO",
     log_file: Optional[str] = "logs/arbitrage.log",
     max_bytes: int = 10485760,  # 10MB
-    backup_count: int = 5
+    backup_count: int = 5,
+    queued: bool = False
 ) -> logging.Logger:
     """
     Set up logger with console and file handlers
@@ -24,47 +105,41 @@ def setup_logger(
         log_file: Path to log file
         max_bytes: Maximum log file size before rotation
         backup_count: Number of backup files to keep
+        queued: Format and write records on a background thread, so logging
+            from latency-sensitive code only enqueues the record
 
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
+
+    # Repeat calls with the same settings keep the existing handlers
+    settings = (level.upper(), log_file, max_bytes, backup_count, queued)
+    if _settings.get(name) == settings and logger.handlers:
+        return logger
+    _settings[name] = settings
+
     logger.setLevel(getattr(logging, level.upper()))
 
     # Remove existing handlers
     logger.handlers = []
+    previous = _listeners.pop(name, None)
+    if previous:
+        previous.stop()
 
     # Console handler with colors
-    console_handler = colorlog.StreamHandler(sys.stdout)
-    console_formatter = colorlog.ColoredFormatter(
-        '%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        log_colors={
-            'DEBUG': 'cyan',
-            'INFO': 'green',
-            'WARNING': 'yellow',
-            'ERROR': 'red',
-            'CRITICAL': 'red,bg_white',
-        }
-    )
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-
-    # File handler with rotation
+    logger.addHandler(_console_handler())
+
+    # File handler with rotation, shared by every logger writing to the file
     if log_file:
-        log_path = Path(log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-
-        file_handler = RotatingFileHandler(
-            log_file,
-            maxBytes=max_bytes,
-            backupCount=backup_count
-        )
-        file_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_file_handler(log_file, max_bytes, backup_count))
+
+    if queued:
+        handlers = logger.handlers
+        record_queue = queue.SimpleQueue()
+        listener = QueueListener(record_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners[name] = listener
+        logger.handlers = [_DeferredQueueHandler(record_queue)]
 
     return logger
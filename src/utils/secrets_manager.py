@@ -2,15 +2,42 @@
 
 import os
 import base64
-from typing import Optional
+import hashlib
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 from pathlib import Path
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
 from src.utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
 logger = setup_logger("secrets")
 
+# Bound once; load_dotenv() updates this same mapping in place
+_ENV = os.environ
+
+# Use fixed salt (in production, store this separately)
+_SALT = b"orion_arbitrage_salt_v1"
+
+# Derived ciphers keyed by (password digest, salt); the KDF is deliberately slow
+_cipher_cache: Dict[Tuple[bytes, bytes], "Fernet"] = {}
+
+# Credential pairs per service: (plain env var, encrypted env var, log label)
+_CRED_SPECS: Dict[str, Tuple[Tuple[str, str, str], ...]] = {
+    'kalshi': (
+        ("KALSHI_API_KEY", "KALSHI_API_KEY_ENCRYPTED", "Kalshi API key"),
+        ("KALSHI_API_SECRET", "KALSHI_API_SECRET_ENCRYPTED", "Kalshi API secret"),
+    ),
+    'polymarket': (
+        ("POLYMARKET_PRIVATE_KEY", "POLYMARKET_PRIVATE_KEY_ENCRYPTED",
+         "Polymarket private key"),
+        ("POLYMARKET_API_KEY", "POLYMARKET_API_KEY_ENCRYPTED", "Polymarket API key"),
+    ),
+    'telegram': (
+        ("TELEGRAM_BOT_TOKEN", "TELEGRAM_BOT_TOKEN_ENCRYPTED", "Telegram token"),
+        ("TELEGRAM_CHAT_ID", "TELEGRAM_CHAT_ID_ENCRYPTED", "Telegram chat ID"),
+    ),
+}
+
 
 class SecretsManager:
     """Manages encrypted storage and retrieval of secrets"""
@@ -23,7 +50,7 @@ class SecretsManager:
             master_password: Master password for encryption (from env or prompt)
         """
         self.secrets_file = Path("data/secrets.encrypted")
-        self.master_password = master_password or os.getenv("MASTER_PASSWORD")
+        self.master_password = master_password or _ENV.get("MASTER_PASSWORD")
 
         if not self.master_password:
             raise ValueError(
@@ -32,18 +59,39 @@ class SecretsManager:
 
         self.cipher = self._create_cipher(self.master_password)
 
-    def _create_cipher(self, password: str) -> Fernet:
+        # Decrypted values by ciphertext, and credential pairs by service;
+        # both cleared by reload_credentials()
+        self._decrypt_cache: Dict[str, str] = {}
+        self._credentials: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+
+    def reload_credentials(self) -> None:
+        """Forget cached credentials so the next lookup rereads the environment"""
+        self._decrypt_cache.clear()
+        self._credentials.clear()
+
+    def _create_cipher(self, password: str) -> "Fernet":
         """
         Create Fernet cipher from password using PBKDF2
 
+        The derivation is cached per process, so only the first manager
+        created for a password pays for the key stretching.
+
         Args:
             password: Master password
 
         Returns:
             Fernet cipher instance
         """
-        # Use fixed salt (in production, store this separately)
-        salt = b"orion_arbitrage_salt_v1"
+        salt = _SALT
+        cache_key = (hashlib.sha256(password.encode()).digest(), salt)
+        cipher = _cipher_cache.get(cache_key)
+        if cipher is not None:
+            return cipher
+
+        # Imported here so the OpenSSL bindings load only when secrets are used
+        from cryptography.fernet import Fernet
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2
 
         kdf = PBKDF2(
             algorithm=hashes.SHA256(),
@@ -53,7 +101,8 @@ class SecretsManager:
         )
 
         key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
-        return Fernet(key)
+        cipher = _cipher_cache[cache_key] = Fernet(key)
+        return cipher
 
     def encrypt_secret(self, secret: str) -> str:
         """
@@ -78,42 +127,59 @@ class SecretsManager:
         Returns:
             Decrypted plain text secret
         """
+        cached = self._decrypt_cache.get(encrypted_secret)
+        if cached is not None:
+            return cached
+
         try:
             encrypted = base64.urlsafe_b64decode(encrypted_secret.encode())
-            decrypted = self.cipher.decrypt(encrypted)
-            return decrypted.decode()
+            decrypted = self.cipher.decrypt(encrypted).decode()
+            self._decrypt_cache[encrypted_secret] = decrypted
+            return decrypted
         except Exception as e:
             logger.error(f"Failed to decrypt secret: {e}")
             raise ValueError("Failed to decrypt secret - check MASTER_PASSWORD")
 
-    def get_kalshi_credentials(self) -> tuple[Optional[str], Optional[str]]:
+    def _resolve(self, service: str) -> Tuple[Optional[str], Optional[str]]:
         """
-        Get Kalshi API credentials (tries encrypted first, falls back to env)
+        Resolve a credential pair, preferring encrypted values over plain ones
+
+        Args:
+            service: Key into _CRED_SPECS
 
         Returns:
-            Tuple of (api_key, api_secret)
+            Tuple of the two credential values (None when unset)
         """
-        # Try environment variables first (for development)
-        api_key = os.getenv("KALSHI_API_KEY")
-        api_secret = os.getenv("KALSHI_API_SECRET")
+        cached = self._credentials.get(service)
+        if cached is not None:
+            return cached
+
+        values = []
+        for plain_var, encrypted_var, label in _CRED_SPECS[service]:
+            # Environment variable first (for development)
+            value = _ENV.get(plain_var)
+
+            # If an encrypted value exists, use that instead
+            encrypted = _ENV.get(encrypted_var)
+            if encrypted:
+                try:
+                    value = self.decrypt_secret(encrypted)
+                except Exception as e:
+                    logger.warning(f"Failed to decrypt {label}: {e}")
 
-        # If encrypted credentials exist, use those instead
-        encrypted_key = os.getenv("KALSHI_API_KEY_ENCRYPTED")
-        encrypted_secret = os.getenv("KALSHI_API_SECRET_ENCRYPTED")
+            values.append(value)
 
-        if encrypted_key:
-            try:
-                api_key = self.decrypt_secret(encrypted_key)
-            except Exception as e:
-                logger.warning(f"Failed to decrypt Kalshi API key: {e}")
+        resolved = self._credentials[service] = (values[0], values[1])
+        return resolved
 
-        if encrypted_secret:
-            try:
-                api_secret = self.decrypt_secret(encrypted_secret)
-            except Exception as e:
-                logger.warning(f"Failed to decrypt Kalshi API secret: {e}")
+    def get_kalshi_credentials(self) -> tuple[Optional[str], Optional[str]]:
+        """
+        Get Kalshi API credentials (tries encrypted first, falls back to env)
 
-        return api_key, api_secret
+        Returns:
+            Tuple of (api_key, api_secret)
+        """
+        return self._resolve('kalshi')
 
     def get_polymarket_credentials(self) -> tuple[Optional[str], Optional[str]]:
         """
@@ -122,26 +188,7 @@ class SecretsManager:
         Returns:
             Tuple of (private_key, api_key)
         """
-        private_key = os.getenv("POLYMARKET_PRIVATE_KEY")
-        api_key = os.getenv("POLYMARKET_API_KEY")
-
-        # Try encrypted versions
-        encrypted_pk = os.getenv("POLYMARKET_PRIVATE_KEY_ENCRYPTED")
-        encrypted_api = os.getenv("POLYMARKET_API_KEY_ENCRYPTED")
-
-        if encrypted_pk:
-            try:
-                private_key = self.decrypt_secret(encrypted_pk)
-            except Exception as e:
-                logger.warning(f"Failed to decrypt Polymarket private key: {e}")
-
-        if encrypted_api:
-            try:
-                api_key = self.decrypt_secret(encrypted_api)
-            except Exception as e:
-                logger.warning(f"Failed to decrypt Polymarket API key: {e}")
-
-        return private_key, api_key
+        return self._resolve('polymarket')
 
     def get_telegram_credentials(self) -> tuple[Optional[str], Optional[str]]:
         """
@@ -150,25 +197,7 @@ class SecretsManager:
         Returns:
             Tuple of (bot_token, chat_id)
         """
-        bot_token = os.getenv("TELEGRAM_BOT_TOKEN")
-        chat_id = os.getenv("TELEGRAM_CHAT_ID")
-
-        encrypted_token = os.getenv("TELEGRAM_BOT_TOKEN_ENCRYPTED")
-        encrypted_chat = os.getenv("TELEGRAM_CHAT_ID_ENCRYPTED")
-
-        if encrypted_token:
-            try:
-                bot_token = self.decrypt_secret(encrypted_token)
-            except Exception as e:
-                logger.warning(f"Failed to decrypt Telegram token: {e}")
-
-        if encrypted_chat:
-            try:
-                chat_id = self.decrypt_secret(encrypted_chat)
-            except Exception as e:
-                logger.warning(f"Failed to decrypt Telegram chat ID: {e}")
-
-        return bot_token, chat_id
+        return self._resolve('telegram')
 
 
 def encrypt_credentials_cli():
@@ -4,6 +4,16 @@ import re
 from typing import Any, Optional
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
+
+# Identifiers: alphanumeric, hyphens and underscores (\Z, unlike $, rejects a trailing newline)
+_TICKER_RE = re.compile(r'^[A-Za-z0-9_-]+\Z')
+_MARKET_ID_RE = _TICKER_RE
+
+# Characters stripped by sanitize_string, applied in a single translate pass
+_NULL_TRANS = str.maketrans('', '', '\x00')
+_DANGEROUS_TRANS = str.maketrans('', '', '\x00<>&;|`$\n\r')
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -31,7 +41,7 @@ def validate_ticker(ticker: str, max_length: int = 50) -> str:
         raise ValidationError(f"Ticker exceeds maximum length of {max_length}")
 
     # Allow only alphanumeric, hyphens, and underscores
-    if not re.match(r'^[A-Za-z0-9_-]+$', ticker):
+    if not _TICKER_RE.match(ticker):
         raise ValidationError("Ticker contains invalid characters")
 
     return ticker.upper()
@@ -52,6 +62,10 @@ def validate_price(price: float, min_price: float = 0.01, max_price: float = 0.9
     Raises:
         ValidationError: If price is invalid
     """
+    # Fast path: a float already inside both ranges (NaN never is)
+    if type(price) is float and 0.0 <= price <= 1.0 and min_price <= price <= max_price:
+        return price
+
     if not isinstance(price, (int, float, Decimal)):
         raise ValidationError(f"Price must be numeric, got {type(price)}")
 
@@ -67,7 +81,7 @@ def validate_price(price: float, min_price: float = 0.01, max_price: float = 0.9
         raise ValidationError(f"Price {price} above maximum {max_price}")
 
     # Check for NaN or Infinity
-    if not (price == price):  # NaN check
+    if price != price:  # NaN check
         raise ValidationError("Price is NaN")
 
     if price == float('inf') or price == float('-inf'):
@@ -125,6 +139,109 @@ def validate_quantity(quantity: int, min_qty: int = 1, max_qty: int = 100000) ->
     return quantity
 
 
+def _first_invalid(values: np.ndarray, valid: np.ndarray) -> str:
+    """Describe the first element failing a vectorized check, for error messages"""
+    index = int(np.flatnonzero(~valid)[0])
+    return f"{values[index]} at index {index}"
+
+
+def validate_prices(
+    prices: np.ndarray, min_price: float = 0.01, max_price: float = 0.99
+) -> np.ndarray:
+    """
+    Validate an array of prices in one pass (vectorized validate_price)
+
+    Args:
+        prices: Prices to validate (0.00 to 1.00), any array-like
+        min_price: Minimum allowed price
+        max_price: Maximum allowed price
+
+    Returns:
+        Validated prices as a float64 array
+
+    Raises:
+        ValidationError: If any price is invalid
+    """
+    try:
+        prices = np.asarray(prices, dtype=np.float64)
+    except (TypeError, ValueError):
+        raise ValidationError("Prices must be numeric")
+
+    valid = np.isfinite(prices)
+    if not valid.all():
+        raise ValidationError(f"Price is NaN or infinite: {_first_invalid(prices, valid)}")
+
+    valid = (prices >= 0.0) & (prices <= 1.0)
+    if not valid.all():
+        raise ValidationError(
+            f"Price {_first_invalid(prices, valid)} outside valid range [0.0, 1.0]"
+        )
+
+    valid = (prices >= min_price) & (prices <= max_price)
+    if not valid.all():
+        raise ValidationError(
+            f"Price {_first_invalid(prices, valid)} outside range [{min_price}, {max_price}]"
+        )
+
+    return prices
+
+
+def validate_kalshi_prices_cents(prices_cents: np.ndarray) -> np.ndarray:
+    """
+    Validate an array of Kalshi prices in cents (vectorized validate_kalshi_price_cents)
+
+    Args:
+        prices_cents: Prices in cents (1-99), any integer array-like
+
+    Returns:
+        Validated prices as an integer array
+
+    Raises:
+        ValidationError: If any price is invalid
+    """
+    prices_cents = np.asarray(prices_cents)
+    if prices_cents.size and prices_cents.dtype.kind not in 'iu':
+        raise ValidationError(f"Kalshi prices must be integers, got {prices_cents.dtype}")
+
+    valid = (prices_cents >= 1) & (prices_cents <= 99)
+    if not valid.all():
+        raise ValidationError(
+            f"Kalshi price {_first_invalid(prices_cents, valid)} outside valid range [1, 99]"
+        )
+
+    return prices_cents
+
+
+def validate_quantities(
+    quantities: np.ndarray, min_qty: int = 1, max_qty: int = 100000
+) -> np.ndarray:
+    """
+    Validate an array of order quantities (vectorized validate_quantity)
+
+    Args:
+        quantities: Numbers of contracts, any integer array-like
+        min_qty: Minimum allowed quantity
+        max_qty: Maximum allowed quantity
+
+    Returns:
+        Validated quantities as an integer array
+
+    Raises:
+        ValidationError: If any quantity is invalid
+    """
+    quantities = np.asarray(quantities)
+    if quantities.size and quantities.dtype.kind not in 'iu':
+        raise ValidationError(f"Quantities must be integers, got {quantities.dtype}")
+
+    valid = (quantities >= min_qty) & (quantities <= max_qty)
+    if not valid.all():
+        raise ValidationError(
+            f"Quantity {_first_invalid(quantities, valid)} outside range [{min_qty}, {max_qty}]"
+        )
+
+    return quantities
+
+
 def validate_size_usd(size: float, min_size: float = 10.0, max_size: float = 1000000.0) -> float:
     """
     Validate trade size in USD
@@ -140,6 +257,10 @@ def validate_size_usd(size: float, min_size: float = 10.0, max_size: float = 100
     Raises:
         ValidationError: If size is invalid
     """
+    # Fast path: a non-negative float already inside the range
+    if type(size) is float and min_size <= size <= max_size and size >= 0:
+        return size
+
     if not isinstance(size, (int, float, Decimal)):
         raise ValidationError(f"Size must be numeric, got {type(size)}")
 
@@ -232,14 +353,8 @@ def sanitize_string(value: str, max_length: int = 1000, allow_special: bool = Fa
     if len(value) > max_length:
         raise ValidationError(f"String exceeds maximum length of {max_length}")
 
-    # Remove null bytes
-    value = value.replace('\x00', '')
-
-    if not allow_special:
-        # Remove potentially dangerous characters
-        dangerous_chars = ['<', '>', '&', ';', '|', '`', '$', '\n', '\r']
-        for char in dangerous_chars:
-            value = value.replace(char, '')
+    # Remove null bytes, and potentially dangerous characters unless allowed
+    value = value.translate(_NULL_TRANS if allow_special else _DANGEROUS_TRANS)
 
     return value.strip()
 
@@ -265,7 +380,7 @@ def validate_market_id(market_id: str, exchange: str = None) -> str:
         raise ValidationError("Market ID exceeds maximum length")
 
     # Basic sanitization - allow alphanumeric, hyphens, underscores
-    if not re.match(r'^[A-Za-z0-9_-]+$', market_id):
+    if not _MARKET_ID_RE.match(market_id):
         raise ValidationError("Market ID contains invalid characters")
 
     return market_id
@@ -286,6 +401,10 @@ def validate_percentage(value: float, min_pct: float = 0.0, max_pct: float = 1.0
     Raises:
         ValidationError: If percentage is invalid
     """
+    # Fast path: a float already inside the range
+    if type(value) is float and min_pct <= value <= max_pct:
+        return value
+
     if not isinstance(value, (int, float, Decimal)):
         raise ValidationError(f"Percentage must be numeric, got {type(value)}")
 
@@ -0,0 +1,85 @@
+"""Tests for circuit breaker"""
+
+import numpy as np
+import pytest
+from src.execution.circuit_breaker import CircuitBreaker, TradingHaltException
+from src.execution.state_store import StateStore
+
+
+def test_check_series_first_trigger():
+    """Test vectorized replay finds the first breach and resets daily"""
+    breaker = CircuitBreaker(max_daily_loss_pct=0.05, max_drawdown_pct=0.15)
+    day = 86400 - breaker._utc_offset
+    ts = np.array([day, day + 60, day + 86400, day + 86460, day + 86520], dtype=float)
+
+    # 4% loss on day one, then a new baseline; 6% below it trips on the last bar
+    balances = np.array([100.0, 96.0, 96.0, 93.0, 90.0])
+    assert breaker.check_series(balances, ts) == 4
+
+    # The same path within a single day trips at the first bar below 95
+    assert breaker.check_series(balances, np.full(5, day)) == 3
+
+    assert breaker.check_series(np.array([100.0, 99.0, 101.0]), ts[:3]) == -1
+    assert breaker.check_series(np.array([]), np.array([])) == -1
+
+
+class MemoryStateStore(StateStore):
+    """In-process stand-in for a shared store"""
+
+    def __init__(self):
+        self.state = {'circuit_open': False, 'halt_reason': None, 'peak_balance': None}
+
+    def set_halt(self, reason):
+        self.state['halt_reason'] = self.state['halt_reason'] or reason
+        self.state['circuit_open'] = True
+
+    def clear_halt(self):
+        self.state.update(circuit_open=False, halt_reason=None)
+
+    def sync(self, peak_balance):
+        if peak_balance is not None:
+            current = self.state['peak_balance']
+            self.state['peak_balance'] = max(current or peak_balance, peak_balance)
+        return dict(self.state)
+
+
+def test_shared_state_halts_other_breakers():
+    """Test a trip in one breaker halts another sharing the store"""
+    store = MemoryStateStore()
+    first = CircuitBreaker(state_store=store)
+    second = CircuitBreaker(state_store=store)
+
+    first.check_breaker(100.0)
+    second.check_breaker(100.0)
+    with pytest.raises(TradingHaltException):
+        first.check_breaker(90.0)
+
+    second.apply_shared_state(store.sync(second.peak_balance))
+    assert not second.is_trading_allowed()
+    with pytest.raises(TradingHaltException):
+        second.check_breaker(100.0)
+
+    first.manual_reset()
+    assert store.state['circuit_open'] is False
+
+
+def test_shared_peak_rechecks_unchanged_balance():
+    """Test a higher shared peak trips the next check at the same balance"""
+    breaker = CircuitBreaker(max_drawdown_pct=0.15)
+    breaker.check_breaker(100.0)
+
+    breaker.apply_shared_state({'peak_balance': 200.0})
+    with pytest.raises(TradingHaltException):
+        breaker.check_breaker(100.0)
+
+
+def test_manual_reset_rechecks_limits():
+    """Test a reset breaker trips again if the balance is still past a limit"""
+    breaker = CircuitBreaker(max_daily_loss_pct=0.05)
+    breaker.check_breaker(100.0)
+    with pytest.raises(TradingHaltException):
+        breaker.check_breaker(90.0)
+
+    breaker.manual_reset()
+    with pytest.raises(TradingHaltException):
+        breaker.check_breaker(90.0)
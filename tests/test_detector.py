@@ -1,6 +1,8 @@
 """Tests for arbitrage detector"""
 
+import numpy as np
 import pytest
+from datetime import datetime, timedelta
 from src.arbitrage.detector import ArbitrageDetector
 
 
@@ -109,3 +111,56 @@ def test_detect_valid_opportunity(detector):
     assert opportunity is not None
     assert opportunity.spread == 0.98
     assert opportunity.position_size_usd > 0
+
+
+def test_scan_opportunities_filters_arrays(detector):
+    """Test scanning skips unpriced, thin and illiquid pairs"""
+    end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+
+    def market(market_id, liquidity=100000):
+        return {
+            'market_id': market_id,
+            'question': 'Test question',
+            'end_date': end_date,
+            'liquidity': liquidity
+        }
+
+    matched = [
+        (market('K-GOOD'), market('P-GOOD'), 0.95),
+        (market('K-NOPRICE'), market('P-NOPRICE'), 0.95),
+        (market('K-THIN'), market('P-THIN'), 0.95),
+        (market('K-ILLIQUID', liquidity=100), market('P-ILLIQUID'), 0.95),
+    ]
+    kalshi_prices = np.array([0.40, np.nan, 0.495, 0.40])
+    poly_prices = np.array([0.50, 0.50, 0.500, 0.50])
+
+    opportunities = detector.scan_opportunities(matched, kalshi_prices, poly_prices, 100000)
+
+    assert [opp.kalshi_market_id for opp in opportunities] == ['K-GOOD']
+    assert opportunities[0].days_to_resolution is not None
+    assert opportunities[0].kalshi_limit_cents == 40
+    assert opportunities[0].polymarket_limit_price == pytest.approx(0.501)
+
+
+def test_scan_skips_full_assessment_for_high_risk_pairs(detector, monkeypatch):
+    """Test pairs the batch risk pass rates too risky never reach detect_opportunity"""
+    end_date = (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+    good = {'market_id': 'K-GOOD', 'question': 'Test question', 'end_date': end_date,
+            'liquidity': 100000}
+    risky = {**good, 'market_id': 'K-RISKY', 'question': 'Who wins the primary runoff'}
+
+    detected = []
+    detect = detector.detect_opportunity
+
+    def recording_detect(kalshi_market, *args):
+        detected.append(kalshi_market['market_id'])
+        return detect(kalshi_market, *args)
+
+    monkeypatch.setattr(detector, 'detect_opportunity', recording_detect)
+
+    matched = [(good, dict(good), 0.95), (risky, dict(good), 0.5)]
+    prices = np.array([0.40, 0.40])
+    opportunities = detector.scan_opportunities(matched, prices, prices + 0.1, 100000)
+
+    assert detected == ['K-GOOD']
+    assert [opp.kalshi_market_id for opp in opportunities] == ['K-GOOD']
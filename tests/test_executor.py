@@ -0,0 +1,120 @@
+"""Tests for trade executor"""
+
+import asyncio
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("cryptography")
+pytest.importorskip("py_clob_client")
+
+from types import SimpleNamespace
+from src.api.kalshi_client import KalshiRequestError
+from src.execution.executor import ExecutionResult, OrderAck, make_executor
+
+
+class FillStatusClient:
+    """Exchange stand-in reporting a fixed order status and recording cancels"""
+
+    def __init__(self, status):
+        self.status = status
+        self.cancelled = []
+
+    async def get_order_status(self, order_id):
+        return {'status': self.status}
+
+    async def cancel_order(self, order_id):
+        self.cancelled.append(order_id)
+        return True
+
+
+class ScriptedKalshi:
+    """Kalshi client stand-in that answers submissions from a script"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.submitted = []
+        self.live_orders = {}
+
+    async def submit_order(self, **order):
+        self.submitted.append(order['client_order_id'])
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async def get_order_by_client_id(self, ticker, client_order_id):
+        order = self.live_orders.get(client_order_id)
+        return {'order': order} if order else None
+
+
+def _executor(kalshi, polymarket=None, **kwargs):
+    config = {'trading': {
+        'order_batching': False, 'order_retry_backoff_sec': 0, 'fill_timeout_sec': 0
+    }}
+    return make_executor(kalshi, polymarket, config, dry_run=False, **kwargs)
+
+
+OPPORTUNITY = SimpleNamespace(kalshi_market_id='TEST-MKT', kalshi_contracts=3)
+
+
+async def test_kalshi_timeout_then_duplicate_recovers_order():
+    """Test a timed-out submit that landed is looked up, not reported failed"""
+    kalshi = ScriptedKalshi(
+        KalshiRequestError("Timeout on POST /portfolio/orders", retryable=True),
+        KalshiRequestError("API request failed: 409", status=409),
+    )
+    kalshi.live_orders['arb_1_k'] = {'order_id': 'k-123', 'client_order_id': 'arb_1_k'}
+
+    ack = await _executor(kalshi)._execute_kalshi_leg(OPPORTUNITY, 'arb_1', 40)
+
+    assert ack is not None and ack.order_id == 'k-123'
+    assert kalshi.submitted == ['arb_1_k', 'arb_1_k']
+
+
+async def test_kalshi_rejection_is_not_retried():
+    """Test a deterministic rejection fails the leg without a retry"""
+    kalshi = ScriptedKalshi(KalshiRequestError("API request failed: 400", status=400))
+
+    assert await _executor(kalshi)._execute_kalshi_leg(OPPORTUNITY, 'arb_2', 40) is None
+    assert kalshi.submitted == ['arb_2_k']
+
+
+async def test_stopped_dispatcher_fails_queued_orders():
+    """Test orders waiting on a cancelled batch dispatcher fail instead of hanging"""
+    config = {'trading': {'order_batch_window_ms': 1000}}
+    executor = make_executor(ScriptedKalshi(), None, config, dry_run=False)
+    orders = [
+        asyncio.create_task(executor._place_kalshi_order(client_order_id=f"arb_{n}_k"))
+        for n in (4, 5)
+    ]
+    await asyncio.sleep(0.01)  # Both queued, dispatcher waiting out the window
+
+    executor._kalshi_dispatcher.cancel()
+
+    for order in orders:
+        with pytest.raises(KalshiRequestError, match="dispatcher stopped"):
+            await order
+
+
+async def test_fill_timeout_cancels_unfilled_leg_and_unwinds_filled_leg():
+    """Test a one-sided fill at the timeout is cancelled, unwound and reported"""
+    kalshi = FillStatusClient('resting')
+    polymarket = FillStatusClient('matched')
+    reconciled = []
+    executor = _executor(kalshi, polymarket, on_reconciled=reconciled.append)
+    unwinds = []
+    executor._queue_unwind = lambda venue, order: unwinds.append((venue, order))
+
+    result = ExecutionResult(
+        success=True, position_id='arb_3', kalshi_order_id='k-1', polymarket_order_id='p-1'
+    )
+    poly_order = {'token_id': 'no-token', 'size': 5.0}
+    await executor._reconcile(
+        result, OrderAck('k-1', {'ticker': 'TEST-MKT'}), OrderAck('p-1', poly_order)
+    )
+
+    assert kalshi.cancelled == ['k-1'] and polymarket.cancelled == []
+    assert unwinds == [('polymarket', poly_order)]
+    assert result.polymarket_filled and not result.kalshi_filled
+    assert result.partial_fill_pending and not result.fully_filled
+    assert reconciled == [result]
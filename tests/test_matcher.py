@@ -98,3 +98,36 @@ def test_market_not_matching(matcher):
 
     assert is_match is False
     assert score < 0.85
+
+
+def test_find_matches_agrees_with_is_match(matcher):
+    """Test indexed matching returns the same pairs as checking every pair"""
+    kalshi = [
+        {'market_id': 'K1', 'question': 'Will Bitcoin reach $100,000 by end of 2024?',
+         'end_date': '2024-12-31'},
+        {'market_id': 'K2', 'question': 'Will the Fed cut rates in March 2024?',
+         'end_date': '2024-03-20'},
+        {'market_id': 'K3', 'question': 'Will it snow in Miami?', 'end_date': None},
+    ]
+    poly = [
+        {'market_id': 'P1', 'question': 'Will Ethereum reach $10,000 by end of 2024?',
+         'end_date': '2024-12-31'},
+        {'market_id': 'P2', 'question': 'Will Bitcoin reach $100k by the end of 2024?',
+         'end_date': '2024-12-31'},
+        {'market_id': 'P3', 'question': 'Will the Fed cut rates in March 2024?',
+         'end_date': '2024-06-20'},
+        {'market_id': 'P4', 'question': ''},
+    ]
+
+    expected = []
+    for km in kalshi:
+        scored = [(pm, matcher.is_match(km, pm)) for pm in poly]
+        hits = [(pm, score) for pm, (ok, score) in scored if ok]
+        if hits:
+            pm, score = max(hits, key=lambda hit: hit[1])
+            expected.append((km['market_id'], pm['market_id'], score))
+
+    matches = matcher.find_matches(kalshi, poly)
+
+    assert [(km['market_id'], pm['market_id'], score) for km, pm, score in matches] == expected
+    assert [m[:2] for m in expected] == [('K1', 'P2')]
@@ -0,0 +1,100 @@
+"""Tests for risk analyzer"""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+from src.arbitrage.risk_analyzer import RiskAnalyzer, RiskLevel
+
+
+@pytest.fixture
+def analyzer():
+    """Create risk analyzer instance"""
+    config = {
+        'capital': {
+            'max_days_to_resolution': 30,
+            'high_return_threshold': 0.05
+        }
+    }
+    return RiskAnalyzer(config)
+
+
+def _end_date(days: int) -> str:
+    return (datetime.now() + timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+def test_low_risk_opportunity(analyzer):
+    """Test a clean, fast-resolving pair is low risk"""
+    market = {
+        'question': 'Will Bitcoin reach $100k?',
+        'end_date': _end_date(7),
+        'liquidity': 100000
+    }
+
+    assessment = analyzer.analyze_opportunity(market, dict(market), 0.95, 0.02, 500)
+
+    assert assessment.overall_risk == RiskLevel.LOW
+    assert assessment.should_execute()
+
+
+def test_keyword_mismatch_raises_risk(analyzer):
+    """Test a primary vs general wording mismatch is flagged"""
+    kalshi = {'question': 'Will Smith win the primary?', 'end_date': _end_date(7)}
+    poly = {'question': 'Will Smith win the general election?', 'end_date': _end_date(7)}
+
+    assessment = analyzer.analyze_opportunity(kalshi, poly, 0.95, 0.02, 500)
+
+    assert any('primary' in f['description'] for f in assessment.risk_factors)
+    assert not assessment.should_execute()
+
+
+def test_analyze_batch_matches_single(analyzer):
+    """Test batch scores agree with analyze_opportunity"""
+    pairs = [
+        (
+            {'question': 'Will Bitcoin reach $100k?', 'end_date': _end_date(7),
+             'liquidity': 100000},
+            {'question': 'Will Bitcoin reach $100k?', 'end_date': _end_date(7),
+             'liquidity': 100000}
+        ),
+        (
+            {'question': 'Will Smith win the primary?', 'end_date': _end_date(20),
+             'description': 'primary race', 'liquidity': 1000},
+            {'question': 'Will Smith win the election?', 'end_date': _end_date(21),
+             'description': 'general election', 'liquidity': 0}
+        ),
+        (
+            {'question': 'Will it rain before Friday?', 'liquidity': 5000},
+            {'question': 'Will it rain by Friday?', 'liquidity': 5000}
+        ),
+    ]
+    similarities = np.array([0.95, 0.80, 0.92])
+    edges = np.array([0.02, 0.004, 0.008])
+    sizes = np.array([500.0, 500.0, 600.0])
+
+    scores = analyzer.analyze_batch(pairs, similarities, edges, sizes)
+
+    expected = [
+        analyzer.analyze_opportunity(km, pm, sim, edge, size).score
+        for (km, pm), sim, edge, size in zip(pairs, similarities, edges, sizes)
+    ]
+    assert scores.shape == (3,)
+    assert scores == pytest.approx(expected)
+
+
+def test_factors_reported_in_rule_order(analyzer):
+    """Test factors follow the rule order: event, timing, liquidity, edge, regulatory"""
+    kalshi = {
+        'question': 'Will Smith win the primary?',
+        'end_date': _end_date(7),
+        'liquidity': 1000
+    }
+    poly = {'question': 'Will Smith win?', 'end_date': _end_date(8), 'liquidity': 100000}
+
+    assessment = analyzer.analyze_opportunity(kalshi, poly, 0.80, 0.004, 500)
+
+    types = [f['type'] for f in assessment.risk_factors]
+    assert types[:6] == [
+        'event_definition', 'event_definition', 'timing', 'liquidity', 'edge', 'regulatory'
+    ]
+    assert 'Keyword mismatch' in assessment.risk_factors[0]['description']
+    assert 'similarity' in assessment.risk_factors[1]['description']
@@ -0,0 +1,50 @@
+"""Tests for input validation"""
+
+import numpy as np
+import pytest
+from src.utils.validation import (
+    ValidationError,
+    validate_kalshi_prices_cents,
+    validate_prices,
+    validate_quantities,
+)
+
+
+def test_validate_prices():
+    """Test vectorized price validation"""
+    prices = validate_prices([0.25, 0.5, 0.75])
+    assert prices.dtype == np.float64
+    assert prices.tolist() == [0.25, 0.5, 0.75]
+
+    with pytest.raises(ValidationError, match="NaN or infinite: nan at index 1"):
+        validate_prices([0.5, np.nan])
+    with pytest.raises(ValidationError, match="NaN or infinite: inf at index 0"):
+        validate_prices([np.inf, 0.5])
+    with pytest.raises(ValidationError, match=r"1.5 at index 2 outside valid range"):
+        validate_prices([0.5, 0.6, 1.5])
+    with pytest.raises(ValidationError, match=r"0.995 at index 1 outside range"):
+        validate_prices([0.5, 0.995])
+    with pytest.raises(ValidationError, match="must be numeric"):
+        validate_prices(['abc'])
+
+    assert validate_prices([]).size == 0
+
+
+def test_validate_integer_arrays():
+    """Test vectorized Kalshi cents and quantity validation"""
+    assert validate_kalshi_prices_cents([1, 50, 99]).tolist() == [1, 50, 99]
+    assert validate_quantities(np.array([1, 10], dtype=np.int32)).tolist() == [1, 10]
+
+    with pytest.raises(ValidationError, match="100 at index 1 outside valid range"):
+        validate_kalshi_prices_cents([50, 100])
+    with pytest.raises(ValidationError, match="0 at index 0 outside range"):
+        validate_quantities([0, 5])
+
+    # Only integer dtypes are accepted; float and bool arrays are rejected
+    with pytest.raises(ValidationError, match="must be integers, got float64"):
+        validate_kalshi_prices_cents([50.0])
+    with pytest.raises(ValidationError, match="must be integers, got bool"):
+        validate_quantities([True, False])
+
+    assert validate_kalshi_prices_cents([]).size == 0
+    assert validate_quantities([]).size == 0